@@ -0,0 +1,212 @@
+"""Parser and tool benchmarks over the product fixtures in examples/.
+
+Run from the repository root:
+    python benchmarks/bench.py                      # compare against benchmarks/baseline.json
+    python benchmarks/bench.py --output out.json    # also write the results
+    python benchmarks/bench.py --update-baseline    # record this machine's numbers
+
+Exits non-zero when any metric is worse than the baseline by more than --threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "src"), str(ROOT / "tests")]
+
+from conftest import ExamplesClient  # noqa: E402
+
+from mcp_bom_weather.adapters.bom_adapter import (  # noqa: E402
+    parse_current_from_xml,
+    parse_forecast_from_xml,
+    parse_warnings_from_xml,
+)
+from mcp_bom_weather.config import CITY_PRODUCT_IDS  # noqa: E402
+from mcp_bom_weather.tools.weather_tools import TOOLS, record_history  # noqa: E402
+from mcp_bom_weather.util.history import HistoryStore  # noqa: E402
+
+EXAMPLES = ROOT / "examples"
+BASELINE = Path(__file__).with_name("baseline.json")
+FORECAST_PRODUCT = "IDN11050"
+MB = 1024 * 1024
+
+# Arguments for each tool; every TOOLS entry must have one (checked in run())
+TOOL_ARGS: dict[str, tuple[tuple, dict]] = {
+    "current_weather": (("Sydney",), {}),
+    "forecast": (("Sydney",), {"days": 7}),
+    "current_weather_all_major_cities": ((), {}),
+    "observations": ((["Sydney", "Melbourne", "94767", "Perth"],), {}),
+    "nearest_stations": ((-33.86, 151.21), {"k": 5}),
+    "search_stations": (("observatory",), {}),
+    "station_history": (("Sydney",), {"hours": 24}),
+    "station_trend": (("Sydney",), {"hours": 24}),
+    "current_warnings": ((), {}),
+}
+
+# Metric-name suffixes where larger numbers are better; everything else is a cost
+HIGHER_IS_BETTER = (".mb_per_s", ".stations_per_s")
+
+
+def _timeit(fn: Callable[[], object], repeat: int) -> float:
+    # Median of ``repeat`` runs, each long enough (>= ~10ms) to swamp timer overhead
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= 0.01:  # noqa: PLR2004
+            break
+        loops *= 2
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return statistics.median(samples)
+
+
+def _peak_bytes(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _parse_cases() -> dict[str, tuple[Callable[[], object], int, int]]:
+    # name -> (call, input bytes, stations in the input)
+    cases: dict[str, tuple[Callable[[], object], int, int]] = {}
+    for city, product_id in CITY_PRODUCT_IDS.items():
+        text = (EXAMPLES / f"{product_id}.xml").read_text(encoding="utf-8")
+        size, stations = len(text.encode("utf-8")), text.count("<station ")
+        cases[f"parse_current.{product_id}"] = (
+            lambda c=city, t=text: parse_current_from_xml(c, HTTPStatus.OK, t),
+            size,
+            stations,
+        )
+        cases[f"parse_warnings.{product_id}"] = (
+            lambda t=text: parse_warnings_from_xml(HTTPStatus.OK, t),
+            size,
+            stations,
+        )
+    text = (EXAMPLES / f"{FORECAST_PRODUCT}.xml").read_text(encoding="utf-8")
+    cases[f"parse_forecast.{FORECAST_PRODUCT}"] = (
+        lambda: parse_forecast_from_xml("Sydney", HTTPStatus.OK, text),
+        len(text.encode("utf-8")),
+        0,
+    )
+    return cases
+
+
+def _client(history_dir: str) -> ExamplesClient:
+    client = ExamplesClient(EXAMPLES, Counter())
+    store = HistoryStore(history_dir)
+    client.history = store
+    for city in CITY_PRODUCT_IDS:
+        record_history(client.fetch_city_product(city), store, client=client)
+    return client
+
+
+def run(repeat: int = 5) -> dict[str, float]:
+    missing = set(TOOLS) - set(TOOL_ARGS)
+    if missing:
+        raise SystemExit(f"No benchmark arguments for tools: {sorted(missing)}")
+    results: dict[str, float] = {}
+
+    for name, (call, size, stations) in _parse_cases().items():
+        secs = _timeit(call, repeat)
+        results[f"{name}.mb_per_s"] = size / MB / secs
+        if stations:
+            results[f"{name}.stations_per_s"] = stations / secs
+        results[f"{name}.peak_bytes"] = _peak_bytes(call)
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        client = _client(history_dir)
+        for name, tool in TOOLS.items():
+            args, kwargs = TOOL_ARGS[name]
+
+            def call(
+                tool: Callable = tool, args: tuple = args, kwargs: dict = kwargs, **extra: int
+            ) -> object:
+                return tool(*args, client=client, **kwargs, **extra)
+
+            # ExamplesClient hands out a new product version per call, so every call re-indexes
+            results[f"tool.{name}.secs"] = _timeit(call, repeat)
+            client.indexes.clear()
+            # Tools that fan out over threads peak at whatever happens to overlap, which varies
+            # from run to run; their memory is measured one product at a time
+            serial = (
+                {"concurrency": 1} if "concurrency" in inspect.signature(tool).parameters else {}
+            )
+            results[f"tool.{name}.peak_bytes"] = _peak_bytes(partial(call, **serial))
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Human-readable regressions of ``results`` against ``baseline`` beyond ``threshold``."""
+    regressions = []
+    for name, base in sorted(baseline.items()):
+        now = results.get(name)
+        if now is None or base <= 0:
+            continue
+        if name.endswith(HIGHER_IS_BETTER):
+            change = (base - now) / base
+        else:
+            change = (now - base) / base
+        if change > threshold:
+            regressions.append(f"{name}: {base:.6g} -> {now:.6g} ({change:+.0%} worse)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5, help="Timed runs per metric (median)")
+    ap.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    ap.add_argument("--baseline", type=Path, default=BASELINE)
+    ap.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed slowdown, e.g. 0.25 = 25%%"
+    )
+    ap.add_argument(
+        "--update-baseline", action="store_true", help="Overwrite the baseline with this run"
+    )
+    args = ap.parse_args(argv)
+
+    results = run(args.repeat)
+    doc = {"python": platform.python_version(), "machine": platform.machine(), "metrics": results}
+    if args.output:
+        args.output.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.output:
+        print(json.dumps(doc, indent=2, sort_keys=True))
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline", file=sys.stderr)
+        return 0
+    baseline = json.loads(args.baseline.read_text())["metrics"]
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
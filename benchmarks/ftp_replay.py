@@ -0,0 +1,299 @@
+"""A local stand-in for ftp.bom.gov.au that serves a directory (examples/ by default).
+
+Run from the repository root:
+    python benchmarks/ftp_replay.py --port 2121 --latency 0.05 --bandwidth 2e6 \\
+        --fail-rate 0.02 --reissue-every 600
+
+and point the MCP server at it:
+    python -m mcp_bom_weather.fast_mcp_server --ftp-host 127.0.0.1 --ftp-port 2121 ...
+
+Files are listed under --mount (default /anon/gen/fwo). Every command is answered after
+--latency seconds, RETR is throttled to --bandwidth bytes/s, a --fail-rate fraction of
+transfers is cut off half way (the control connection drops, as on a reset), and with
+--reissue-every the files' modification times move forward every N seconds, as if BoM
+had published a new issue.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import posixpath
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MOUNT = "/anon/gen/fwo"
+BLOCK = 8192
+ACCEPT_TIMEOUT_SECS = 10.0
+
+
+@dataclass(frozen=True)
+class Behaviour:
+    latency: float = 0.0  # seconds before each reply
+    bandwidth: float | None = None  # RETR bytes per second; None is unthrottled
+    fail_rate: float = 0.0  # fraction of RETRs dropped half way
+    reissue_every: float | None = None  # seconds between simulated reissues
+    seed: int | None = None
+
+
+def _mdtm(ts: float) -> str:
+    return dt.datetime.fromtimestamp(ts, dt.UTC).strftime("%Y%m%d%H%M%S")
+
+
+class ReplayServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        root: Path = ROOT / "examples",
+        *,
+        mount: str = MOUNT,
+        behaviour: Behaviour = Behaviour(),
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(address, _Session)
+        self.root = root
+        self.mount = mount.rstrip("/")
+        self.behaviour = behaviour
+        self.clock = clock
+        self.started = clock()
+        self.counts: Counter[str] = Counter()
+        self._random = random.Random(behaviour.seed)
+        self._lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> ReplayServer:
+        threading.Thread(target=self.serve_forever, name="ftp-replay", daemon=True).start()
+        return self
+
+    def count(self, what: str) -> None:
+        with self._lock:
+            self.counts[what] += 1
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.behaviour.fail_rate
+
+    def is_dir(self, path: str) -> bool:
+        return path in ("/", self.mount) or self.mount.startswith(path + "/")
+
+    def file(self, path: str) -> Path | None:
+        parent, name = posixpath.split(path)
+        if parent != self.mount:
+            return None
+        file = self.root / name
+        return file if file.is_file() else None
+
+    def files(self) -> list[Path]:
+        return sorted(p for p in self.root.iterdir() if p.is_file())
+
+    def mtime(self, file: Path) -> float:
+        every = self.behaviour.reissue_every
+        if not every:
+            return file.stat().st_mtime
+        # Every file is "reissued" at the same moments: start, start + every, ...
+        return self.started + (self.clock() - self.started) // every * every
+
+
+class _Session(socketserver.StreamRequestHandler):
+    server: ReplayServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.cwd = "/"
+        self.passive: socket.socket | None = None
+
+    def finish(self) -> None:
+        if self.passive is not None:
+            self.passive.close()
+        super().finish()
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(line.encode("utf-8") + b"\r\n")
+
+    def handle(self) -> None:
+        self.reply("220 BoM replay FTP server")
+        for raw in self.rfile:
+            cmd, _, arg = raw.decode("utf-8", "replace").strip().partition(" ")
+            self.server.count(cmd.upper())
+            if self.server.behaviour.latency:
+                time.sleep(self.server.behaviour.latency)
+            handler = getattr(self, "ftp_" + cmd.lower(), None)
+            if handler is None:
+                self.reply(f"502 {cmd} not implemented")
+            elif handler(arg) is False:
+                return
+
+    def _path(self, arg: str) -> str:
+        return posixpath.normpath(posixpath.join(self.cwd, arg or "."))
+
+    def _data(self) -> socket.socket | None:
+        if self.passive is None:
+            self.reply("425 Use PASV or EPSV first")
+            return None
+        listener, self.passive = self.passive, None
+        with listener:
+            listener.settimeout(ACCEPT_TIMEOUT_SECS)
+            conn, _ = listener.accept()
+        return conn
+
+    def _send_lines(self, lines: list[str]) -> None:
+        conn = self._data()
+        if conn is None:
+            return
+        self.reply("150 Here comes the listing")
+        with conn:
+            conn.sendall("".join(line + "\r\n" for line in lines).encode("utf-8"))
+        self.reply("226 Listing sent")
+
+    def ftp_user(self, arg: str) -> None:
+        self.reply("331 Anonymous login ok, send your email as password")
+
+    def ftp_pass(self, arg: str) -> None:
+        self.reply("230 Logged in")
+
+    def ftp_syst(self, arg: str) -> None:
+        self.reply("215 UNIX Type: L8")
+
+    def ftp_feat(self, arg: str) -> None:
+        self.reply("211-Features:\r\n MDTM\r\n SIZE\r\n MLST type*;size*;modify*;\r\n211 End")
+
+    def ftp_opts(self, arg: str) -> None:
+        self.reply(f"200 {arg}")
+
+    def ftp_noop(self, arg: str) -> None:
+        self.reply("200 OK")
+
+    def ftp_type(self, arg: str) -> None:
+        self.reply(f"200 Type set to {arg}")
+
+    def ftp_pwd(self, arg: str) -> None:
+        self.reply(f'257 "{self.cwd}" is the current directory')
+
+    def ftp_cwd(self, arg: str) -> None:
+        path = self._path(arg)
+        if not self.server.is_dir(path):
+            self.reply(f"550 {arg}: No such directory")
+            return
+        self.cwd = path
+        self.reply("250 Directory changed")
+
+    def ftp_mdtm(self, arg: str) -> None:
+        file = self.server.file(self._path(arg))
+        if file is None:
+            self.reply(f"550 {arg}: No such file")
+        else:
+            self.reply(f"213 {_mdtm(self.server.mtime(file))}")
+
+    def ftp_size(self, arg: str) -> None:
+        file = self.server.file(self._path(arg))
+        if file is None:
+            self.reply(f"550 {arg}: No such file")
+        else:
+            self.reply(f"213 {file.stat().st_size}")
+
+    def _listen(self) -> int:
+        if self.passive is not None:
+            self.passive.close()
+        self.passive = socket.create_server((self.request.getsockname()[0], 0))
+        return self.passive.getsockname()[1]
+
+    def ftp_pasv(self, arg: str) -> None:
+        port = self._listen()
+        host = self.request.getsockname()[0].replace(".", ",")
+        self.reply(f"227 Entering Passive Mode ({host},{port >> 8},{port & 0xFF})")
+
+    def ftp_epsv(self, arg: str) -> None:
+        self.reply(f"229 Entering Extended Passive Mode (|||{self._listen()}|)")
+
+    def ftp_retr(self, arg: str) -> bool | None:
+        file = self.server.file(self._path(arg))
+        if file is None:
+            self.reply(f"550 {arg}: No such file")
+            return None
+        conn = self._data()
+        if conn is None:
+            return None
+        data = file.read_bytes()
+        fail = self.server.should_fail()
+        stop = len(data) // 2 if fail else len(data)
+        bandwidth = self.server.behaviour.bandwidth
+        self.reply(f"150 Opening BINARY mode data connection for {arg} ({len(data)} bytes)")
+        with conn:
+            for offset in range(0, stop, BLOCK):
+                block = data[offset : min(offset + BLOCK, stop)]
+                conn.sendall(block)
+                if bandwidth:
+                    time.sleep(len(block) / bandwidth)
+        if fail:
+            self.server.count("failed_transfers")
+            return False  # drop the control connection mid-transfer
+        self.server.count("transfers")
+        self.reply("226 Transfer complete")
+        return None
+
+    def ftp_nlst(self, arg: str) -> None:
+        if not self.server.is_dir(self._path(arg)):
+            self.reply(f"550 {arg}: No such directory")
+            return
+        self._send_lines([p.name for p in self.server.files()])
+
+    def ftp_mlsd(self, arg: str) -> None:
+        if self._path(arg) != self.server.mount:
+            self.reply(f"550 {arg}: No such directory")
+            return
+        self._send_lines(
+            [
+                f"type=file;size={p.stat().st_size};modify={_mdtm(self.server.mtime(p))}; {p.name}"
+                for p in self.server.files()
+            ]
+        )
+
+    def ftp_quit(self, arg: str) -> bool:
+        self.reply("221 Goodbye")
+        return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=2121)
+    ap.add_argument("--root", type=Path, default=ROOT / "examples", help="Directory to serve")
+    ap.add_argument("--mount", default=MOUNT, help="FTP directory the files appear under")
+    ap.add_argument("--latency", type=float, default=0.0, help="Seconds before each reply")
+    ap.add_argument("--bandwidth", type=float, help="RETR bytes per second")
+    ap.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of RETRs dropped")
+    ap.add_argument("--reissue-every", type=float, help="Seconds between simulated reissues")
+    ap.add_argument("--seed", type=int)
+    args = ap.parse_args(argv)
+
+    behaviour = Behaviour(
+        args.latency, args.bandwidth, args.fail_rate, args.reissue_every, args.seed
+    )
+    with ReplayServer(
+        (args.host, args.port), args.root, mount=args.mount, behaviour=behaviour
+    ) as srv:
+        print(f"Serving {args.root} at ftp://{args.host}:{srv.port}{args.mount}", file=sys.stderr)
+        try:
+            srv.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
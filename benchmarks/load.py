@@ -0,0 +1,276 @@
+"""Concurrent MCP sessions against fast_mcp_server, measured end to end.
+
+Run from the repository root:
+    python benchmarks/load.py --transport http --sessions 32 --duration 30
+    python benchmarks/load.py --transport stdio --sessions 4 --requests 40 --latency 0.05
+    python benchmarks/load.py --server-args "--refresh --shared-cache /tmp/bom"
+
+Unless --ftp-host is given, a local stand-in (benchmarks/ftp_replay.py) serves examples/
+and the MCP server is pointed at it, so nothing touches ftp.bom.gov.au. Over stdio every
+session is its own server process (as MCP hosts spawn them); over HTTP all sessions share
+one server. Each session calls every tool in TOOLS in turn. Prints JSON: calls, errors,
+calls/s and p50/p95/p99 latency, overall and per tool, plus the FTP commands served.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import shlex
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import anyio
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from ftp_replay import Behaviour, ReplayServer  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+SERVER = "mcp_bom_weather.fast_mcp_server"
+STARTUP_TIMEOUT_SECS = 30.0
+PERCENTILES = (50, 95, 99)
+
+# MCP arguments for each tool; every TOOLS entry must have one
+LOAD_ARGS: dict[str, dict[str, Any]] = {
+    "current_weather": {"city": "Sydney"},
+    "forecast": {"city": "Sydney", "days": 7},
+    "current_weather_all_major_cities": {},
+    "observations": {"locations": ["Sydney", "Melbourne", "94767", "Perth"]},
+    "nearest_stations": {"lat": -33.86, "lon": 151.21, "k": 5},
+    "search_stations": {"query": "observatory"},
+    "station_history": {"station": "Sydney", "hours": 24},
+    "station_trend": {"station": "Sydney", "hours": 24},
+    "current_warnings": {},
+}
+
+OpenSession = Callable[[], AbstractAsyncContextManager[ClientSession]]
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Nearest-rank p50/p95/p99 of ``samples``."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    n = len(ordered)
+    return {f"p{q}": ordered[max(0, math.ceil(q / 100 * n) - 1)] for q in PERCENTILES}
+
+
+@dataclass
+class Recorder:
+    samples: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Counter[str] = field(default_factory=Counter)
+    first: float = math.inf
+    last: float = 0.0
+
+    def record(self, name: str, start: float, end: float, *, failed: bool) -> None:
+        self.samples[name].append(end - start)
+        if failed:
+            self.errors[name] += 1
+        self.first = min(self.first, start)
+        self.last = max(self.last, end)
+
+    def report(self) -> dict[str, Any]:
+        every = [s for samples in self.samples.values() for s in samples]
+        secs = max(self.last - self.first, 0.0)
+        return {
+            "calls": len(every),
+            "errors": sum(self.errors.values()),
+            "secs": secs,
+            "calls_per_s": len(every) / secs if secs else 0.0,
+            "latency_secs": percentiles(every),
+            "tools": {
+                name: {"calls": len(s), "errors": self.errors[name], **percentiles(s)}
+                for name, s in sorted(self.samples.items())
+            },
+        }
+
+
+async def _drive(  # noqa: PLR0913
+    open_session: OpenSession,
+    offset: int,
+    stop_at: float,
+    requests: int | None,
+    rec: Recorder,
+) -> None:
+    names = list(LOAD_ARGS)
+    async with open_session() as session:
+        await session.initialize()
+        i = 0
+        while (requests is None or i < requests) and time.perf_counter() < stop_at:
+            # Sessions start at different tools so the mix is even from the first second
+            name = names[(offset + i) % len(names)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                failed = (await session.call_tool(name, LOAD_ARGS[name])).isError
+            except Exception:
+                failed = True
+            rec.record(name, start, time.perf_counter(), failed=failed)
+
+
+def _env(home: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    env["HOME"] = home
+    return env
+
+
+def _stdio(server_args: list[str], env: dict[str, str]) -> OpenSession:
+    params = StdioServerParameters(
+        command=sys.executable, args=["-m", SERVER, "--stdio", *server_args], env=env
+    )
+
+    @asynccontextmanager
+    async def open_session() -> AsyncIterator[ClientSession]:
+        with open(os.devnull, "w") as errlog:
+            async with (
+                stdio_client(params, errlog=errlog) as (read, write),
+                ClientSession(read, write) as session,
+            ):
+                yield session
+
+    return open_session
+
+
+def _http(url: str) -> OpenSession:
+    @asynccontextmanager
+    async def open_session() -> AsyncIterator[ClientSession]:
+        async with (
+            streamablehttp_client(url) as (read, write, _),
+            ClientSession(read, write) as session,
+        ):
+            yield session
+
+    return open_session
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def _http_server(server_args: list[str], env: dict[str, str]) -> Iterator[str]:
+    port = _free_port()
+    args = ["-m", SERVER, "--http", "--host", "127.0.0.1", "--port", str(port), *server_args]
+    proc = subprocess.Popen(
+        [sys.executable, *args], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + STARTUP_TIMEOUT_SECS
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Server exited with {proc.returncode}")
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        yield f"http://127.0.0.1:{port}/mcp"
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+@contextmanager
+def _sessions(
+    transport: str, server_args: list[str], ftp: tuple[str, int], home: str
+) -> Iterator[OpenSession]:
+    # History goes to a scratch directory so station_history / station_trend answer too
+    args = ["--ftp-host", ftp[0], "--ftp-port", str(ftp[1]), "--no-disk-cache"]
+    args += ["--history", str(Path(home) / "history"), *server_args]
+    env = _env(home)
+    if transport == "stdio":
+        yield _stdio(args, env)
+        return
+    with _http_server(args, env) as url:
+        yield _http(url)
+
+
+def run(  # noqa: PLR0913
+    transport: str,
+    sessions: int,
+    *,
+    duration: float,
+    requests: int | None,
+    ftp: tuple[str, int],
+    server_args: list[str],
+) -> dict[str, Any]:
+    rec = Recorder()
+    with (
+        tempfile.TemporaryDirectory() as home,
+        _sessions(transport, server_args, ftp, home) as open_session,
+    ):
+
+        async def main() -> None:
+            stop_at = time.perf_counter() + duration
+            async with anyio.create_task_group() as tg:
+                for i in range(sessions):
+                    tg.start_soon(_drive, open_session, i, stop_at, requests, rec)
+
+        anyio.run(main)
+    return {"transport": transport, "sessions": sessions, **rec.report()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--transport", choices=("stdio", "http"), default="http")
+    ap.add_argument("--sessions", type=int, default=8, help="Concurrent MCP sessions")
+    ap.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    ap.add_argument("--requests", type=int, help="Stop each session after this many calls")
+    ap.add_argument("--server-args", default="", help="Extra fast_mcp_server flags")
+    ap.add_argument("--ftp-host", help="Use this FTP server instead of a local stand-in")
+    ap.add_argument("--ftp-port", type=int, default=21)
+    ap.add_argument("--latency", type=float, default=0.0, help="Stand-in: secs per reply")
+    ap.add_argument("--bandwidth", type=float, help="Stand-in: RETR bytes per second")
+    ap.add_argument("--fail-rate", type=float, default=0.0, help="Stand-in: RETRs dropped")
+    ap.add_argument("--reissue-every", type=float, help="Stand-in: secs between reissues")
+    ap.add_argument("--output", type=Path, help="Also write the report here")
+    args = ap.parse_args(argv)
+
+    def go(ftp: tuple[str, int]) -> dict[str, Any]:
+        return run(
+            args.transport,
+            args.sessions,
+            duration=args.duration,
+            requests=args.requests,
+            ftp=ftp,
+            server_args=shlex.split(args.server_args),
+        )
+
+    if args.ftp_host:
+        report = go((args.ftp_host, args.ftp_port))
+    else:
+        behaviour = Behaviour(args.latency, args.bandwidth, args.fail_rate, args.reissue_every)
+        with ReplayServer(("127.0.0.1", 0), behaviour=behaviour) as ftp:
+            ftp.start()
+            report = go(("127.0.0.1", ftp.port))
+            ftp.shutdown()
+            report["ftp"] = dict(ftp.counts)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
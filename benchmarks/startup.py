@@ -0,0 +1,123 @@
+"""Time from spawning the stdio server to its tools/list response.
+
+Run from the repository root:
+    python benchmarks/startup.py                  # median of 5 spawns vs the budget
+    python benchmarks/startup.py --budget 1.5
+
+Exits non-zero when the median exceeds --budget seconds, or when starting the server
+imported a module that should only load with the first tool call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET_SECS = 2.0
+
+# Loaded on the first tool call, never while answering initialize / tools/list
+DEFERRED_MODULES = (
+    "ftplib",
+    "xml.etree.ElementTree",
+    "mcp_bom_weather.adapters.bom_adapter",
+    "mcp_bom_weather.clients.bom_client",
+    "mcp_bom_weather.tools.weather_tools",
+)
+
+_REQUESTS = [
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "startup-bench", "version": "0"},
+        },
+    },
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+]
+
+
+def _env(home: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    env["HOME"] = home  # keep the default disk cache directory out of the real home
+    return env
+
+
+def time_to_tools_list(home: str) -> float:
+    """Seconds from process spawn until the tools/list response arrives."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "mcp_bom_weather.fast_mcp_server", "--stdio"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_env(home),
+        text=True,
+    )
+    assert proc.stdin and proc.stdout
+    try:
+        proc.stdin.write("".join(json.dumps(r) + "\n" for r in _REQUESTS))
+        proc.stdin.flush()
+        for line in proc.stdout:
+            reply = json.loads(line)
+            if reply.get("id") == 2:  # noqa: PLR2004
+                if "result" not in reply or not reply["result"]["tools"]:
+                    raise RuntimeError(f"Unexpected tools/list reply: {reply}")
+                return time.perf_counter() - start
+        raise RuntimeError("Server exited before answering tools/list")
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def eager_imports(home: str) -> list[str]:
+    """Deferred modules that importing the server module loads anyway."""
+    probe = (
+        "import sys, mcp_bom_weather.fast_mcp_server; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], env=_env(home), capture_output=True, text=True, check=True
+    )
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--budget", type=float, default=BUDGET_SECS, help="Seconds (median)")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as home:
+        eager = eager_imports(home)
+        samples = [time_to_tools_list(home) for _ in range(args.repeat)]
+    median = statistics.median(samples)
+    print(
+        json.dumps(
+            {"median_secs": median, "samples": samples, "budget_secs": args.budget, "eager": eager}
+        )
+    )
+    failed = False
+    if eager:
+        print(f"Imported at startup: {', '.join(eager)}", file=sys.stderr)
+        failed = True
+    if median > args.budget:
+        print(f"Startup {median:.3f}s exceeds the {args.budget:.3f}s budget", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
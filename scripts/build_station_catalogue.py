@@ -0,0 +1,86 @@
+"""Regenerate src/mcp_bom_weather/adapters/station_data.py from the observation products.
+
+Run from the repository root:
+    python scripts/build_station_catalogue.py            # from examples/
+    python scripts/build_station_catalogue.py --ftp      # from ftp.bom.gov.au
+
+Every <station> of the seven IDx60920 files becomes one row: wmo-id, bom-id, stn-name,
+description, product, lat, lon. A station listed by more than one product keeps the
+first. Only station metadata is written, never readings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from mcp_bom_weather.config import CITY_PRODUCT_IDS  # noqa: E402
+
+OUTPUT = ROOT / "src" / "mcp_bom_weather" / "adapters" / "station_data.py"
+FIELDS = ("wmo-id", "bom-id", "stn-name", "description")
+
+HEADER = '''\
+# ruff: noqa: E501
+# Generated by scripts/build_station_catalogue.py from the IDx60920 observation products;
+# do not edit. One station per line: wmo-id, bom-id, stn-name, description, product, lat,
+# lon, tab-separated (empty when the product leaves a field out).
+
+STATIONS_TSV = """\\
+'''
+
+
+def _rows(product_id: str, text: str) -> list[list[str]]:
+    rows: list[list[str]] = []
+    parser = ET.XMLPullParser(events=("end",))
+    try:
+        parser.feed(text)
+        parser.close()
+    except ET.ParseError:
+        pass  # a product cut off part way still lists every station that closed
+    for _, elem in parser.read_events():
+        if elem.tag != "station":
+            continue
+        row = [(elem.get(f) or "").strip() for f in FIELDS]
+        rows.append([*row, product_id, elem.get("lat") or "", elem.get("lon") or ""])
+        elem.clear()
+    return rows
+
+
+def _texts(args: argparse.Namespace) -> dict[str, str]:
+    products = [p for p in CITY_PRODUCT_IDS.values() if p]
+    if not args.ftp:
+        return {p: (args.source / f"{p}.xml").read_text(encoding="utf-8") for p in products}
+    from mcp_bom_weather.clients.bom_client import BomClient  # noqa: PLC0415
+
+    client = BomClient()
+    return {p: client.fetch_product(client.product_path(p)).text for p in products}
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--source", type=Path, default=ROOT / "examples", help="Product directory")
+    ap.add_argument("--ftp", action="store_true", help="Download the products from BoM instead")
+    ap.add_argument("--output", type=Path, default=OUTPUT)
+    args = ap.parse_args(argv)
+
+    seen: set[str] = set()
+    lines: list[str] = []
+    for product_id, text in _texts(args).items():
+        for row in _rows(product_id, text):
+            key = row[0] or row[1]
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            lines.append("\t".join(v.replace("\t", " ") for v in row))
+    args.output.write_text(HEADER + "\n".join(lines) + '\n"""\n', encoding="utf-8")
+    print(f"Wrote {len(lines)} stations to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,30 +4,10 @@ import datetime as dt
 import re
 import xml.etree.ElementTree as ET
 from http import HTTPStatus
-from typing import NotRequired, TypedDict
-
-from ..config import SUPPORTED_CITIES
-
-
-class CurrentWeather(TypedDict):
-    city: str
-    temp_c: float
-    condition: str
-    updated_at: str  # ISO8601
-
-
-class ForecastDay(TypedDict):
-    date: str  # YYYY-MM-DD
-    min_c: float
-    max_c: float
-    condition: str
-
-
-class Forecast(TypedDict):
-    city: str
-    days: list[ForecastDay]
-    generated_at: NotRequired[str]
 
+from ..config import CITY_STATION_IDS, SUPPORTED_CITIES
+from ..util.metrics import timed
+from .models import CurrentWeather, Forecast, ForecastDay
 
 _COND_WORDS = (
     "Sunny",
@@ -52,11 +32,36 @@ def _iso_now() -> str:
     )
 
 
+# --- HTML fallback extraction (compiled once) ---
+
+_CURRENT_TEMP_RE = re.compile(r"Current[^\n\r]*?(-?\d+(?:\.\d+)?)\s*°?C", re.I)
+_ANY_TEMP_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*°?C")
+# Zero-width lookahead so overlapping words are all seen in one scan ("Partly cloudy" also
+# reports "cloudy"); each group index is the word's position in _COND_WORDS
+_COND_WORDS_RE = re.compile(
+    "(?=" + "|".join(rf"\b({re.escape(w)})\b" for w in _COND_WORDS) + ")", re.I
+)
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.I | re.S)
+_META_DESCRIPTION_RE = re.compile(
+    r"<meta[^>]+name=['\"]description['\"][^>]+content=['\"]([^'\"]+)['\"]", re.I
+)
+_UPDATED_RE = re.compile(r"(Updated|Issued)\s+(at|on)\s+([\w:,\s]+)\b", re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+_MIN_MAX_PAIR_RE = re.compile(
+    r"Min\s+(-?\d+(?:\.\d+)?)\s*°?C[^\n\r]*?Max\s+(-?\d+(?:\.\d+)?)\s*°?C([^<\n\r]{0,40})", re.I
+)
+# Separate Min/Max labels; neither can start inside the other's match, so one scan gives
+# the same sequences as two
+_MIN_OR_MAX_RE = re.compile(r"(?:(Min)|Max)(?:imum)?:?\s*(-?\d+(?:\.\d+)?)\s*°?C", re.I)
+_NO_WARNINGS_RE = re.compile(r"No\s+warnings", re.I)
+_WARNING_HEADING_RE = re.compile(r"<h[1-4][^>]*>([^<]*warning[^<]*)</h[1-4]>", re.I)
+_WARNING_WORD_RE = re.compile(r"\bwarning\b", re.I)
+_ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
 def _extract_temp_c(html: str) -> float | None:
     # Prefer patterns around the word Current
-    m = re.search(r"Current[^\n\r]*?(-?\d+(?:\.\d+)?)\s*°?C", html, re.I)
-    if not m:
-        m = re.search(r"(-?\d+(?:\.\d+)?)\s*°?C", html)
+    m = _CURRENT_TEMP_RE.search(html) or _ANY_TEMP_RE.search(html)
     if m:
         try:
             return float(m.group(1))
@@ -65,22 +70,28 @@ def _extract_temp_c(html: str) -> float | None:
     return None
 
 
+def _condition_word(text: str) -> str | None:
+    # The earliest entry of _COND_WORDS present anywhere, found in a single pass
+    best = len(_COND_WORDS)
+    for m in _COND_WORDS_RE.finditer(text):
+        best = min(best, m.lastindex - 1)  # type: ignore[operator]
+        if best == 0:
+            break
+    return _COND_WORDS[best] if best < len(_COND_WORDS) else None
+
+
 def _extract_condition(html: str) -> str | None:
     # Try a few known condition words
-    for word in _COND_WORDS:
-        if re.search(rf"\b{re.escape(word)}\b", html, re.I):
-            return word
+    word = _condition_word(html)
+    if word:
+        return word
     # Fallback to title or meta description
-    title = re.search(r"<title>(.*?)</title>", html, re.I | re.S)
+    title = _TITLE_RE.search(html)
     if title:
-        t = re.sub(r"\s+", " ", title.group(1)).strip()
+        t = _WHITESPACE_RE.sub(" ", title.group(1)).strip()
         if t:
             return t[:64]
-    meta = re.search(
-        r"<meta[^>]+name=['\"]description['\"][^>]+content=['\"]([^'\"]+)['\"]",
-        html,
-        re.I,
-    )
+    meta = _META_DESCRIPTION_RE.search(html)
     if meta:
         return meta.group(1)[:64]
     return None
@@ -88,13 +99,13 @@ def _extract_condition(html: str) -> str | None:
 
 def _extract_updated_at(html: str) -> str | None:
     # Look for common phrases
-    m = re.search(r"(Updated|Issued)\s+(at|on)\s+([\w:,\s]+)\b", html, re.I)
-    if m:
+    if _UPDATED_RE.search(html):
         # We cannot reliably parse locale-specific strings; return iso-now as a proxy
         return _iso_now()
     return None
 
 
+@timed("parse", kind="current_html")
 def parse_current_from_html(city: str, status: int, html: str) -> CurrentWeather:
     if status != HTTPStatus.OK:
         raise RuntimeError(f"BoM returned status {status} for {city}")
@@ -103,15 +114,24 @@ def parse_current_from_html(city: str, status: int, html: str) -> CurrentWeather
     cond = _extract_condition(html)
     ts = _extract_updated_at(html) or _iso_now()
 
-    # Graceful fallbacks to keep tools robust if layout changes
-    if temp is None:
-        temp = float("nan")
+    # Graceful fallback to keep tools robust if layout changes
     if not cond:
         cond = "Unknown"
 
     return CurrentWeather(city=city, temp_c=temp, condition=cond, updated_at=ts)
 
 
+def unavailable_current(city: str, exc: BaseException) -> CurrentWeather:
+    return CurrentWeather(
+        city=city,
+        temp_c=None,
+        condition="Unavailable",
+        updated_at=_iso_now(),
+        error=f"{type(exc).__name__}: {exc}",
+    )
+
+
+@timed("parse", kind="forecast_html")
 def parse_forecast_from_html(city: str, status: int, html: str, days: int = 7) -> Forecast:
     if status != HTTPStatus.OK:
         raise RuntimeError(f"BoM returned status {status} for {city}")
@@ -120,11 +140,7 @@ def parse_forecast_from_html(city: str, status: int, html: str, days: int = 7) -
     pairs: list[tuple[float, float, str]] = []
 
     # Pattern like: Min 12°C Max 23°C Condition
-    for m in re.finditer(
-        r"Min\s+(-?\d+(?:\.\d+)?)\s*°?C[^\n\r]*?Max\s+(-?\d+(?:\.\d+)?)\s*°?C([^<\n\r]{0,40})",
-        html,
-        re.I,
-    ):
+    for m in _MIN_MAX_PAIR_RE.finditer(html):
         min_c = float(m.group(1))
         max_c = float(m.group(2))
         raw = m.group(3).strip()
@@ -133,34 +149,22 @@ def parse_forecast_from_html(city: str, status: int, html: str, days: int = 7) -
 
     # Fallback: look for separate min/max spans
     if not pairs:
-        mins = [
-            float(x)
-            for x in re.findall(r"(?:Min(?:imum)?:?)\s*(-?\d+(?:\.\d+)?)\s*°?C", html, re.I)
-        ]
-        maxs = [
-            float(x)
-            for x in re.findall(r"(?:Max(?:imum)?:?)\s*(-?\d+(?:\.\d+)?)\s*°?C", html, re.I)
-        ]
+        mins: list[float] = []
+        maxs: list[float] = []
+        for m in _MIN_OR_MAX_RE.finditer(html):
+            (mins if m.group(1) else maxs).append(float(m.group(2)))
         cnt = min(len(mins), len(maxs))
         for i in range(cnt):
             pairs.append((mins[i], maxs[i], "Unknown"))
 
-    # Build days list; pad with simple trend if insufficient
+    # One day per pair found, dated from today; days the page doesn't give are left out
     today = dt.date.today()
-    out: list[ForecastDay] = []
-    n = max(1, days)
-    for i in range(n):
-        d = today + dt.timedelta(days=i)
-        if i < len(pairs):
-            min_c, max_c, cond = pairs[i]
-        else:
-            # derive a mild progression if not available
-            base_min = pairs[-1][0] if pairs else 12.0
-            base_max = pairs[-1][1] if pairs else 24.0
-            min_c = base_min + 0.2 * i
-            max_c = base_max + 0.3 * i
-            cond = "Unknown"
-        out.append(ForecastDay(date=d.isoformat(), min_c=min_c, max_c=max_c, condition=cond))
+    out = [
+        ForecastDay(
+            date=(today + dt.timedelta(days=i)).isoformat(), min_c=min_c, max_c=max_c, condition=c
+        )
+        for i, (min_c, max_c, c) in enumerate(pairs[: max(1, days)])
+    ]
 
     return Forecast(city=city, days=out, generated_at=_iso_now())
 
@@ -171,17 +175,18 @@ def validate_city(city: str) -> str:
     return city
 
 
+@timed("parse", kind="warnings_html")
 def parse_warnings_from_html(status: int, html: str) -> dict:
     if status != HTTPStatus.OK:
         raise RuntimeError("BoM returned non-200 for warnings")
-    if re.search(r"No\s+warnings", html, re.I):
+    if _NO_WARNINGS_RE.search(html):
         return {"source": "BoM", "count": 0, "items": []}
     # Extract headings that mention "warning"
-    titles = re.findall(r"<h[1-4][^>]*>([^<]*warning[^<]*)</h[1-4]>", html, re.I)
-    items = [{"title": re.sub(r"\s+", " ", t).strip()} for t in titles if t.strip()]
+    titles = _WARNING_HEADING_RE.findall(html)
+    items = [{"title": _WHITESPACE_RE.sub(" ", t).strip()} for t in titles if t.strip()]
     # Fallback: count occurrences of the word
     if not items:
-        count = len(re.findall(r"\bwarning\b", html, re.I))
+        count = sum(1 for _ in _WARNING_WORD_RE.finditer(html))
         return {"source": "BoM", "count": count, "items": []}
     return {"source": "BoM", "count": len(items), "items": items}
 
@@ -197,9 +202,68 @@ def _find_area(root: ET.Element, city: str) -> ET.Element | None:
     return None
 
 
-def parse_current_from_xml(city: str, status: int, xml_text: str) -> CurrentWeather:  # noqa: PLR0912
+_STREAM_CHUNK_CHARS = 64 * 1024
+_AIR_TEMP_PATH = './/element[@type="air_temperature"]'
+
+
+def _stream_station(xml_text: str, wmo_id: str | None) -> ET.Element | None:
+    """Incrementally parse an observations product up to the wanted <station>.
+
+    Other stations are dropped as soon as they close, and parsing stops at the target, so
+    the tree never holds more than one station. With no wmo_id the first station that
+    reports an air temperature is returned. None means this is not an observations
+    product or the station is absent; ParseError means the text broke off before it.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    observations: ET.Element | None = None
+    for offset in range(0, len(xml_text), _STREAM_CHUNK_CHARS):
+        parser.feed(xml_text[offset : offset + _STREAM_CHUNK_CHARS])
+        for event, elem in parser.read_events():
+            if event == "start":
+                if elem.tag == "observations":
+                    observations = elem
+                elif elem.tag == "forecast":
+                    return None
+                continue
+            if elem.tag != "station":
+                continue
+            if wmo_id is None:
+                if elem.find(_AIR_TEMP_PATH) is not None:
+                    return elem
+            elif elem.get("wmo-id") == wmo_id:
+                return elem
+            elem.clear()
+            if observations is not None:
+                observations.remove(elem)
+    parser.close()
+    return None
+
+
+@timed("parse", kind="current")
+def parse_current_from_xml(city: str, status: int, xml_text: str) -> CurrentWeather:
     if status != HTTPStatus.OK:
         raise RuntimeError(f"BoM returned status {status} for {city}")
+    try:
+        station = _stream_station(xml_text, CITY_STATION_IDS.get(city))
+    except ET.ParseError:
+        # fallback to HTML parser as last resort
+        return parse_current_from_html(city, HTTPStatus.OK, xml_text)
+    if station is None:
+        # Forecast-style products (or a missing station) need the whole tree
+        return _parse_current_tree(city, xml_text)
+
+    temp_val: float | None = None
+    el = station.find(_AIR_TEMP_PATH)
+    if el is not None and (el.text or "").strip():
+        try:
+            temp_val = float((el.text or "").strip())
+        except ValueError:
+            pass
+    # Observation products carry no precis, so there is no condition text to report
+    return CurrentWeather(city=city, temp_c=temp_val, condition="Unknown", updated_at=_iso_now())
+
+
+def _parse_current_tree(city: str, xml_text: str) -> CurrentWeather:  # noqa: PLR0912
     try:
         root = ET.fromstring(xml_text)
     except ET.ParseError:
@@ -245,12 +309,11 @@ def parse_current_from_xml(city: str, status: int, xml_text: str) -> CurrentWeat
                 pass
     if not cond:
         cond = "Unknown"
-    if temp_val is None:
-        temp_val = float("nan")
 
     return CurrentWeather(city=city, temp_c=temp_val, condition=cond, updated_at=updated)
 
 
+@timed("parse", kind="forecast")
 def parse_forecast_from_xml(city: str, status: int, xml_text: str, days: int = 7) -> Forecast:
     if status != HTTPStatus.OK:
         raise RuntimeError(f"BoM returned status {status} for {city}")
@@ -260,58 +323,44 @@ def parse_forecast_from_xml(city: str, status: int, xml_text: str, days: int = 7
         return parse_forecast_from_html(city, HTTPStatus.OK, xml_text, days=days)
 
     area = _find_area(root, city)
-    out: list[ForecastDay] = []
     n = max(1, days)
+    out: list[ForecastDay] = []
     if area is not None:
         periods = area.findall(".//forecast-period")
-        for p in periods[:n]:
-            tmin = p.find('.//element[@type="air_temperature_minimum"]')
-            tmax = p.find('.//element[@type="air_temperature_maximum"]')
-            precis = p.find('.//text[@type="precis"]')
-            date = p.get("start-time-local") or p.get("index") or ""
-            # Coerce date to YYYY-MM-DD if possible
-            m = re.match(r"(\d{4}-\d{2}-\d{2})", date)
-            date_out = (
-                m.group(1) if m else (dt.date.today() + dt.timedelta(days=len(out))).isoformat()
-            )
-            try:
-                vmin = float((tmin.text or "").strip()) if tmin is not None else float("nan")
-            except Exception:
-                vmin = float("nan")
-            try:
-                vmax = float((tmax.text or "").strip()) if tmax is not None else float("nan")
-            except Exception:
-                vmax = float("nan")
-            cond = (
-                (precis.text or "").strip()
-                if precis is not None and (precis.text or "").strip()
-                else "Unknown"
-            )
-            out.append(ForecastDay(date=date_out, min_c=vmin, max_c=vmax, condition=cond))
+        out = [forecast_day(p, i) for i, p in enumerate(periods[:n])]
 
     # If we couldn't parse periods, fall back to HTML-based heuristic
     if not out:
         return parse_forecast_from_html(city, HTTPStatus.OK, xml_text, days=days)
 
-    # Pad if needed
-    while len(out) < n:
-        last = out[-1]
-        idx = len(out)
-        out.append(
-            ForecastDay(
-                date=(dt.date.today() + dt.timedelta(days=idx)).isoformat(),
-                min_c=(last["min_c"] if not (last["min_c"] != last["min_c"]) else 12.0)
-                + 0.2 * idx,  # NaN check
-                max_c=(
-                    (last["max_c"] if not (last["max_c"] != last["max_c"]) else 24.0) + 0.3 * idx
-                ),
-                condition=last["condition"],
-            )
-        )
-
     return Forecast(city=city, days=out, generated_at=_iso_now())
 
 
+def forecast_day(period: ET.Element, position: int) -> ForecastDay:
+    # Précis products carry short text and temperatures; city forecasts only "forecast" text
+    texts = (period.find(f'.//text[@type="{t}"]') for t in ("precis", "forecast"))
+    date = period.get("start-time-local") or period.get("index") or ""
+    # Coerce date to YYYY-MM-DD if possible
+    m = _ISO_DATE_RE.match(date)
+    date_out = m.group(1) if m else (dt.date.today() + dt.timedelta(days=position)).isoformat()
+    cond = next((t.text.strip() for t in texts if t is not None and (t.text or "").strip()), "")
+    return ForecastDay(
+        date=date_out,
+        min_c=_period_temp(period, "air_temperature_minimum"),
+        max_c=_period_temp(period, "air_temperature_maximum"),
+        condition=cond or "Unknown",
+    )
+
+
+def _period_temp(period: ET.Element, element_type: str) -> float | None:
+    el = period.find(f'.//element[@type="{element_type}"]')
+    try:
+        return float((el.text or "").strip()) if el is not None else None
+    except ValueError:
+        return None
+
+
+@timed("parse", kind="warnings")
 def parse_warnings_from_xml(status: int, xml_text: str) -> dict:
     if status != HTTPStatus.OK:
         raise RuntimeError("BoM returned non-200 for warnings")
@@ -332,6 +381,6 @@ def parse_warnings_from_xml(status: int, xml_text: str) -> dict:
             txt = (el.text or "").strip()
             if txt:
                 titles.append(txt)
-    if not titles and re.search(r"No\s+warnings", xml_text, re.I):
+    if not titles and _NO_WARNINGS_RE.search(xml_text):
         return {"source": "BoM", "count": 0, "items": []}
     return {"source": "BoM", "count": len(titles), "items": [{"title": t} for t in titles]}
@@ -0,0 +1,104 @@
+# Result types of the tools. Kept apart from the parsers so the server can describe its
+# tools without importing them. No postponed annotations here: FastMCP reads
+# __required_keys__, which only honours NotRequired when annotations are evaluated.
+from typing import NotRequired, TypedDict
+
+
+class CurrentWeather(TypedDict):
+    city: str  # the city, or the station description
+    temp_c: float | None  # None when the station reports no air temperature
+    condition: str
+    updated_at: str  # ISO8601
+    error: NotRequired[str]  # set when the city could not be fetched (partial results)
+    stale_age_secs: NotRequired[int]  # set when served from a copy past its reissue time
+
+
+class ForecastDay(TypedDict):
+    date: str  # YYYY-MM-DD
+    min_c: float | None  # None when the period carries no forecast temperature
+    max_c: float | None
+    condition: str
+
+
+class Forecast(TypedDict):
+    city: str
+    days: list[ForecastDay]
+    generated_at: NotRequired[str]
+    stale_age_secs: NotRequired[int]
+
+
+class ObservationTable(TypedDict):
+    # Column-oriented: entry i of every list (and of every values column) is location i
+    variables: list[str]
+    location: list[str]  # as requested
+    station: list[str | None]  # station description
+    wmo_id: list[str | None]
+    product: list[str | None]
+    time_utc: list[str | None]
+    values: dict[str, list[float | str | None]]  # variable -> column; None when not reported
+    errors: NotRequired[dict[str, str]]  # location -> why it has no row data
+    stale_age_secs: NotRequired[int]  # oldest stale product that contributed
+
+
+class NearbyStation(TypedDict):
+    station: str | None  # station description
+    wmo_id: str | None
+    bom_id: str | None
+    product: str
+    lat: float
+    lon: float
+    distance_km: float
+    time_utc: str | None
+    values: dict[str, float | str | None]
+
+
+class NearestStations(TypedDict):
+    lat: float
+    lon: float
+    stations: list[NearbyStation]  # closest first
+    errors: NotRequired[dict[str, str]]  # product -> why its stations were not searched
+    stale_age_secs: NotRequired[int]
+
+
+class StationMatch(TypedDict):
+    station: str  # description, e.g. "Sydney - Observatory Hill"
+    name: str  # stn-name, e.g. "SYDNEY (OBSERVATORY HILL)"
+    wmo_id: str | None
+    bom_id: str | None
+    state: str | None
+    product: str  # observation product reporting it
+    lat: float
+    lon: float
+    score: float  # 1.0 for an id or whole-name match
+    match: str  # "id", "name", "prefix" or "fuzzy"
+
+
+class StationSearch(TypedDict):
+    query: str
+    matches: list[StationMatch]  # best first
+
+
+class StationHistory(TypedDict):
+    station: str  # as requested
+    key: str  # wmo-id (or bom-id) the history is stored under
+    time_utc: list[str]
+    values: dict[str, list[float | None]]  # variable -> column aligned with time_utc
+
+
+class TrendStats(TypedDict):
+    count: int  # readings in the window that reported this variable
+    min: float | None
+    max: float | None
+    mean: float | None
+    first: float | None
+    last: float | None
+    change: float | None  # last - first
+
+
+class StationTrend(TypedDict):
+    station: str
+    key: str
+    hours: float
+    from_utc: str | None  # first and last reading in the window
+    to_utc: str | None
+    stats: dict[str, TrendStats]
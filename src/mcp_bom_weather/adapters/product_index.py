@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import math
+import threading
+import xml.etree.ElementTree as ET
+
+from ..config import CITY_FORECAST_AACS, CITY_STATION_IDS
+from ..util.cache import Product
+from ..util.disk_cache import DiskCache, digest
+from ..util.metrics import stage, timed
+from ..util.singleflight import SingleFlight
+from .bom_adapter import (
+    CurrentWeather,
+    Forecast,
+    ForecastDay,
+    _iso_now,
+    forecast_day,
+)
+from .station_grid import StationGrid
+
+_FEED_CHUNK_CHARS = 64 * 1024
+# Bump when StationObs/ForecastArea/ProductIndex change so stale pickles on disk are ignored
+INDEX_FORMAT = "index2"
+_NAN = float("nan")
+
+
+# Observation element types kept in named StationObs slots; other types are kept raw
+OBSERVATION_SLOTS: dict[str, str] = {
+    "air_temperature": "air_temp",
+    "apparent_temp": "apparent_temp",
+    "dew_point": "dew_point",
+    "rel-humidity": "rel_humidity",
+    "wind_dir": "wind_dir",
+    "wind_spd_kmh": "wind_spd_kmh",
+    "gust_kmh": "gust_kmh",
+    "msl_pres": "pressure",
+    "rainfall": "rainfall",
+    "weather": "weather",
+}
+
+
+def _num(value: str | None) -> float:
+    try:
+        return float((value or "").strip())
+    except ValueError:
+        return _NAN
+
+
+def _scalar(value: str | None) -> float | str | None:
+    text = (value or "").strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+class StationObs:
+    """Latest reading of one observation station, with the element types the tools use."""
+
+    __slots__ = (
+        "air_temp",
+        "apparent_temp",
+        "bom_id",
+        "description",
+        "dew_point",
+        "district",
+        "gust_kmh",
+        "lat",
+        "lon",
+        "name",
+        "other",
+        "pressure",
+        "rainfall",
+        "rel_humidity",
+        "time_utc",
+        "weather",
+        "wind_dir",
+        "wind_spd_kmh",
+        "wmo_id",
+    )
+
+    def __init__(self, station: ET.Element) -> None:
+        self.wmo_id = station.get("wmo-id")
+        self.bom_id = station.get("bom-id")
+        self.name = station.get("stn-name")
+        self.description = station.get("description")
+        self.district = station.get("forecast-district-id")
+        self.lat = _num(station.get("lat"))
+        self.lon = _num(station.get("lon"))
+        period = station.find("period")
+        self.time_utc = period.get("time-utc") if period is not None else None
+        values = {el.get("type"): el.text for el in station.iter("element")}
+        self.air_temp = _num(values.get("air_temperature"))
+        self.apparent_temp = _num(values.get("apparent_temp"))
+        self.dew_point = _num(values.get("dew_point"))
+        self.rel_humidity = _num(values.get("rel-humidity"))
+        self.wind_dir = values.get("wind_dir")
+        self.wind_spd_kmh = _num(values.get("wind_spd_kmh"))
+        self.gust_kmh = _num(values.get("gust_kmh"))
+        self.pressure = _num(values.get("msl_pres"))
+        self.rainfall = _num(values.get("rainfall"))
+        self.weather = values.get("weather")
+        self.other = tuple(
+            (k, v) for k, v in values.items() if k is not None and k not in OBSERVATION_SLOTS
+        )
+
+    def value(self, variable: str) -> float | str | None:
+        """The reading for an observation element type; None when not reported."""
+        slot = OBSERVATION_SLOTS.get(variable)
+        if slot is None:
+            return _scalar(next((v for k, v in self.other if k == variable), None))
+        value = getattr(self, slot)
+        if isinstance(value, float) and math.isnan(value):
+            return None
+        return value
+
+
+class ForecastArea:
+    """One forecast <area> with its periods already converted to ForecastDay rows."""
+
+    __slots__ = ("aac", "days", "description", "max_c", "min_c", "precis")
+
+    def __init__(self, area: ET.Element) -> None:
+        self.aac = area.get("aac")
+        self.description = area.get("description") or ""
+        periods = area.findall(".//forecast-period")
+        self.days = tuple(forecast_day(p, i) for i, p in enumerate(periods))
+        # First values anywhere in the area, as used to estimate a current temperature
+        precis = area.find('.//forecast-period//text[@type="precis"]')
+        self.precis = (precis.text or "").strip() if precis is not None else ""
+        tmin = area.find('.//forecast-period//element[@type="air_temperature_minimum"]')
+        tmax = area.find('.//forecast-period//element[@type="air_temperature_maximum"]')
+        self.min_c = _num(tmin.text) if tmin is not None else _NAN
+        self.max_c = _num(tmax.text) if tmax is not None else _NAN
+
+
+class ProductIndex:
+    """A product parsed once into station and area lookups.
+
+    Built incrementally: each <station> and <area> is converted to a record and its
+    element cleared, so only the records are kept. A product that breaks off part way
+    keeps everything that closed before the break (``complete`` is then False).
+
+    Without ``text`` the index is filled by ``feed()`` as chunks arrive (e.g. straight
+    from a RETR callback) and finished with ``close()``.
+    """
+
+    def __init__(
+        self, text: str | None = None, version: object = None, fetched_at: float = 0.0
+    ) -> None:
+        self.version = version
+        self.fetched_at = fetched_at
+        self.complete = True
+        self.closed = False
+        self.stations: list[StationObs] = []
+        self.areas: list[ForecastArea] = []
+        self.by_wmo: dict[str, StationObs] = {}
+        self.by_bom: dict[str, StationObs] = {}
+        self.by_description: dict[str, StationObs] = {}  # lower-cased description
+        self.by_district: dict[str, list[StationObs]] = {}
+        self.areas_by_aac: dict[str, ForecastArea] = {}
+        self.areas_by_description: dict[str, ForecastArea] = {}  # lower-cased description
+        self._area_for_city: dict[str, ForecastArea | None] = {}
+        self._grid: StationGrid | None = None
+        self._parser: ET.XMLPullParser | None = ET.XMLPullParser(events=("end",))
+        if text is not None:
+            for offset in range(0, len(text), _FEED_CHUNK_CHARS):
+                self.feed(text[offset : offset + _FEED_CHUNK_CHARS])
+            self.close()
+
+    def feed(self, chunk: str) -> None:
+        parser = self._parser
+        if parser is None:
+            return  # closed, or broken off at a parse error
+        try:
+            parser.feed(chunk)
+            self._read_events(parser)
+        except ET.ParseError:
+            self._parser = None
+            self.complete = False
+
+    def close(self) -> ProductIndex:
+        parser, self._parser = self._parser, None
+        if parser is not None:
+            try:
+                parser.close()
+                self._read_events(parser)
+            except ET.ParseError:
+                self.complete = False
+        self.closed = True
+        return self
+
+    def _read_events(self, parser: ET.XMLPullParser) -> None:
+        for _, elem in parser.read_events():
+            if elem.tag == "station":
+                self._add_station(StationObs(elem))
+                elem.clear()
+            elif elem.tag == "area":
+                self._add_area(ForecastArea(elem))
+                elem.clear()
+
+    def _add_station(self, stn: StationObs) -> None:
+        self.stations.append(stn)
+        if stn.wmo_id:
+            self.by_wmo.setdefault(stn.wmo_id, stn)
+        if stn.bom_id:
+            self.by_bom.setdefault(stn.bom_id, stn)
+        if stn.description:
+            self.by_description.setdefault(stn.description.lower(), stn)
+        if stn.district:
+            self.by_district.setdefault(stn.district, []).append(stn)
+
+    def _add_area(self, area: ForecastArea) -> None:
+        self.areas.append(area)
+        if area.aac:
+            self.areas_by_aac.setdefault(area.aac, area)
+        if area.description:
+            self.areas_by_description.setdefault(area.description.lower(), area)
+
+    def __bool__(self) -> bool:
+        return bool(self.stations or self.areas)
+
+    def __getstate__(self) -> dict[str, object]:
+        # The grid and the city->area memo are cheap to rebuild; don't persist them
+        state = dict(self.__dict__)
+        state["_grid"] = None
+        state["_area_for_city"] = {}
+        state["_parser"] = None
+        return state
+
+    def area_for(self, city: str) -> ForecastArea | None:
+        # Same rule as the tree parser (first area whose description contains the city),
+        # resolved once per city
+        key = city.lower()
+        try:
+            return self._area_for_city[key]
+        except KeyError:
+            pass
+        found = next((a for a in self.areas if key in a.description.lower()), None)
+        self._area_for_city[key] = found
+        return found
+
+    def forecast_area(self, city: str) -> ForecastArea | None:
+        """The city's forecast area: by its configured aac, else by description."""
+        aac = CITY_FORECAST_AACS.get(city)
+        area = self.areas_by_aac.get(aac) if aac else None
+        return area or self.areas_by_description.get(city.lower()) or self.area_for(city)
+
+    @property
+    def grid(self) -> StationGrid:
+        # Built on first nearest-station query, then reused for this product version
+        if self._grid is None:
+            self._grid = StationGrid(self.stations)
+        return self._grid
+
+    def station(self, key: str) -> StationObs | None:
+        """Look a station up by wmo-id, bom-id or (case-insensitive) description."""
+        return self.by_wmo.get(key) or self.by_bom.get(key) or self.by_description.get(key.lower())
+
+    def station_for(self, city: str) -> StationObs | None:
+        wmo_id = CITY_STATION_IDS.get(city)
+        stn = self.by_wmo.get(wmo_id) if wmo_id else None
+        if stn is None:
+            stn = next((s for s in self.stations if not math.isnan(s.air_temp)), None)
+        return stn
+
+    def current(self, city: str) -> CurrentWeather | None:
+        """None when the product held nothing usable (callers fall back to the text)."""
+        if not self:
+            return None
+        stn = self.station_for(city)
+        area = self.area_for(city)
+        temp: float | None = None
+        if stn is not None:
+            temp = None if math.isnan(stn.air_temp) else stn.air_temp
+        elif area is not None and not (math.isnan(area.min_c) or math.isnan(area.max_c)):
+            temp = (area.min_c + area.max_c) / 2.0
+        cond = (area.precis if area is not None else "") or "Unknown"
+        return CurrentWeather(city=city, temp_c=temp, condition=cond, updated_at=_iso_now())
+
+    def forecast(self, city: str, days: int = 7) -> Forecast | None:
+        """Up to ``days`` issued periods; None when the product has no area for the city."""
+        area = self.forecast_area(city)
+        if area is None or not area.days:
+            return None
+        out: list[ForecastDay] = [ForecastDay(**d) for d in area.days[: max(1, days)]]
+        return Forecast(city=city, days=out, generated_at=_iso_now())
+
+
+def _persist(disk: DiskCache, key: str, index: ProductIndex) -> None:
+    try:
+        disk.store_object(key, INDEX_FORMAT, index)
+    except OSError:
+        pass  # the in-memory index is all the caller needs
+
+
+class ProductIndexes:
+    """The latest ProductIndex per FTP path, rebuilt only when the product version changes.
+
+    A new version is built off to the side and then swapped in with a single dict
+    assignment, so readers see either the old index or the new one, never a mix.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._indexes: dict[str, ProductIndex] = {}
+        self._builds: SingleFlight[ProductIndex] = SingleFlight()
+
+    def get(self, product: Product, disk: DiskCache | None = None) -> ProductIndex:
+        index = self._indexes.get(product.path)
+        if index is not None and index.version == product.version:
+            return index
+        return self._builds.do((product.path, product.version), lambda: self._build(product, disk))
+
+    def peek(self, product: Product) -> ProductIndex | None:
+        """The index of ``product`` if it is already built, without building it."""
+        index = self._indexes.get(product.path)
+        return index if index is not None and index.version == product.version else None
+
+    @staticmethod
+    @timed("parse", kind="index")
+    def _parse(product: Product) -> ProductIndex:
+        return ProductIndex(product.text, product.version, product.fetched_at)
+
+    def _load_or_parse(self, product: Product, disk: DiskCache | None) -> ProductIndex:
+        if disk is None:
+            return self._parse(product)
+        key = digest(product.text)
+        with stage("disk_load", kind="index"):
+            index = disk.load_object(key, INDEX_FORMAT)
+        if isinstance(index, ProductIndex):
+            index.version, index.fetched_at = product.version, product.fetched_at
+            return index
+        index = self._parse(product)
+        _persist(disk, key, index)
+        return index
+
+    def _build(self, product: Product, disk: DiskCache | None) -> ProductIndex:
+        return self._install(product.path, self._load_or_parse(product, disk))
+
+    def put(
+        self, product: Product, index: ProductIndex, disk: DiskCache | None = None
+    ) -> ProductIndex:
+        """Adopt an index built elsewhere for ``product`` (e.g. while it downloaded)."""
+        index.version, index.fetched_at = product.version, product.fetched_at
+        if disk is not None:
+            _persist(disk, digest(product.text), index)
+        return self._install(product.path, index)
+
+    def _install(self, path: str, index: ProductIndex) -> ProductIndex:
+        with self._lock:
+            current = self._indexes.get(path)
+            # A slow build of an older download must not replace a newer index
+            if current is None or current.fetched_at <= index.fetched_at:
+                self._indexes[path] = index
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
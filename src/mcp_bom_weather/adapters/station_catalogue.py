@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ..config import PRODUCT_PREFIX_STATE, STATION_FUZZY_MIN_SCORE
+from .station_data import STATIONS_TSV
+
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+_NGRAM = 3
+# Scores of the match kinds that are not fuzzy; a prefix match scores between the two
+# (more for a query covering more of the name), and fuzzy matches below PREFIX_SCORE
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.5
+
+
+def normalise(text: str) -> str:
+    """Lower-case words separated by single spaces: "SYDNEY (OBS HILL)" -> "sydney obs hill"."""
+    return _NON_ALNUM_RE.sub(" ", text.lower()).strip()
+
+
+def _ngrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + _NGRAM] for i in range(len(padded) - _NGRAM + 1)}
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogueStation:
+    wmo_id: str | None
+    bom_id: str | None
+    name: str  # stn-name, e.g. "SYDNEY (OBSERVATORY HILL)"
+    description: str  # e.g. "Sydney - Observatory Hill"
+    product: str  # observation product listing it, e.g. "IDN60920"
+    lat: float
+    lon: float
+
+    @property
+    def state(self) -> str | None:
+        return PRODUCT_PREFIX_STATE.get(self.product[:3])
+
+    @property
+    def key(self) -> str:
+        # What ProductIndex.station() looks it up by in its product
+        return self.wmo_id or self.bom_id or self.description
+
+
+@dataclass(frozen=True, slots=True)
+class StationHit:
+    station: CatalogueStation
+    score: float  # 1.0 for an id or whole-name match
+    match: str  # "id", "name", "prefix" or "fuzzy"
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.ids: list[int] = []  # every station with a name (or name word) under this node
+
+
+class StationCatalogue:
+    """Every station of the observation products, searchable without touching them.
+
+    Built once from the station metadata: exact lookups by wmo-id, bom-id and normalised
+    name or description, a prefix trie over every word-start of those names (so "obs"
+    finds "Sydney - Observatory Hill"), and trigram postings for misspelt names.
+    """
+
+    def __init__(self, stations: list[CatalogueStation]) -> None:
+        self.stations = stations
+        self.by_id: dict[str, int] = {}
+        self.by_name: dict[str, int] = {}
+        self._keys: list[tuple[str, ...]] = []
+        self._trie = _TrieNode()
+        self._postings: dict[str, list[int]] = {}
+        self._gram_counts: list[int] = []
+        for i, stn in enumerate(stations):
+            for sid in (stn.wmo_id, stn.bom_id):
+                if sid:
+                    self.by_id.setdefault(sid, i)
+            keys = tuple(dict.fromkeys(k for k in map(normalise, (stn.description, stn.name)) if k))
+            self._keys.append(keys)
+            grams: set[str] = set()
+            for key in keys:
+                self.by_name.setdefault(key, i)
+                words = key.split(" ")
+                for w in range(len(words)):
+                    self._insert(" ".join(words[w:]), i)
+                grams |= _ngrams(key)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+            self._gram_counts.append(len(grams))
+
+    def _insert(self, text: str, i: int) -> None:
+        node = self._trie
+        for ch in text:
+            node = node.children.setdefault(ch, _TrieNode())
+            if not node.ids or node.ids[-1] != i:  # stations are inserted in order
+                node.ids.append(i)
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def resolve(self, query: str) -> CatalogueStation | None:
+        """The station with this wmo-id, bom-id, stn-name or description (any case)."""
+        query = query.strip()
+        i = self.by_id.get(query)
+        if i is None:
+            i = self.by_name.get(normalise(query))
+        return self.stations[i] if i is not None else None
+
+    def _prefixed(self, key: str) -> list[int]:
+        node = self._trie
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                return []
+            node = child
+        return node.ids
+
+    def _fuzzy(self, key: str) -> dict[int, float]:
+        grams = _ngrams(key)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        # Dice coefficient of the trigram sets
+        scores = {i: 2 * n / (len(grams) + self._gram_counts[i]) for i, n in shared.items()}
+        return {i: score for i, score in scores.items() if score >= STATION_FUZZY_MIN_SCORE}
+
+    def search(self, query: str, limit: int) -> list[StationHit]:
+        """Up to ``limit`` stations matching ``query``, best first.
+
+        An id or whole name scores 1.0. A name starting with the query (at any word)
+        scores from 0.5 to 1.0 by how much of the name it covers. Otherwise names
+        sharing enough trigrams with the query score by their overlap, below 0.5.
+        """
+        key = normalise(query)
+        hits: dict[int, StationHit] = {}
+
+        def add(i: int, score: float, match: str) -> None:
+            if i not in hits or hits[i].score < score:
+                hits[i] = StationHit(self.stations[i], score, match)
+
+        exact = self.by_id.get(query.strip())
+        if exact is not None:
+            add(exact, EXACT_SCORE, "id")
+        if key:
+            exact = self.by_name.get(key)
+            if exact is not None:
+                add(exact, EXACT_SCORE, "name")
+            for i in self._prefixed(key):
+                longest = max(len(k) for k in self._keys[i])
+                add(i, PREFIX_SCORE + PREFIX_SCORE * min(len(key) / longest, 1.0), "prefix")
+            if len(hits) < limit:
+                for i, score in self._fuzzy(key).items():
+                    add(i, score * PREFIX_SCORE, "fuzzy")
+        ranked = sorted(hits.values(), key=lambda h: (-h.score, h.station.description))
+        return ranked[:limit]
+
+
+def _parse(tsv: str) -> list[CatalogueStation]:
+    stations = []
+    for line in tsv.splitlines():
+        wmo_id, bom_id, name, description, product, lat, lon = line.split("\t")
+        stations.append(
+            CatalogueStation(
+                wmo_id or None,
+                bom_id or None,
+                name,
+                description or name,
+                product,
+                float(lat or "nan"),
+                float(lon or "nan"),
+            )
+        )
+    return stations
+
+
+@lru_cache(maxsize=1)
+def default_catalogue() -> StationCatalogue:
+    """The catalogue of the stations listed in station_data.py, built on first use."""
+    return StationCatalogue(_parse(STATIONS_TSV))
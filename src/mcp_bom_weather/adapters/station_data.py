@@ -0,0 +1,756 @@
+# ruff: noqa: E501
+# Generated by scripts/build_station_catalogue.py from the IDx60920 observation products;
+# do not edit. One station per line: wmo-id, bom-id, stn-name, description, product, lat,
+# lon, tab-separated (empty when the product leaves a field out).
+
+STATIONS_TSV = """\
+94768	066214	SYDNEY (OBSERVATORY HILL)	Sydney - Observatory Hill	IDN60920	-33.8593	151.2048
+94926	070351	CANBERRA AIRPORT	Canberra	IDN60920	-35.3106	149.1970
+94939	069017	MONTAGUE ISLAND LIGHTHOUSE	Montague Island	IDN60920	-36.2519	150.2275
+94934	069137	GREEN CAPE AWS	Green Cape	IDN60920	-37.2622	150.0504
+94938	069138	ULLADULLA AWS	Ulladulla	IDN60920	-35.3635	150.4828
+94937	069018	MORUYA HEADS PILOT STATION	Moruya Heads	IDN60920	-35.9093	150.1532
+95745	068253	PORT KEMBLA NTC AWS	Port Kembla Harbour	IDN60920	-34.4734	150.9118
+94749	068228	BELLAMBI AWS	Bellambi	IDN60920	-34.3692	150.9291
+95749	068242	KIAMA (BOMBO HEADLAND)	Kiama	IDN60920	-34.6532	150.8609
+94751	068264	JERVIS BAY AIRFIELD AWS	Jervis Bay Airfield	IDN60920	-35.1439	150.6973
+95940	068151	POINT PERPENDICULAR AWS	Point Perpendicular	IDN60920	-35.0936	150.8049
+94780	066051	LITTLE BAY (THE COAST GOLF CLUB)	Little Bay	IDN60920	-33.9829	151.2502
+95767	061412	LAKE MACQUARIE AWS	Lake Macquarie - Cooranbong	IDN60920	-33.0887	151.4636
+95770	061366	NORAH HEAD AWS	Norah Head	IDN60920	-33.2814	151.5766
+94596	058198	BALLINA AIRPORT AWS	Ballina	IDN60920	-28.8353	153.5585
+94599	058216	CAPE BYRON AWS	Cape Byron	IDN60920	-28.6399	153.6358
+94589	058012	YAMBA PILOT STATION	Yamba	IDN60920	-29.4325	153.3632
+94598	058212	EVANS HEAD RAAF BOMBING RANGE AWS	Evans Head	IDN60920	-29.1830	153.3964
+95756	066043	KURNELL AWS	Kurnell	IDN60920	-34.0039	151.2111
+95766	066196	WEDDING CAKE WEST	Sydney Harbour	IDN60920	-33.8405	151.2643
+95768	066197	NORTH HEAD	North Head	IDN60920	-33.8152	151.2986
+94941	069134	BATEMANS BAY (CATALINA COUNTRY CLUB)	Batemans Bay	IDN60920	-35.7234	150.1872
+94746	068239	MOSS VALE AWS	Moss Vale	IDN60920	-34.5253	150.4217
+94766	066194	CANTERBURY RACECOURSE AWS	Canterbury	IDN60920	-33.9057	151.1134
+95908	071041	THREDBO VILLAGE	Thredbo Village	IDN60920	-36.5031	148.3038
+95909	071032	THREDBO AWS	Thredbo Top Station	IDN60920	-36.4917	148.2859
+95719	065070	DUBBO AIRPORT AWS	Dubbo	IDN60920	-32.2206	148.5753
+95541	056242	INVERELL (RAGLAN ST)	Inverell	IDN60920	-29.7796	151.1121
+94541	056018	INVERELL RESEARCH CENTRE	Inverell RS	IDN60920	-29.7752	151.0820
+95697	049000	IVANHOE AERODROME AWS	Ivanhoe Airport	IDN60920	-32.8833	144.3092
+94944	074272	KAPOOKA (DEFENCE)	Kapooka (Defence)	IDN60920	-35.1327	147.2512
+94744	063039	KATOOMBA (FARNELLS RD)	Katoomba	IDN60920	-33.7139	150.2953
+94741	063226	LITHGOW (COOERWULL)	Lithgow	IDN60920	-33.4769	150.1303
+95929	069147	MERIMBULA AIRPORT AWS	Merimbula	IDN60920	-36.9077	149.8989
+94774	061055	NEWCASTLE NOBBYS SIGNAL STATION AWS	Newcastle Nobbys	IDN60920	-32.9184	151.7985
+94763	067113	PENRITH LAKES AWS	Penrith	IDN60920	-33.7195	150.6783
+94915	071075	PERISHER VALLEY AWS	Perisher Valley	IDN60920	-36.4069	148.4055
+95753	067105	RICHMOND RAAF	Richmond	IDN60920	-33.6004	150.7761
+94759	066059	TERREY HILLS AWS	Terrey Hills	IDN60920	-33.6908	151.2253
+94925	070339	TUGGERANONG (ISABELLA PLAINS) AWS	Tuggeranong	IDN60920	-35.4184	149.0937
+95571	058077	GRAFTON RESEARCH STN	Grafton AgRS	IDN60920	-29.6224	152.9605
+95570	058161	GRAFTON AIRPORT AWS	Grafton Airport	IDN60920	-29.7583	153.0297
+94572	058214	LISMORE AIRPORT AWS	Lismore Airport	IDN60920	-28.8305	153.2601
+94592	040717	COOLANGATTA	Coolangatta	IDN60920	-28.1681	153.5053
+94582	058158	MURWILLUMBAH (BRAY PARK)	Murwillumbah	IDN60920	-28.3395	153.3809
+94573	058208	CASINO AIRPORT AWS	Casino	IDN60920	-28.8824	153.0618
+95729	059151	COFFS HARBOUR AIRPORT	Coffs Harbour Airport	IDN60920	-30.3189	153.1162
+94789	059140	DORRIGO (OLD CORAMBA RD)	Dorrigo	IDN60920	-30.3444	152.7187
+94785	059007	KEMPSEY AIRPORT AWS	Kempsey Airport	IDN60920	-31.0711	152.7717
+94783	060085	YARRAS (MOUNT SEAVIEW)	Mount Seaview	IDN60920	-31.3865	152.2482
+94799	060168	PORT MACQUARIE AIRPORT AWS	Port Macquarie Airport	IDN60920	-31.4343	152.8662
+95784	060141	TAREE AIRPORT AWS	Taree Airport	IDN60920	-31.8895	152.5120
+94782	061425	GOSFORD AWS	Gosford	IDN60920	-33.4351	151.3614
+95774	061375	MANGROVE MOUNTAIN AWS	Mangrove Mountain	IDN60920	-33.2894	151.2107
+95771	061260	CESSNOCK AIRPORT AWS	Cessnock Airport	IDN60920	-32.7914	151.3369
+94650	061428	MAITLAND AIRPORT AWS	Maitland Airport	IDN60920	-32.7023	151.4881
+95754	061287	MERRIWA (ROSCOMMON)	Merriwa	IDN60920	-32.1852	150.1737
+94758	061431	MURRURUNDI (HAYDON STREET)	Murrurundi	IDN60920	-31.7678	150.8418
+94776	061078	WILLIAMTOWN RAAF	Williamtown	IDN60920	-32.7939	151.8364
+95758	061363	SCONE AIRPORT AWS	Scone Airport	IDN60920	-32.0335	150.8264
+99738	061430	SINGLETON DEFENCE AWS	Singleton (Defence)	IDN60920	-32.6976	151.1564
+94775	061250	TOCAL AWS	Tocal	IDN60920	-32.6296	151.5919
+94773	056037	ARMIDALE (TREE GROUP NURSERY)	Armidale	IDN60920	-30.5243	151.6716
+95773	056238	ARMIDALE AIRPORT AWS	Armidale Airport	IDN60920	-30.5273	151.6158
+94588	056243	GLEN INNES AIRPORT AWS	Glen Innes Airport	IDN60920	-29.6780	151.6940
+94772	056229	GUYRA HOSPITAL	Guyra	IDN60920	-30.2122	151.6794
+94587	057095	TABULAM (MUIRNE)	Tabulam	IDN60920	-28.7551	152.4507
+94556	056032	TENTERFIELD (FEDERATION PARK)	Tenterfield	IDN60920	-29.0479	152.0172
+94767	066037	SYDNEY AIRPORT AMO	Sydney Airport	IDN60920	-33.9465	151.1731
+94769	066022	FORT DENISON	Fort Denison	IDN60920	-33.8551	151.2254
+95761	066161	HOLSWORTHY AERODROME AWS	Holsworthy	IDN60920	-33.9925	150.9489
+95684	068263	HOLSWORTHY DEFENCE AWS	Holsworthy (Defence)	IDN60920	-34.0810	150.9009
+94760	067119	HORSLEY PARK EQUESTRIAN CENTRE AWS	Horsley Park	IDN60920	-33.8510	150.8567
+95757	066023	LUCAS HEIGHTS (ANSTO)	Lucas Heights (ANSTO)	IDN60920	-34.0519	150.9825
+94764	066124	PARRAMATTA NORTH (MASONS DRIVE)	Parramatta	IDN60920	-33.7917	151.0181
+95765	066212	SYDNEY OLYMPIC PARK AWS (ARCHERY CENTRE)	Sydney Olympic Park	IDN60920	-33.8338	151.0718
+95752	066208	WATTAMOLLA AWS	Wattamolla	IDN60920	-34.1407	151.1185
+94752	067108	BADGERYS CREEK AWS	Badgerys Creek	IDN60920	-33.8969	150.7281
+94765	066137	BANKSTOWN AIRPORT AWS	Bankstown	IDN60920	-33.9176	150.9837
+94755	068192	CAMDEN AIRPORT AWS	Camden	IDN60920	-34.0390	150.6890
+94757	068257	CAMPBELLTOWN (MOUNT ANNAN)	Campbelltown	IDN60920	-34.0615	150.7735
+94750	068072	NOWRA RAN AIR STATION AWS	Nowra	IDN60920	-34.9469	150.5353
+95748	068241	SHELLHARBOUR AIRPORT	Albion Park	IDN60920	-34.5639	150.7924
+95935	069022	NAROOMA (MARINE RESCUE)	Narooma	IDN60920	-36.2144	150.1358
+95937	069148	MORUYA AIRPORT AWS	Moruya Airport	IDN60920	-35.9004	150.1437
+95931	069139	BEGA AWS	Bega	IDN60920	-36.6722	149.8191
+94723	065034	WELLINGTON (D&J RURAL)	Wellington	IDN60920	-32.5635	148.9503
+94743	063292	MOUNT BOYCE AWS	Mount Boyce	IDN60920	-33.6185	150.2741
+94729	063291	BATHURST AIRPORT AWS	Bathurst Airport	IDN60920	-33.4119	149.6540
+94732	062013	GULGONG POST OFFICE	Gulgong	IDN60920	-32.3634	149.5329
+99742	068262	HIGH RANGE AWS (WANGANDERRY)	High Range (Wanganderry)	IDN60920	-34.3335	150.2670
+94727	062101	MUDGEE AIRPORT AWS	Mudgee	IDN60920	-32.5628	149.6149
+94754	062100	NULLO MOUNTAIN AWS	Nullo Mountain	IDN60920	-32.7244	150.2290
+95725	063254	ORANGE AGRICULTURAL INSTITUTE	Orange AgIn	IDN60920	-33.3211	149.0828
+95726	063303	ORANGE AIRPORT AWS	Orange Airport	IDN60920	-33.3768	149.1263
+94909	073007	BURRINJUCK DAM	Burrinjuck Dam	IDN60920	-34.9997	148.5984
+94716	070263	GOULBURN TAFE	Goulburn	IDN60920	-34.7495	149.7034
+94927	069132	BRAIDWOOD RACECOURSE AWS	Braidwood	IDN60920	-35.4253	149.7835
+95716	070330	GOULBURN AIRPORT AWS	Goulburn Airport	IDN60920	-34.8085	149.7311
+94943	069128	NERRIGA AWS	Nerriga	IDN60920	-35.1103	150.0826
+94928	070005	BOMBALA (THERRY STREET)	Bombala	IDN60920	-36.9113	149.2379
+94929	070328	BOMBALA AWS	Bombala AWS	IDN60920	-37.0015	149.2336
+94923	070278	COOMA VISITORS CENTRE	Cooma	IDN60920	-36.2318	149.1243
+94919	072162	KHANCOBAN AWS	Khancoban	IDN60920	-36.2304	148.1405
+95916	072161	CABRAMURRA SMHEA AWS	Cabramurra	IDN60920	-35.9371	148.3779
+94921	070217	COOMA AIRPORT AWS	Cooma Airport	IDN60920	-36.2939	148.9725
+94761	054003	BARRABA (CLIFTON LANE)	Barraba	IDN60920	-30.3833	150.6083
+95740	055202	GUNNEDAH AIRPORT AWS	Gunnedah Airport	IDN60920	-30.9537	150.2494
+94740	055024	GUNNEDAH RESOURCE CENTRE	Gunnedah Resource Centre	IDN60920	-31.0261	150.2687
+95527	053115	MOREE AERO	Moree	IDN60920	-29.4898	149.8471
+94520	052020	MUNGINDI POST OFFICE	Mungindi	IDN60920	-28.9786	148.9899
+95734	054038	NARRABRI AIRPORT AWS	Narrabri	IDN60920	-30.3154	149.8302
+94544	054104	PINDARI DAM	Pindari Dam	IDN60920	-29.3899	151.2448
+95746	055049	QUIRINDI POST OFFICE	Quirindi	IDN60920	-31.5086	150.6793
+95762	055325	TAMWORTH AIRPORT AWS	Tamworth Airport	IDN60920	-31.0742	150.8362
+95715	052088	WALGETT AIRPORT AWS	Walgett	IDN60920	-30.0372	148.1223
+94792	055136	WOOLBROOK (WOOLBROOK ROAD)	Woolbrook	IDN60920	-30.9651	151.3505
+95747	061392	MURRURUNDI GAP AWS	Murrurundi Gap	IDN60920	-31.7416	150.7937
+94793	051162	BREWON AWS	Brewon	IDN60920	-30.2411	147.5327
+95708	050137	CONDOBOLIN AIRPORT AWS	Condobolin Airport	IDN60920	-33.0682	147.2133
+94728	064008	COONABARABRAN (SHOWGROUNDS)	Coonabarabran	IDN60920	-31.2786	149.2786
+95728	064017	COONABARABRAN AIRPORT AWS	Coonabarabran Airport	IDN60920	-31.3330	149.2699
+95718	051161	COONAMBLE AIRPORT AWS	Coonamble	IDN60920	-30.9776	148.3798
+95721	065111	COWRA AIRPORT AWS	Cowra	IDN60920	-33.8382	148.6540
+94715	065103	FORBES AIRPORT AWS	Forbes	IDN60920	-33.3627	147.9205
+94794	051164	GIRILAMBONE (OKEH) AWS	Girilambone	IDN60920	-31.0824	146.9296
+94725	073014	GRENFELL (MANGANESE RD)	Grenfell	IDN60920	-33.8934	148.1523
+94708	051039	NYNGAN AIRPORT	Nyngan	IDN60920	-31.5495	147.1961
+95717	065068	PARKES AIRPORT AWS	Parkes Airport	IDN60920	-33.1281	148.2428
+94721	050031	PEAK HILL POST OFFICE	Peak Hill	IDN60920	-32.7235	148.1902
+95722	073151	TEMORA AIRPORT	Temora	IDN60920	-34.4277	147.5117
+95710	051049	TRANGIE RESEARCH STATION AWS	Trangie	IDN60920	-31.9861	147.9489
+95709	050017	WEST WYALONG AIRPORT AWS	West Wyalong	IDN60920	-33.9382	147.1962
+94714	073142	COOTAMUNDRA AIRPORT	Cootamundra	IDN60920	-34.6299	148.0365
+94918	072043	TUMBARUMBA POST OFFICE	Tumbarumba	IDN60920	-35.7780	148.0122
+94712	073138	YOUNG AIRPORT	Young	IDN60920	-34.2493	148.2475
+95896	072160	ALBURY AIRPORT AWS	Albury	IDN60920	-36.0662	146.9530
+95895	074034	COROWA AIRPORT	Corowa	IDN60920	-35.9887	146.3574
+95869	074258	DENILIQUIN AIRPORT AWS	Deniliquin	IDN60920	-35.5575	144.9458
+95704	075041	GRIFFITH AIRPORT AWS	Griffith	IDN60920	-34.2489	146.0698
+94702	075019	HAY AIRPORT AWS	Hay Airport	IDN60920	-34.5412	144.8315
+94901	072023	HUME RESERVOIR	Hume Reservoir	IDN60920	-36.1039	147.0329
+94700	075032	HILLSTON AIRPORT	Hillston	IDN60920	-33.4915	145.5248
+95706	074148	NARRANDERA AIRPORT AWS	Narrandera Airport	IDN60920	-34.7050	146.5140
+94910	072150	WAGGA WAGGA AMO	Wagga Wagga	IDN60920	-35.1583	147.4575
+95705	074037	YANCO AGRICULTURAL INSTITUTE	Yanco	IDN60920	-34.6222	146.4327
+94691	047048	BROKEN HILL AIRPORT AWS	Broken Hill Airport	IDN60920	-32.0012	141.4694
+94692	047016	LAKE VICTORIA STORAGE	Lake Victoria	IDN60920	-34.0438	141.2676
+94694	047019	MENINDEE POST OFFICE	Menindee	IDN60920	-32.3937	142.4173
+94703	048245	BOURKE AIRPORT AWS	Bourke	IDN60920	-30.0362	145.9521
+95512	048015	BREWARRINA HOSPITAL	Brewarrina	IDN60920	-29.9614	146.8651
+94711	048027	COBAR MO	Cobar	IDN60920	-31.4840	145.8294
+94710	048237	COBAR AIRPORT AWS	Cobar Airport	IDN60920	-31.5388	145.7964
+94686	046128	FOWLERS GAP AWS	Fowlers Gap	IDN60920	-31.0863	141.7008
+94498	048243	LIGHTNING RIDGE VISITOR INFORMATION CENTRE	Lightning Ridge	IDN60920	-29.4310	147.9722
+95485	046126	TIBOOBURRA AIRPORT	Tibooburra Airport	IDN60920	-29.4448	142.0567
+95699	046129	WHITE CLIFFS AWS	White Cliffs AWS	IDN60920	-30.8522	143.0743
+95695	046012	WILCANNIA AERODROME AWS	Wilcannia Airport	IDN60920	-31.5194	143.3850
+95925	070349	MOUNT GININI AWS	Mount Ginini	IDN60920	-35.5293	148.7721
+94995	200839	LORD HOWE ISLAND AERO	Lord Howe Island	IDN60920	-31.5421	159.0786
+95995	200715	LORD HOWE ISLAND WINDY POINT	Lord Howe Island Windy Point	IDN60920	-31.5381	159.0733
+94996	200288	NORFOLK ISLAND AERO	Norfolk Island	IDN60920	-29.0389	167.9408
+94407	046136	BORRONA DOWNS AWS	Borrona Downs	IDN60920	-29.7614	143.1135
+94797	047113	MULURULU AWS	Mulurulu	IDN60920	-33.3392	143.4000
+94798	048250	NOONA AWS	Noona	IDN60920	-31.7267	144.9313
+94796	046142	SMITHVILLE AWS	Smithville	IDN60920	-30.0692	141.0067
+95682	049136	MOUNT HOPE AWS	Mount Hope	IDN60920	-32.8261	145.8801
+95686	063308	MARRANGAROO (DEFENCE)	Marrangaroo (Defence)	IDN60920	-33.4346	150.1350
+95707	075039	LAKE CARGELLIGO AIRPORT	Lake Cargelligo	IDN60920	-33.2832	146.3706
+99999	250099	PORTABLE NPWS NSW02	PORTABLE NPWS NSW02	IDN60920	-33.0980	150.0696
+99144	250103	PORTABLE NPWS NSW03	PORTABLE NPWS NSW03	IDN60920	-32.9968	150.6567
+99152	250129	PORTABLE NPWS NSW05	PORTABLE NPWS NSW05	IDN60920	-33.7876	150.6082
+99762	250069	TIDBINBILLA (PCS)	TIDBINBILLA	IDN60920	-35.4570	148.9351
+99763	250070	MULLION (PCS)	MULLION	IDN60920	-35.1067	148.8485
+99764	250071	KOWEN FOREST (PCS)	KOWEN FOREST	IDN60920	-35.3116	149.3161
+99765	250072	AFSD - GUDGENBY	GUDGENBY	IDN60920	-35.7345	148.9756
+99145	250104	ACT PCS1	ACT PCS1	IDN60920	-35.3260	149.0490
+99146	250105	ACT PCS2	ACT PCS2	IDN60920	-35.4145	149.0123
+99946	250146	AFSG (PCS3)	ACT PCS3	IDN60920	-35.4242	149.2883
+99109	250052	PORTABLE RFSNSW06	PORTABLE RFSNSW06	IDN60920	-35.2602	148.4768
+95936	086338	MELBOURNE (OLYMPIC PARK)	Melbourne (Olympic Park)	IDV60920	-37.8255	144.9816
+94866	086282	MELBOURNE AIRPORT	Melbourne Airport	IDV60920	-37.6654	144.8322
+94854	087113	AVALON AIRPORT	Avalon	IDV60920	-38.0288	144.4783
+94898	086361	CERBERUS	Cerberus	IDV60920	-38.3646	145.1785
+94864	086383	COLDSTREAM	Coldstream	IDV60920	-37.7239	145.4092
+95866	086038	ESSENDON AIRPORT	Essendon Airport	IDV60920	-37.7276	144.9066
+95872	086376	FAWKNER BEACON	Fawkner Beacon	IDV60920	-37.9483	144.9269
+94872	086266	FERNY CREEK	Ferny Creek	IDV60920	-37.8748	145.3497
+94876	086388	FRANKSTON (BALLAM PARK)	Frankston (Ballam Park)	IDV60920	-38.1517	145.1615
+94871	086371	FRANKSTON BEACH	Frankston Beach	IDV60920	-38.1480	145.1152
+94857	087184	GEELONG RACECOURSE	Geelong Racecourse	IDV60920	-38.1737	144.3766
+94865	087031	LAVERTON RAAF	Laverton	IDV60920	-37.8565	144.7565
+94870	086077	MOORABBIN AIRPORT	Moorabbin Airport	IDV60920	-37.9800	145.0962
+94847	087166	POINT WILSON	Point Wilson	IDV60920	-38.0958	144.5361
+94892	086373	RHYLL	Rhyll	IDV60920	-38.4612	145.3101
+95867	086104	SCORESBY RESEARCH INSTITUTE	Scoresby	IDV60920	-37.8710	145.2561
+94863	087168	SHE OAKS	She Oaks	IDV60920	-37.9075	144.1303
+94853	086344	SOUTH CHANNEL ISLAND	South Channel Island	IDV60920	-38.3065	144.8016
+95864	086220	ST KILDA HARBOUR - RMYS	St Kilda Harbour RMYS	IDV60920	-37.8640	144.9639
+95874	086068	VIEWBANK	Viewbank	IDV60920	-37.7408	145.0972
+94826	090184	CAPE NELSON LIGHTHOUSE	Cape Nelson	IDV60920	-38.4306	141.5437
+94842	090015	CAPE OTWAY LIGHTHOUSE	Cape Otway	IDV60920	-38.8557	143.5130
+94846	090180	AIREYS INLET	Aireys Inlet	IDV60920	-38.4583	144.0883
+94949	200838	HOGAN ISLAND	Hogan Island	IDV60920	-39.2225	146.9841
+94933	084016	GABO ISLAND LIGHTHOUSE	Gabo Island	IDV60920	-37.5679	149.9158
+95904	084150	LAKES ENTRANCE (EASTERN BEACH ROAD)	Lakes Entrance	IDV60920	-37.8717	148.0060
+94834	089085	ARARAT PRISON	Ararat	IDV60920	-37.2769	142.9786
+95839	079100	HORSHAM AERODROME	Horsham	IDV60920	-36.6699	142.1733
+94906	083085	MOUNT HOTHAM	Mount Hotham	IDV60920	-36.9772	147.1342
+94908	083090	OMEO	Omeo	IDV60920	-37.1017	147.6008
+95918	084145	ORBOST	Orbost	IDV60920	-37.6922	148.4667
+94830	090175	PORT FAIRY AWS	Port Fairy	IDV60920	-38.3906	142.2348
+94875	081125	SHEPPARTON AIRPORT	Shepparton	IDV60920	-36.4288	145.3949
+95831	076064	WALPEUP RESEARCH	Walpeup	IDV60920	-35.1201	142.0040
+94839	080128	CHARLTON	Charlton	IDV60920	-36.2846	143.3341
+94838	077010	HOPETOUN AIRPORT	Hopetoun Airport	IDV60920	-35.7151	142.3569
+94844	080023	KERANG	Kerang	IDV60920	-35.7466	143.9350
+94693	076031	MILDURA AIRPORT	Mildura	IDV60920	-34.2358	142.0867
+94843	077094	SWAN HILL AERODROME	Swan Hill	IDV60920	-35.3766	143.5416
+95835	079028	LONGERENONG	Longerenong	IDV60920	-36.6722	142.2991
+94827	078015	NHILL AERODROME	Nhill Aerodrome	IDV60920	-36.3093	141.6486
+94836	079105	STAWELL AERODROME	Stawell	IDV60920	-37.0720	142.7402
+94920	078018	WARRACKNABEAL AIRPORT	Warracknabeal Airport	IDV60920	-36.3203	142.4161
+95832	079099	EDENHOPE AIRPORT	Edenhope	IDV60920	-37.0222	141.2657
+95827	079097	KANAGULK	Kanagulk	IDV60920	-37.1169	141.8031
+94855	081123	BENDIGO AIRPORT	Bendigo	IDV60920	-36.7411	144.3274
+94861	080015	ECHUCA AERODROME	Echuca	IDV60920	-36.1639	144.7639
+95833	080091	KYABRAM	Kyabram	IDV60920	-36.3350	145.0638
+94874	088109	MANGALORE AIRPORT	Mangalore	IDV60920	-36.8886	145.1859
+95843	082042	STRATHBOGIE	Strathbogie	IDV60920	-36.8472	145.7307
+95836	081049	TATURA INST SUSTAINABLE AG	Tatura	IDV60920	-36.4379	145.2673
+94862	081124	YARRAWONGA	Yarrawonga	IDV60920	-36.0294	146.0305
+94884	082170	BENALLA AIRPORT	Benalla	IDV60920	-36.5522	145.9977
+95838	083083	EDI UPPER	Edi Upper	IDV60920	-36.7396	146.4671
+94903	083084	FALLS CREEK	Falls Creek	IDV60920	-36.8708	147.2755
+94878	082139	HUNTERS HILL	Hunters Hill	IDV60920	-36.2137	147.5395
+94888	082076	DARTMOUTH RESERVOIR	Lake Dartmouth	IDV60920	-36.5352	147.4984
+94894	083024	MOUNT BULLER	Mount Buller	IDV60920	-37.1450	146.4394
+95837	082039	RUTHERGLEN RESEARCH	Rutherglen	IDV60920	-36.1048	146.5094
+94889	082138	WANGARATTA AERO	Wangaratta	IDV60920	-36.4205	146.3056
+94882	088023	LAKE EILDON	Lake Eildon	IDV60920	-37.2313	145.9124
+94905	083055	MOUNT HOTHAM AIRPORT	Mount Hotham Airport	IDV60920	-37.0491	147.3347
+94912	085279	BAIRNSDALE AIRPORT	Bairnsdale	IDV60920	-37.8818	147.5669
+94914	084143	COMBIENBAR AWS	Combienbar	IDV60920	-37.3416	149.0227
+94913	084142	GELANTIPY	Gelantipy	IDV60920	-37.2200	148.2626
+94935	084084	MALLACOOTA	Mallacoota	IDV60920	-37.5976	149.7289
+94930	084144	MOUNT NOWA NOWA	Mount Nowa Nowa	IDV60920	-37.6924	148.0908
+95907	085314	EAST SALE AIRPORT	East Sale Airport	IDV60920	-38.1016	147.1398
+94891	085280	LATROBE VALLEY AIRPORT	Latrobe Valley	IDV60920	-38.2094	146.4746
+95901	085291	MOUNT BAW BAW	Mount Baw Baw	IDV60920	-37.8384	146.2747
+95913	085296	MOUNT MOORNAPA	Mount Moornapa	IDV60920	-37.7481	147.1428
+99806	085313	NILMA NORTH (WARRAGUL)	Warragul (Nilma North)	IDV60920	-38.1321	145.9865
+94893	085096	WILSONS PROMONTORY LIGHTHOUSE	Wilsons Promontory	IDV60920	-39.1297	146.4246
+95890	085151	YARRAM AIRPORT	Yarram Airport	IDV60920	-38.5647	146.7479
+94852	089002	BALLARAT AERODROME	Ballarat	IDV60920	-37.5127	143.7911
+94886	085099	POUND CREEK	Pound Creek	IDV60920	-38.6297	145.8107
+94859	088051	REDESDALE	Redesdale	IDV60920	-37.0194	144.5203
+94881	088164	EILDON FIRE TOWER	Eildon Fire Tower	IDV60920	-37.2091	145.8423
+94860	088162	KILMORE GAP	Kilmore Gap	IDV60920	-37.3807	144.9654
+94849	088043	MARYBOROUGH	Maryborough	IDV60920	-37.0560	143.7320
+94858	088167	PUCKAPUNYAL LYON HILL (DEFENCE)	Puckapunyal-Lyon Hill (Defence)	IDV60920	-36.9381	145.0539
+94856	088166	PUCKAPUNYAL WEST (DEFENCE)	Puckapunyal West (Defence)	IDV60920	-37.0177	144.8546
+94835	079101	BEN NEVIS	Ben Nevis	IDV60920	-37.2281	143.2005
+95825	090182	CASTERTON	Casterton	IDV60920	-37.5830	141.3339
+95822	090194	DARTMOOR	Dartmoor	IDV60920	-37.9222	141.2614
+94829	090173	HAMILTON AIRPORT	Hamilton	IDV60920	-37.6486	142.0636
+94840	090176	MORTLAKE RACECOURSE	Mortlake	IDV60920	-38.0737	142.7744
+95845	090035	MOUNT GELLIBRAND	Mount Gellibrand	IDV60920	-38.2333	143.7924
+94833	079103	MOUNT WILLIAM	Mount William	IDV60920	-37.2950	142.6039
+95941	087185	POINT COOK RAAF	Point Cook	IDV60920	-37.9273	144.7566
+94828	090171	PORTLAND AIRPORT	Portland Airport	IDV60920	-38.3148	141.4705
+95826	090192	PORTLAND NTC AWS	Portland Harbour	IDV60920	-38.3439	141.6136
+94837	090186	WARRNAMBOOL AIRPORT NDB	Warrnambool	IDV60920	-38.2869	142.4524
+95840	089112	WESTMERE	Westmere	IDV60920	-37.7067	142.9378
+99813	250130	CRESSY (CFA)	Cressy (CFA)	IDV60920	-38.0477	143.6496
+94648	023000	ADELAIDE (WEST TERRACE / NGAYIRDAPIRA)	Adelaide (West Terrace /  ngayirdapira)	IDS60920	-34.9257	138.5832
+95652	018207	THEVENARD NTC AWS	Thevenard	IDS60920	-32.1490	133.6416
+94656	018069	ELLISTON	Elliston	IDS60920	-33.6501	134.8880
+94804	018115	NEPTUNE ISLAND	Neptune Island	IDS60920	-35.3365	136.1174
+94666	022053	WARBURTO POINT	Warburto Point	IDS60920	-34.0041	137.5280
+94822	022803	CAPE WILLOUGHBY	Cape Willoughby	IDS60920	-35.8426	138.1327
+94813	026095	THE LIMESTONE	Cape Jaffa	IDS60920	-36.9655	139.7164
+94677	023894	HINDMARSH ISLAND AWS	Hindmarsh Island	IDS60920	-35.5194	138.8177
+95667	021131	CLARE HIGH SCHOOL	Clare	IDS60920	-33.8226	138.5933
+94661	018014	CLEVE	Cleve	IDS60920	-33.7011	136.4937
+94662	018116	CLEVE AERODROME	Cleve Airport	IDS60920	-33.7081	136.5026
+94674	017110	LEIGH CREEK AIRPORT	Leigh Creek	IDS60920	-30.5963	138.4219
+95481	017123	MOOMBA AIRPORT	Moomba Airport	IDS60920	-28.0997	140.1956
+94660	016067	MOUNT IVE	Mount Ive	IDS60920	-32.4398	136.0671
+94820	026099	NARACOORTE AERODROME	Naracoorte	IDS60920	-36.9813	140.7270
+94681	023373	NURIOOTPA PIRSA	Nuriootpa	IDS60920	-34.4761	139.0056
+95666	018201	PORT AUGUSTA AERO	Port Augusta	IDS60920	-32.5073	137.7169
+99749	021139	PORT PIRIE AERODROME AWS	Port Pirie Airport AWS	IDS60920	-33.2371	137.9971
+95671	023122	ROSEWORTHY AWS	Roseworthy	IDS60920	-34.5106	138.6763
+95806	022049	STENHOUSE BAY	Stenhouse Bay	IDS60920	-35.2795	136.9392
+94814	024580	STRATHALBYN RACECOURSE	Strathalbyn	IDS60920	-35.2836	138.8934
+94655	016098	TARCOOLA AERO	Tarcoola	IDS60920	-30.7051	134.5786
+95813	025006	KAROONDA	Karoonda	IDS60920	-35.0900	139.8972
+94672	023034	ADELAIDE AIRPORT	Adelaide Airport	IDS60920	-34.9524	138.5196
+95677	023013	PARAFIELD AIRPORT	Parafield	IDS60920	-34.7977	138.6281
+94809	022046	EDITHBURGH	Edithburgh	IDS60920	-35.1121	137.7395
+94685	022050	KADINA AWS	Kadina	IDS60920	-33.9703	137.6628
+94665	022008	MAITLAND	Maitland	IDS60920	-34.3745	137.6733
+95659	022031	MINLATON AERO	Minlaton Airport	IDS60920	-34.7480	137.5276
+95807	022841	KINGSCOTE AERO	Kingscote	IDS60920	-35.7114	137.5231
+94807	022843	PARNDANA CFS AWS	Parndana	IDS60920	-35.7916	137.2496
+95805	022823	CAPE BORDA	Cape Borda	IDS60920	-35.7549	136.5959
+94816	025507	KEITH	Keith	IDS60920	-36.0980	140.3556
+95815	025557	MUNKORA	Keith West	IDS60920	-36.1058	140.3273
+94817	026091	COONAWARRA	Coonawarra	IDS60920	-37.2906	140.8254
+94812	026026	ROBE	Robe	IDS60920	-37.1628	139.7560
+94821	026021	MOUNT GAMBIER AERO	Mount Gambier	IDS60920	-37.7473	140.7739
+95816	026105	ROBE AIRFIELD	Robe Airport	IDS60920	-37.1776	139.8054
+95823	026100	PADTHAWAY SOUTH	Padthaway	IDS60920	-36.6539	140.5212
+94682	024024	LOXTON RESEARCH CENTRE	Loxton	IDS60920	-34.4390	140.5978
+95687	024048	RENMARK AERO	Renmark Airport	IDS60920	-34.1983	140.6766
+95818	024584	PALLAMANA AERODROME	Pallamana	IDS60920	-35.0650	139.2273
+94690	025562	AUSTIN PLAINS	Lameroo AWS	IDS60920	-35.3778	140.5378
+95812	024521	MURRAY BRIDGE	Murray Bridge	IDS60920	-35.1234	139.2592
+94680	024511	EUDUNDA	Eudunda	IDS60920	-34.1773	139.0903
+95670	021133	RAYVILLE PARK	Snowtown	IDS60920	-33.7675	138.2182
+94679	019062	YONGALA	Yongala	IDS60920	-33.0276	138.7560
+94673	019017	HAWKER	Hawker	IDS60920	-31.9043	138.4388
+94653	018012	CEDUNA AMO	Ceduna	IDS60920	-32.1297	133.6976
+94657	018044	KYANCUTTA	Kyancutta	IDS60920	-33.1337	135.5521
+95662	018195	MINNIPA PIRSA	Minnipa RS	IDS60920	-32.8427	135.1515
+94651	018106	NULLARBOR	Nullarbor	IDS60920	-31.4492	130.8976
+94654	018079	STREAKY BAY	Streaky Bay	IDS60920	-32.8084	134.1979
+95654	018083	WUDINNA AERO	Wudinna Airport	IDS60920	-33.0430	135.4519
+94668	018040	KIMBA	Kimba	IDS60920	-33.1416	136.4126
+95664	018120	WHYALLA AERO	Whyalla	IDS60920	-33.0539	137.5206
+95663	018217	CUMMINS AERO	Cummins Airport	IDS60920	-34.2524	135.7135
+95649	018230	POINT AVOID	Point Avoid	IDS60920	-34.6750	135.3362
+95661	018192	PORT LINCOLN AWS	Port Lincoln Airport	IDS60920	-34.5993	135.8784
+95660	016065	ANDAMOOKA	Andamooka	IDS60920	-30.4490	137.1692
+95458	016090	COOBER PEDY AIRPORT	Coober Pedy Airport	IDS60920	-29.0347	134.7222
+94474	016097	PUKATJA	Ernabella/Pukatja	IDS60920	-26.2635	132.1771
+95658	016096	OLYMPIC DAM AERODROME	Roxby Downs	IDS60920	-30.4869	136.8739
+94659	016001	WOOMERA AERODROME	Woomera	IDS60920	-31.1558	136.8054
+95668	020028	GLUEPOT	Gluepot	IDS60920	-33.7622	140.1251
+95480	017126	MARREE AERO	Marree Airport	IDS60920	-29.6587	138.0684
+94476	017043	OODNADATTA AIRPORT	Oodnadatta	IDS60920	-27.5553	135.4456
+94684	020062	YUNTA AIRSTRIP	Yunta	IDS60920	-32.5707	139.5645
+95675	023052	BLACK POLE	Outer Harbor (Black Pole)	IDS60920	-34.7343	138.4653
+94811	023875	SECOND VALLEY FOREST AWS	Parawa West	IDS60920	-35.5695	138.2864
+95679	023886	MOUNT TERRIBLE RADAR	Sellicks Hill	IDS60920	-35.3294	138.5019
+95811	023804	ENCOUNTER BAY	Victor Harbor	IDS60920	-35.5544	138.5997
+95676	023083	EDINBURGH RAAF	Edinburgh	IDS60920	-34.7111	138.6223
+94683	023887	KUITPO FOREST RESERVE	Kuitpo	IDS60920	-35.1712	138.6783
+94806	023733	MOUNT BARKER	Mount Barker	IDS60920	-35.0732	138.8466
+94678	023878	MOUNT CRAWFORD AWS	Mount Crawford	IDS60920	-34.7253	138.9278
+94576	040913	BRISBANE	Brisbane	IDQ60920	-27.4808	153.0389
+94578	040842	BRISBANE AERO	Brisbane Airport	IDQ60920	-27.3917	153.1292
+94568	040004	AMBERLEY AMO	Amberley	IDQ60920	-27.6297	152.7111
+94575	040211	ARCHERFIELD AIRPORT	Archerfield	IDQ60920	-27.5716	153.0071
+94591	040925	BANANA BANK NORTH BEACON	Banana Bank	IDQ60920	-27.5327	153.3333
+95566	040284	BEERBURRUM FOREST STATION	Beerburrum	IDQ60920	-26.9586	152.9619
+95575	040983	BEAUDESERT DRUMLEY STREET	Beaudesert AWS	IDQ60920	-27.9707	152.9898
+94418	140008	CANUNGRA (DEFENCE)	Canungra (Defence)	IDQ60920	-28.0437	153.1871
+94594	040043	CAPE MORETON LIGHTHOUSE	Cape Moreton	IDQ60920	-27.0314	153.4661
+94584	040068	DOUBLE ISLAND POINT LIGHTHOUSE	Double Island  Point	IDQ60920	-25.9319	153.1906
+94562	040082	UNIVERSITY OF QUEENSLAND GATTON	Gatton	IDQ60920	-27.5436	152.3375
+94580	040764	GOLD COAST SEAWAY	Gold Coast Seaway	IDQ60920	-27.9390	153.4283
+94419	140009	GREENBANK (DEFENCE)	Greenbank (Defence)	IDQ60920	-27.6932	152.9935
+94566	040093	GYMPIE	Gympie	IDQ60920	-26.1831	152.6414
+94590	040926	INNER RECIPROCAL MARKER	Inner Beacon	IDQ60920	-27.2633	153.2419
+94549	040922	KINGAROY AIRPORT	Kingaroy	IDQ60920	-26.5737	151.8398
+94272	032195	MOUNT STUART (DEFENCE)	Mount Stuart - Defence	IDQ60920	-19.4082	146.7620
+95572	040988	NAMBOUR DAFF - HILLSIDE	Nambour	IDQ60920	-26.6442	152.9383
+94552	041359	OAKEY AERO	Oakey	IDQ60920	-27.4034	151.7413
+94593	040209	POINT LOOKOUT	Point Lookout	IDQ60920	-27.4361	153.5456
+95591	040958	REDCLIFFE	Redcliffe	IDQ60920	-27.2169	153.0922
+94561	140007	REDLAND (ALEXANDRA HILLS)	Redland (Alexandra Hills)	IDQ60920	-27.5433	153.2394
+94569	040861	SUNSHINE COAST AIRPORT	Sunshine Coast Airport	IDQ60920	-26.5990	153.0912
+94570	040908	TEWANTIN RSL PARK	Tewantin	IDQ60920	-26.3911	153.0403
+94420	140010	TIN CAN BAY (DEFENCE)	Tin Can Bay (Defence)	IDQ60920	-25.9351	152.9647
+95551	041529	TOOWOOMBA AIRPORT	Toowoomba	IDQ60920	-27.5425	151.9134
+94555	041525	WARWICK	Warwick	IDQ60920	-28.2061	152.1003
+99435	541150	WELLCAMP AIRPORT	Wellcamp Airport	IDQ60920	-27.5517	151.7845
+94182	027054	COCONUT ISLAND	Coconut Island	IDQ60920	-10.0511	143.0686
+94183	027073	COEN AIRPORT	Coen Airport	IDQ60920	-13.7606	143.1183
+94268	029038	KOWANYAMA AIRPORT	Kowanyama	IDQ60920	-15.4818	141.7483
+94387	039128	BUNDABERG AERO	Bundaberg	IDQ60920	-24.9069	152.3230
+95543	039066	GAYNDAH AIRPORT	Gayndah	IDQ60920	-25.6167	151.6156
+95565	040405	HERVEY BAY AIRPORT	Hervey Bay	IDQ60920	-25.3220	152.8817
+94388	039059	LADY ELLIOT ISLAND	Lady Elliot Island	IDQ60920	-24.1116	152.7161
+94567	040126	MARYBOROUGH	Maryborough	IDQ60920	-25.5132	152.7152
+94254	029182	MORNINGTON ISLAND AIRPORT	Mornington Island Airport	IDQ60920	-16.6620	139.1655
+94384	039314	SEVENTEEN SEVENTY	Seventeen Seventy	IDQ60920	-24.1568	151.8889
+94266	029063	NORMANTON AIRPORT	Normanton	IDQ60920	-17.6872	141.0733
+94257	029139	SWEERS ISLAND	Sweers Island	IDQ60920	-17.1142	139.5981
+94261	029167	CENTURY MINE	Century Mine	IDQ60920	-18.7569	138.7056
+94356	034084	CHARTERS TOWERS AIRPORT COMPARISON	Charters Towers	IDQ60920	-20.0427	146.2716
+94274	030124	GEORGETOWN AIRPORT	Georgetown Airport	IDQ60920	-18.3039	143.5306
+94343	030022	HUGHENDEN AIRPORT	Hughenden	IDQ60920	-20.8192	144.2333
+94341	030161	RICHMOND AIRPORT	Richmond	IDQ60920	-20.7001	143.1137
+94284	200879	ARLINGTON REEF	Arlington Reef	IDQ60920	-16.7226	146.1124
+94174	027058	HORN ISLAND	Horn Island	IDQ60920	-10.5844	142.2900
+94181	200892	TORRES STRAIT NTC AWS	Thursday Island	IDQ60920	-10.5865	142.2219
+94287	031011	CAIRNS AERO	Cairns	IDQ60920	-16.8736	145.7458
+94288	031222	CAIRNS RACECOURSE	Cairns Racecourse	IDQ60920	-16.9463	145.7474
+94188	031213	CAPE FLATTERY	Cape Flattery	IDQ60920	-14.9672	145.3106
+94292	032004	CARDWELL MARINE PDE	Cardwell	IDQ60920	-18.2544	146.0192
+95283	031209	COOKTOWN AIRPORT	Cooktown	IDQ60920	-15.4461	145.1861
+99218	032194	COWLEY BEACH (DEFENCE)	Cowley Beach (Defence)	IDQ60920	-17.6905	146.1126
+94280	032197	INNISFAIL AERODROME	Innisfail Aero	IDQ60920	-17.5581	146.0119
+94285	031037	LOW ISLES LIGHTHOUSE	Low Isles	IDQ60920	-16.3842	145.5592
+94295	032141	LUCINDA POINT	Lucinda	IDQ60920	-18.5203	146.3861
+95286	031210	MAREEBA AIRPORT	Mareeba	IDQ60920	-17.0704	145.4293
+95292	032037	SOUTH JOHNSTONE EXP STN	South Johnstone	IDQ60920	-17.6053	145.9972
+94186	028008	LOCKHART RIVER AIRPORT	Lockhart River	IDQ60920	-12.7850	143.3047
+95296	033295	ALVA BEACH	Alva Beach	IDQ60920	-19.4569	147.4833
+95295	033002	AYR DPI RESEARCH STN	Ayr	IDQ60920	-19.6169	147.3758
+94383	033327	BOWEN AIRPORT AWS	Bowen Airport AWS	IDQ60920	-20.0153	148.2138
+94004	032200	INGHAM AERO	Ingham Aerodrome	IDQ60920	-18.6651	146.1467
+94294	032040	TOWNSVILLE AERO	Townsville	IDQ60920	-19.2483	146.7661
+94271	032196	TOWNSVILLE- AIR WEAPONS RANGE (DEFENCE)	Townsville Air Weapons Range (Defence)	IDQ60920	-19.3048	146.2438
+94273	033328	TOWNSVILLE- FANNING RIVER (DEFENCE)	Townsville - Fanning River (Defence)	IDQ60920	-19.7830	146.5000
+95293	033307	WOOLSHED	Woolshed	IDQ60920	-19.4168	146.5362
+94360	033013	COLLINSVILLE POST OFFICE	Collinsville	IDQ60920	-20.5533	147.8464
+94368	033106	HAMILTON ISLAND AIRPORT	Hamilton Island	IDQ60920	-20.3658	148.9536
+94367	033119	MACKAY M.O	Mackay	IDQ60920	-21.1172	149.2169
+94352	033329	OORALEA RACECOURSE (MACKAY TURF CLUB)	Mackay Racecourse	IDQ60920	-21.1700	149.1515
+95367	033045	MACKAY AERO	Mackay Airport	IDQ60920	-21.1706	149.1794
+94372	200001	MIDDLE PERCY ISLAND	Middle Percy Island	IDQ60920	-21.6628	150.2711
+94365	033247	PROSERPINE AIRPORT	Proserpine	IDQ60920	-20.4925	148.5550
+94376	039089	THANGOOL AIRPORT	Biloela	IDQ60920	-24.4935	150.5709
+94380	039123	GLADSTONE RADAR	Gladstone	IDQ60920	-23.8553	151.2628
+94381	039326	GLADSTONE AIRPORT	Gladstone Airport	IDQ60920	-23.8697	151.2214
+94386	039122	HERON ISLAND RES STN	Heron Island	IDQ60920	-23.4417	151.9125
+95298	033208	ROSSLYN BAY NTC AWS	Rosslyn Bay Harbour	IDQ60920	-23.1610	150.7901
+94374	039083	ROCKHAMPTON AERO	Rockhampton	IDQ60920	-23.3753	150.4775
+94378	039322	RUNDLE ISLAND	Rundle Island	IDQ60920	-23.5322	151.2771
+94276	028004	PALMERVILLE	Palmerville	IDQ60920	-15.9999	144.0754
+95369	033210	ST LAWRENCE	St Lawrence	IDQ60920	-22.3472	149.5242
+95370	033195	WILLIAMSON	Williamson	IDQ60920	-22.4703	150.1786
+94370	033308	SAMUEL HILL AERO	Samuel Hill	IDQ60920	-22.7433	150.6578
+94373	033294	YEPPOON THE ESPLANADE	Yeppoon	IDQ60920	-23.1364	150.7506
+94398	035134	BLACKWATER AIRPORT	Blackwater Airport	IDQ60920	-23.6015	148.8074
+94395	035124	CLERMONT AIRPORT	Clermont Airport	IDQ60920	-22.7756	147.6217
+94363	035264	EMERALD AIRPORT	Emerald	IDQ60920	-23.5694	148.1756
+94399	035139	LOCHINGTON	Lochington	IDQ60920	-23.9424	147.5250
+94397	034035	MORANBAH AIRPORT	Moranbah Airport	IDQ60920	-22.0644	148.0758
+94396	035129	ROLLESTON AIRPORT	Rolleston Airport	IDQ60920	-24.4617	148.6264
+94171	027075	SCHERGER RAAF	Scherger	IDQ60920	-12.6167	142.0869
+95362	035065	SPRINGSURE COMET ST	Springsure	IDQ60920	-24.1230	148.0856
+94525	035070	TAROOM POST OFFICE	Taroom	IDQ60920	-25.6408	149.7958
+94350	036007	BARCALDINE POST OFFICE	Barcaldine	IDQ60920	-23.5544	145.2883
+95351	036034	BLACKALL AIRPORT	Blackall	IDQ60920	-24.4303	145.4306
+94345	036026	ISISFORD POST OFFICE	Isisford	IDQ60920	-24.2591	144.4406
+94346	036031	LONGREACH AERO	Longreach	IDQ60920	-23.4397	144.2828
+94355	035069	TAMBO POST OFFICE	Tambo	IDQ60920	-24.8819	146.2564
+94342	037039	WINTON AIRPORT	Winton	IDQ60920	-22.3617	143.0836
+94255	037010	CAMOOWEAL TOWNSHIP	Camooweal	IDQ60920	-19.9225	138.1214
+94335	029141	CLONCURRY AIRPORT	Cloncurry	IDQ60920	-20.6664	140.5050
+94170	027045	WEIPA AERO	Weipa	IDQ60920	-12.6778	141.9208
+94337	029058	JULIA CREEK AIRPORT	Julia Creek	IDQ60920	-20.6672	141.7214
+94348	029181	LAKE JULIUS AWS	Lake Julius	IDQ60920	-20.1167	139.7256
+94332	029127	MOUNT ISA AERO	Mount Isa	IDQ60920	-20.6778	139.4875
+94344	037058	URANDANGI AERODROME	Urandangi	IDQ60920	-21.5979	138.3665
+94347	037053	CARTERS BORE	Carters Bore	IDQ60920	-20.9358	139.2964
+94349	037059	NEW MAY DOWNS	New May Downs	IDQ60920	-20.5900	139.3411
+94336	037034	THE MONUMENT AIRPORT	The Monument	IDQ60920	-21.8125	139.9267
+94338	037036	TREPELL AIRPORT	Trepell	IDQ60920	-21.8400	140.8925
+95487	045009	BALLERA GAS FIELD	Ballera	IDQ60920	-27.4008	141.8114
+94334	038000	BEDOURIE	Bedourie	IDQ60920	-24.3597	139.4714
+94333	038003	BOULIA AIRPORT	Boulia	IDQ60920	-22.9117	139.9039
+95482	038026	BIRDSVILLE AIRPORT	Birdsville	IDQ60920	-25.8975	139.3472
+94260	029077	BURKETOWN AIRPORT	Burketown Airport	IDQ60920	-17.7483	139.5356
+95492	045025	THARGOMINDAH AIRPORT	Thargomindah	IDQ60920	-27.9867	143.8150
+94489	038076	WINDORAH AIRPORT	Windorah	IDQ60920	-25.4117	142.6647
+94510	044021	CHARLEVILLE AERO	Charleville	IDQ60920	-26.4139	146.2558
+94500	044026	CUNNAMULLA POST OFFICE	Cunnamulla	IDQ60920	-28.0689	145.6822
+94511	043015	INJUNE POST OFFICE	Injune	IDQ60920	-25.8428	148.5669
+94514	043020	MITCHELL POST OFFICE	Mitchell	IDQ60920	-26.4888	147.9777
+94515	043091	ROMA AIRPORT	Roma	IDQ60920	-26.5477	148.7710
+94517	043109	ST GEORGE AIRPORT	St George	IDQ60920	-28.0478	148.5957
+94521	043035	SURAT	Surat	IDQ60920	-27.1591	149.0702
+94553	041175	APPLETHORPE	Applethorpe	IDQ60920	-28.6217	151.9533
+94542	041522	DALBY AIRPORT	Dalby	IDQ60920	-27.1605	151.2633
+99468	041560	GOONDIWINDI AIRPORT	Goondiwindi	IDQ60920	-28.5226	150.3223
+95529	042112	MILES CONSTANCE STREET	Miles	IDQ60920	-26.6569	150.1819
+94550	041095	STANTHORPE LESLIE PARADE	Stanthorpe	IDQ60920	-28.6617	151.9339
+95533	041100	TEXAS POST OFFICE	Texas	IDQ60920	-28.8544	151.1681
+95288	200840	BOUGAINVILLE REEF	Bougainville Reef	IDQ60920	-15.4877	147.1183
+94394	200601	CATO ISLAND	Cato Island	IDQ60920	-23.2503	155.5420
+94371	200736	CREAL REEF	Creal Reef	IDQ60920	-20.5303	150.3773
+94290	200783	FLINDERS REEF	Flinders Reef	IDQ60920	-17.7195	148.4478
+94393	200701	FREDERICK REEF	Frederick Reef	IDQ60920	-20.9375	154.4019
+94379	200831	GANNET CAY	Gannett Cay	IDQ60920	-21.9769	152.4707
+94289	200732	HOLMES REEF	Holmes Reef	IDQ60920	-16.4683	147.8734
+94293	200880	LIHOU REEF LIGHTHOUSE	Lihou Reef Lighthouse	IDQ60920	-17.1330	152.1450
+94298	200704	MARION REEF	Marion Reef	IDQ60920	-19.0964	152.3892
+94299	200283	WILLIS ISLAND	Willis Island	IDQ60920	-16.2878	149.9652
+99496	200896	NORTH WEST 10 BEACON	North West 10 Beacon	IDQ60920	-27.0000	153.2420
+99497	200897	HOPE BANKS BEACON	Hope Banks Beacon	IDQ60920	-27.4344	153.2904
+94120	014015	DARWIN AIRPORT	Darwin Airport	IDD60920	-12.4239	130.8925
+94125	014272	BATCHELOR AIRPORT	Batchelor	IDD60920	-13.0544	131.0252
+99510	014031	CHARLES POINT	Charles Point	IDD60920	-12.3895	130.6306
+94122	200731	POINT FAWCETT	Point Fawcett	IDD60920	-11.7628	130.0300
+94127	014254	POINT STUART	Point Stuart	IDD60920	-12.2403	131.8785
+94137	014198	JABIRU AIRPORT	Jabiru	IDD60920	-12.6592	132.8940
+94161	014982	KANGAROO FLATS (DEFENCE)	Kangaroo Flats	IDD60920	-12.7934	130.8542
+94135	014274	MCCLUER ISLAND	McCluer Island	IDD60920	-11.0468	132.9791
+95111	014948	PORT KEATS AIRPORT	Wadeye (Port Keats)	IDD60920	-14.2494	129.5282
+94131	014932	TINDAL RAAF	Tindal	IDD60920	-14.5229	132.3826
+94130	014954	BRADSHAW	Bradshaw	IDD60920	-14.9408	130.8091
+94147	200786	CAPE WESSEL	Cape Wessel	IDD60920	-11.0047	136.7586
+94150	014412	GOVE AIRPORT	Gove Airport	IDD60920	-12.2684	136.8188
+94153	014518	GROOTE EYLANDT AIRPORT	Groote Eylandt Airport	IDD60920	-13.9746	136.4630
+95142	014405	MANINGRIDA AIRPORT	Maningrida Airport	IDD60920	-12.0569	134.2339
+94162	014983	MOUNT BUNDEY NORTH (DEFENCE)	Mount Bundey North	IDD60920	-12.9141	131.8663
+94112	014984	MOUNT BUNDEY SOUTH (DEFENCE)	Mount Bundey South	IDD60920	-13.0889	131.8478
+94140	014404	MILINGIMBI AIRPORT	Milingimbi	IDD60920	-12.0932	134.8919
+95146	014517	NGAYAWILI	Ngayawili (Elcho Island)	IDD60920	-11.9971	135.5726
+94139	014401	WARRUWI AIRPORT	Warruwi	IDD60920	-11.6500	133.3797
+94152	014723	BORROLOOLA AIRPORT	Borroloola	IDD60920	-16.0755	136.3041
+94143	014627	BULMAN	Bulman	IDD60920	-13.6715	134.3415
+94248	014703	CENTRE ISLAND	Centre Island	IDD60920	-15.7426	136.8192
+94234	014626	DALY WATERS AIRSTRIP	Daly Waters	IDD60920	-16.2637	133.3782
+94239	014704	MCARTHUR RIVER MINE AIRPORT	McArthur River Mine	IDD60920	-16.4423	136.0760
+94121	014253	CHANNEL POINT	Channel Point	IDD60920	-13.1672	130.1226
+94141	014909	CENTRAL ARNHEM PLATEAU	Central Arnhem Plateau	IDD60920	-13.3275	133.0861
+94231	014829	LAJAMANU AIRPORT	Lajamanu	IDD60920	-18.3324	130.6361
+94232	014825	VICTORIA RIVER DOWNS	Victoria River Downs	IDD60920	-16.4030	131.0145
+94236	015131	ELLIOTT	Elliott	IDD60920	-17.5552	133.5439
+94116	014277	DUM IN MIRRIE AIRSTRIP	Dum In Mirrie	IDD60920	-12.6350	130.3725
+94238	015135	TENNANT CREEK AIRPORT	Tennant Creek	IDD60920	-19.6423	134.1833
+94326	015590	ALICE SPRINGS AIRPORT	Alice Springs Airport	IDD60920	-23.7951	133.8890
+94463	015511	CURTIN SPRINGS	Curtin Springs	IDD60920	-25.3139	131.7571
+94327	015602	JERVOIS	Jervois	IDD60920	-22.9494	136.1442
+94321	015664	WALUNGURRU AIRPORT	Walungurru (Kintore)	IDD60920	-23.2656	129.3844
+95322	015666	RABBIT FLAT	Rabbit Flat	IDD60920	-20.1823	130.0148
+94328	015643	TERRITORY GRAPE FARM	Territory Grape Farm	IDD60920	-22.4518	133.6377
+94323	015652	WATARRKA	Watarrka	IDD60920	-24.2918	131.5490
+94462	015635	YULARA AIRPORT	Yulara	IDD60920	-25.1896	130.9737
+95121	014041	MIDDLE POINT	Middle Point	IDD60920	-12.6050	131.2988
+94225	014949	DELAMERE WEAPONS RANGE	Delamere	IDD60920	-15.7441	131.9181
+94105	014314	NOONAMAH AIRSTRIP	Noonamah	IDD60920	-12.6099	131.0474
+94128	014901	DOUGLAS RIVER RESEARCH FARM	Douglas River	IDD60920	-13.8345	131.1872
+94119	014142	PIRLANGIMPI AIRPORT	Pirlangimpi	IDD60920	-11.4021	130.4217
+95122	014072	DARWIN NTC AWS	Darwin Harbour	IDD60920	-12.4719	130.8458
+99501	014023	GUNN POINT	Gunn Point	IDD60920	-12.2490	131.0449
+94108	014308	CROKER ISLAND AIRPORT	Croker Island Airport	IDD60920	-11.1629	132.4813
+94109	014309	MURGANELLA AIRSTRIP	Murganella Airstrip	IDD60920	-11.5485	132.9266
+94110	014310	OENPELLI AIRPORT	Oenpelli Airstrip	IDD60920	-12.3272	133.0069
+94106	014299	NGUKURR AIRPORT	Ngukurr AWS	IDD60920	-14.7236	134.7456
+94221	014808	BRADSHAW - ANGALLARI VALLEY (DEFENCE)	Bradshaw-Angallari Valley (Defence)	IDD60920	-15.4397	130.5731
+94222	014981	BRADSHAW - KOOLENDONG VALLEY (DEFENCE)	Bradshaw-Koolendong Valley	IDD60920	-15.1853	130.1169
+94000	014988	KNUCKEY LAGOON	Knuckey Lagoon	IDD60920	-12.4422	130.9556
+94608	009225	PERTH METRO	Perth	IDW60920	-31.9192	115.8728
+94210	200735	ADELE ISLAND	Adele Island	IDW60920	-15.5114	123.1556
+99200	503621	KOOLAN ISLAND (KOOLAN CENTRAL AIRPORT)	Koolan Island / Koolan Central	IDW60920	-16.1242	123.7364
+94610	009021	PERTH AIRPORT	Perth Airport	IDW60920	-31.9275	115.9764
+99254	009254	ARMAMENT JETTY	Armament Jetty	IDW60920	-32.1758	115.6808
+99255	009255	COLPOYS POINT	Colpoys Point	IDW60920	-32.2272	115.6994
+94217	002064	ARGYLE AERODROME	Argyle	IDW60920	-16.6380	128.4516
+95620	009091	INNER DOLPHIN PYLON	Melville Water	IDW60920	-31.9889	115.8311
+94795	009281	MILLENDON (SWAN VALLEY)	Millendon (Swan Valley)	IDW60920	-31.8112	116.0227
+94216	002056	KUNUNURRA AERO	Kununurra Airport	IDW60920	-15.7814	128.7100
+95647	009998	NORTH WALPOLE	Walpole North	IDW60920	-34.9469	116.7222
+94640	009871	WINDY HARBOUR	Windy Harbour	IDW60920	-34.8373	116.0260
+95641	109521	WITCHCLIFFE WEST	Witchcliffe West	IDW60920	-34.0258	115.0637
+94801	009500	ALBANY	Albany	IDW60920	-35.0289	117.8808
+94802	009999	ALBANY AIRPORT	Albany Airport	IDW60920	-34.9411	117.8158
+94630	009581	MOUNT BARKER	Mount Barker	IDW60920	-34.6250	117.6361
+95636	010905	JACUP	Jacup	IDW60920	-33.8878	119.1092
+95628	010622	ONGERUP	Ongerup	IDW60920	-33.9634	118.4788
+94631	009964	ROCKY GULLY	Rocky Gully South	IDW60920	-34.5714	117.0106
+94607	009214	OCEAN REEF	Ocean Reef	IDW60920	-31.7594	115.7278
+95605	009265	HILLARYS BOAT HARBOUR NTC AWS	Hillarys Point Boat Harbour	IDW60920	-31.8256	115.7386
+99206	503016	LOMBADINA AIRSTRIP	Lombadina	IDW60920	-16.5159	122.9220
+94638	009789	ESPERANCE	Esperance	IDW60920	-33.8300	121.8925
+95638	009542	ESPERANCE AERO	Esperance Airport	IDW60920	-33.6825	121.8275
+94644	011053	RED ROCKS POINT	Red Rocks Point	IDW60920	-32.2028	127.5297
+95648	109504	ESPERANCE NTC AWS	Esperance Harbour	IDW60920	-33.8707	121.8971
+95635	009961	HOPETOUN NORTH	Hopetoun North	IDW60920	-33.9306	120.1283
+95644	012044	MUNGLINUP WEST	Munglinup West	IDW60920	-33.5547	120.6997
+94636	010633	RAVENSTHORPE	Ravensthorpe	IDW60920	-33.5803	120.0458
+95639	012071	SALMON GUMS RES.STN.	Salmon Gums RS	IDW60920	-32.9869	121.6239
+94625	010524	BROOKTON	Brookton	IDW60920	-32.3728	117.0086
+94633	010536	CORRIGIN	Corrigin	IDW60920	-32.3292	117.8733
+95627	010568	HYDEN	Hyden	IDW60920	-32.4419	118.8983
+94612	009053	PEARCE RAAF	Pearce	IDW60920	-31.6669	116.0189
+94200	004019	MANDORA	Mandora	IDW60920	-19.7419	120.8433
+94641	010916	KATANNING	Katanning RS	IDW60920	-33.6856	117.6064
+95637	010911	LAKE GRACE	Lake Grace	IDW60920	-33.1006	118.4647
+94627	010614	NARROGIN	Narrogin	IDW60920	-32.9342	117.1797
+94628	010692	NEWDEGATE RESEARCH STATION	Newdegate	IDW60920	-33.1129	118.8400
+95616	010626	PINGELLY	Pingelly	IDW60920	-32.5336	117.0831
+95618	010647	WAGIN	Wagin	IDW60920	-33.3075	117.3403
+95640	010917	WANDERING	Wandering	IDW60920	-32.6722	116.6706
+95615	010515	BEVERLEY	Beverley	IDW60920	-32.1083	116.9247
+94602	009193	ROTTNEST ISLAND	Rottnest Island	IDW60920	-32.0069	115.5022
+95625	010286	CUNDERDIN AIRFIELD	Cunderdin Airport	IDW60920	-31.6219	117.2217
+95629	008297	DALWALLINU	Dalwallinu	IDW60920	-30.2761	116.6714
+95624	010092	MERREDIN	Merredin	IDW60920	-31.4756	118.2789
+94621	010111	NORTHAM	Northam	IDW60920	-31.6508	116.6586
+95634	012320	SOUTHERN CROSS AIRFIELD	Southern Cross Airport	IDW60920	-31.2353	119.3564
+94622	008137	WONGAN HILLS	Wongan Hills	IDW60920	-30.8917	116.7186
+94614	009215	SWANBOURNE	Swanbourne	IDW60920	-31.9560	115.7619
+94623	010311	YORK	York	IDW60920	-31.8997	116.7650
+94102	001007	TROUGHTON ISLAND	Troughton Island	IDW60920	-13.7542	126.1485
+95101	001020	TRUSCOTT	Truscott	IDW60920	-14.0900	126.3867
+95617	009968	SHANNON	Shannon	IDW60920	-34.5683	116.3367
+95610	009240	BICKLEY	Bickley	IDW60920	-32.0072	116.1369
+95214	001006	WYNDHAM AERO	Wyndham Airport	IDW60920	-15.5100	128.1503
+95304	005094	BARROW ISLAND AIRPORT	Barrow Island	IDW60920	-20.8740	115.4066
+94310	004100	BEDOUT ISLAND	Bedout Island	IDW60920	-19.5894	119.1000
+99593	505063	ELIWANA AIRPORT	Eliwana Airport	IDW60920	-22.4281	116.8867
+95307	004083	KARRATHA AERO	Karratha	IDW60920	-20.7097	116.7742
+99594	505064	GUDAI-DARRI MINE	Gudai-Darri Mine	IDW60920	-22.5055	119.0728
+94302	005007	LEARMONTH AIRPORT	Learmonth	IDW60920	-22.2406	114.0967
+99313	505053	BARIMUNYA	Barimunya	IDW60920	-22.6719	119.1628
+99737	505049	CHRISTMAS CREEK	Christmas Creek	IDW60920	-22.3562	119.6497
+99312	505051	COONDEWANNA	Coondewanna	IDW60920	-22.9650	118.8089
+99736	505056	FORTESCUE DAVE FORREST	Fortescue Dave Forrest	IDW60920	-22.2900	119.4344
+99366	504066	IRONBRIDGE AIRPORT	Iron Bridge Mine	IDW60920	-21.2838	118.8811
+95317	004106	MARBLE BAR	Marble Bar	IDW60920	-21.1756	119.7497
+94306	005008	MARDIE	Mardie	IDW60920	-21.1906	115.9797
+95303	200100	VARANUS ISLAND	Varanus Island	IDW60920	-20.6550	115.5769
+94303	005084	THEVENARD ISLAND	Thevenard Island	IDW60920	-21.4609	115.0188
+94317	007176	NEWMAN AERO	Newman Airport	IDW60920	-23.4212	119.8015
+95305	005017	ONSLOW AIRPORT	Onslow Airport	IDW60920	-21.6689	115.1092
+94203	003003	BROOME AIRPORT	Broome	IDW60920	-17.9475	122.2352
+95202	003102	BROOME WHARF NTC AWS	Broome Port	IDW60920	-18.0019	122.2162
+94316	007185	PARABURDOO AERO	Paraburdoo	IDW60920	-23.1726	117.7493
+94312	004032	PORT HEDLAND AIRPORT	Port Hedland	IDW60920	-20.3725	118.6317
+94307	004095	LEGENDRE ISLAND	Legendre Island	IDW60920	-20.3583	116.8431
+94308	004090	ROEBOURNE AERO	Roebourne Airport	IDW60920	-20.7594	117.1583
+99217	505060	SOLOMON AIRPORT	Solomon Airport	IDW60920	-22.2547	117.8470
+94319	013030	TELFER AERO	Telfer	IDW60920	-21.7125	122.2281
+94300	006011	CARNARVON AIRPORT	Carnarvon	IDW60920	-24.8878	113.6700
+94444	012239	BULGA DOWNS	Bulga Downs	IDW60920	-28.4967	119.7436
+99401	507017	GOLDEN GROVE	Golden Grove	IDW60920	-28.7647	116.9694
+94430	007045	MEEKATHARRA AIRPORT	Meekatharra	IDW60920	-26.6136	118.5372
+95607	009256	GARDEN ISLAND HSF	Garden Island	IDW60920	-32.2433	115.6839
+94204	003080	CURTIN AERO	Curtin	IDW60920	-17.5768	123.8297
+94429	007600	MOUNT MAGNET AERO	Mount Magnet Airport	IDW60920	-28.1156	117.8425
+94422	006099	MURCHISON	Murchison	IDW60920	-26.8956	115.9567
+94404	007139	PAYNES FIND	Paynes Find	IDW60920	-29.2708	117.6836
+95402	006105	SHARK BAY AIRPORT	Shark Bay Airport	IDW60920	-25.8925	113.5772
+94637	012038	KALGOORLIE-BOULDER AIRPORT	Kalgoorlie-Boulder	IDW60920	-30.7847	121.4533
+94449	012305	LAVERTON AERO	Laverton	IDW60920	-28.6133	122.4236
+95448	012314	LEINSTER AERO	Leinster	IDW60920	-27.8386	120.7031
+94450	012241	LEONORA AERO	Leonora Airport	IDW60920	-28.8789	121.3186
+94615	009204	GOOSEBERRY HILL	Gooseberry Hill	IDW60920	-31.9414	116.0506
+94201	003057	CYGNET BAY	Cygnet Bay	IDW60920	-16.4513	123.0087
+95642	012009	NORSEMAN AERO	Norseman Airport	IDW60920	-32.2147	121.7547
+95439	013044	WILUNA AERO	Wiluna Airport	IDW60920	-26.6273	120.2195
+99434	512019	MOUNT KEITH	Mount Keith	IDW60920	-27.2856	120.5547
+94647	011003	EUCLA	Eucla	IDW60920	-31.6797	128.8958
+94645	011019	EYRE	Eyre	IDW60920	-32.2464	126.3008
+95646	011052	FORREST	Forrest	IDW60920	-30.8453	128.1092
+94451	013015	CARNEGIE	Carnegie	IDW60920	-25.7964	122.9753
+94461	013017	GILES METEOROLOGICAL OFFICE	Giles	IDW60920	-25.0341	128.3010
+94457	013011	WARBURTON AIRFIELD	Warburton	IDW60920	-26.1317	126.5839
+94609	009172	JANDAKOT AERO	Jandakot	IDW60920	-32.1011	115.8794
+95205	003032	DERBY AERO	Derby	IDW60920	-17.3706	123.6611
+94603	009037	BADGINGARRA RESEARCH STN	Badgingarra	IDW60920	-30.3381	115.5394
+94415	008025	CARNAMAH	Carnamah	IDW60920	-29.6883	115.8857
+94403	008315	GERALDTON AIRPORT	Geraldton Airport	IDW60920	-28.8047	114.6989
+95600	009131	JURIEN BAY	Jurien Bay	IDW60920	-30.3081	115.0311
+94401	008251	KALBARRI	Kalbarri	IDW60920	-27.7119	114.1650
+94417	008296	MORAWA AIRPORT	Morawa Airport	IDW60920	-29.2039	116.0247
+94411	008095	MULLEWA	Mullewa	IDW60920	-28.5367	115.5142
+95614	009111	KARNET	Karnet	IDW60920	-32.4389	116.0789
+94206	003093	FITZROY CROSSING AERO	Fitzroy Crossing	IDW60920	-18.1814	125.5619
+94405	008290	NORTH ISLAND	North Island	IDW60920	-28.3009	113.5937
+94620	009538	DWELLINGUP	Dwellingup	IDW60920	-32.7103	116.0594
+95612	009178	GINGIN AERO	Gingin Airport	IDW60920	-31.4628	115.8642
+94605	009977	MANDURAH	Mandurah	IDW60920	-32.5219	115.7119
+94212	002079	HALLS CREEK AIRPORT	Halls Creek	IDW60920	-18.2337	127.6666
+95632	009617	BRIDGETOWN	Bridgetown	IDW60920	-33.9486	116.1311
+94100	001019	KALUMBURU	Kalumburu	IDW60920	-14.2964	126.6453
+94604	009965	BUNBURY	Bunbury	IDW60920	-33.3567	115.6447
+95611	009603	BUSSELTON AERO	Busselton Airport	IDW60920	-33.6818	115.4026
+95602	009937	BUSSELTON JETTY	Busselton Jetty	IDW60920	-33.6294	115.3383
+94601	009518	CAPE LEEUWIN	Cape Leeuwin	IDW60920	-34.3728	115.1358
+94600	009519	CAPE NATURALISTE	Cape Naturaliste	IDW60920	-33.5372	115.0189
+95621	009994	COLLIE EAST	Collie East	IDW60920	-33.3608	116.1717
+95622	009534	DONNYBROOK	Donnybrook	IDW60920	-33.5719	115.8247
+94617	009573	MANJIMUP	Manjimup	IDW60920	-34.2508	116.1450
+94207	200713	ROWLEY SHOALS	Rowley Shoals	IDW60920	-17.5217	118.9531
+96995	200790	CHRISTMAS ISLAND AERO	Christmas Island	IDW60920	-10.4515	105.6890
+96996	200284	COCOS ISLAND AIRPORT	Cocos Island	IDW60920	-12.1892	96.8344
+94330	005098	KARIJINI NORTH	Karijini North	IDW60920	-22.2999	118.4498
+94970	094029	HOBART (ELLERSLIE ROAD)	Hobart	IDT60920	-42.8897	147.3278
+94953	091292	SMITHTON AERODROME	Smithton	IDT60920	-40.8347	145.0847
+94987	092114	FRIENDLY BEACHES	Friendly Beaches	IDT60920	-41.9953	148.2794
+95988	092124	MARIA ISLAND (POINT LESUEUR)	Maria Island	IDT60920	-42.6621	148.0179
+95986	094155	TASMAN ISLAND	Tasman Island	IDT60920	-43.2397	148.0025
+95987	092133	SPRING BAY NTC AWS	Spring Bay	IDT60920	-42.5464	147.9308
+94981	092148	SWANSEA (FRANCIS STREET)	Swansea	IDT60920	-42.1381	148.0736
+95967	094198	CAPE BRUNY (CAPE BRUNY)	Cape Bruny AWS	IDT60920	-43.4886	147.1444
+95961	097080	LOW ROCKY POINT	Low Rocky Point	IDT60920	-42.9831	145.5025
+94962	094041	MAATSUYKER ISLAND LIGHTHOUSE	Maatsuyker Island	IDT60920	-43.6578	146.2711
+94974	097000	CAPE SORELL	Cape Sorell	IDT60920	-42.1986	145.1700
+94956	097072	STRAHAN AERODROME	Strahan	IDT60920	-42.1550	145.2908
+95985	092123	SWAN ISLAND	Swan Island	IDT60920	-40.7292	148.1250
+94619	094250	HOBART AIRPORT	Hobart Airport	IDT60920	-42.8333	147.5119
+95972	094212	CAMPANIA (KINCORA)	Campania	IDT60920	-42.6867	147.4258
+94961	094020	DOVER	Dover	IDT60920	-43.3330	146.9980
+94980	099005	FLINDERS ISLAND AIRPORT	Flinders Island Airport	IDT60920	-40.0911	148.0024
+95959	096033	LIAWENEE	Liawenee	IDT60920	-41.8997	146.6694
+94950	091223	MARRAWAH	Marrawah	IDT60920	-40.9089	144.7094
+95979	094087	KUNANYI (MOUNT WELLINGTON PINNACLE)	kunanyi /Mount Wellington	IDT60920	-42.8950	147.2358
+94957	095048	OUSE FIRE STATION	Ouse	IDT60920	-42.4842	146.7106
+94985	093053	ROSS (THE BOULEVARDS)	Ross	IDT60920	-42.0250	147.4954
+95964	091293	LOW HEAD	Low Head	IDT60920	-41.0547	146.7874
+94983	092045	LARAPUNA (EDDYSTONE POINT)	Larapuna (Eddystone Point)	IDT60920	-40.9928	148.3467
+94972	091219	SCOTTSDALE (WEST MINSTONE ROAD)	Scottsdale	IDT60920	-41.1708	147.4883
+95975	092163	FINGAL (FLEMING ST)	Fingal	IDT60920	-41.6430	147.9800
+95981	092120	ST HELENS AERODROME	St Helens	IDT60920	-41.3381	148.2792
+94969	091237	LAUNCESTON (TI TREE BEND)	Launceston	IDT60920	-41.4194	147.1219
+95966	091311	LAUNCESTON AIRPORT	Launceston Airport	IDT60920	-41.5476	147.2156
+95970	091375	CRESSY (BRUMBYS CREEK)	Cressy	IDT60920	-41.7114	147.0820
+94960	094195	TUNNACK FIRE STATION	Tunnack	IDT60920	-42.4543	147.4612
+95977	094220	GROVE (RESEARCH STATION)	Grove	IDT60920	-42.9844	147.0756
+94977	094191	HARTZ MOUNTAIN (KEOGHS PIMPLE)	Hartz Mountains	IDT60920	-43.2006	146.7683
+94951	094254	DUNALLEY (STROUD POINT)	Dunalley	IDT60920	-42.9017	147.7894
+94988	094255	DENNES POINT	Dennes Point	IDT60920	-43.0639	147.3567
+94964	095003	BUSHY PARK (BUSHY PARK ESTATES)	Bushy Park	IDT60920	-42.7097	146.8983
+94959	096003	BUTLERS GORGE	Butlers Gorge	IDT60920	-42.2753	146.2758
+95952	097085	MOUNT READ	Mount Read	IDT60920	-41.8444	145.5417
+95958	097083	SCOTTS PEAK DAM	Scotts Peak	IDT60920	-43.0425	146.2722
+95962	097024	WARRA	Warra	IDT60920	-43.0609	146.7040
+95954	091331	KENNAOOK/CAPE GRIM	Kennaook / Cape Grim	IDT60920	-40.6764	144.6922
+95957	091107	WYNYARD AIRPORT	Wynyard	IDT60920	-40.9964	145.7311
+95963	091344	BURNIE NTC AWS	Burnie Port	IDT60920	-41.0500	145.9149
+95956	091259	LUNCHEON HILL (FORESTRY)	Luncheon Hill	IDT60920	-41.1492	145.1517
+95960	091126	DEVONPORT AIRPORT	Devonport Airport	IDT60920	-41.1701	146.4289
+94955	091291	SHEFFIELD SCHOOL FARM	Sheffield	IDT60920	-41.3890	146.3173
+94850	098017	KING ISLAND AIRPORT	King Island Airport	IDT60920	-39.8804	143.8857
+89817	300061	BUNGER HILLS	Bunger Hills	IDT60920	-66.2510	100.6000
+89611	300017	CASEY	Casey	IDT60920	-66.2825	110.5231
+89512	989512	NOVOLAZAREVSKAJA	Novolazarevskaja	IDT60920	-70.7667	11.8333
+89532	989532	SYOWA	Syowa	IDT60920	-69.0053	39.5811
+94998	300004	MACQUARIE ISLAND	Macquarie Island	IDT60920	-54.4994	158.9369
+89571	300000	DAVIS	Davis	IDT60920	-68.5744	77.9672
+89642	989642	DUMONT D URVILLE	Dumont D'urville	IDT60920	-66.6631	140.0011
+89564	300001	MAWSON	Mawson	IDT60920	-67.6017	62.8753
+89664	989664	MCMURDO	McMurdo	IDT60920	-77.8500	166.6667
+89592	989592	MIRNYJ	Mirnyj	IDT60920	-66.5500	93.0167
+99139	250091	TAS FIRE SERVICE PORTABLE C	TFS C	IDT60920	-41.2629	148.2863
+99953	250141	PORTABLE TAS AWS 5 (TFS)	Ross (TFS)	IDT60920	-42.0170	147.4975
+99954	250142	PORTABLE TAS AWS 6 (TFS)	Waratah (TFS)	IDT60920	-41.4480	145.5351
+99140	250092	TAS PARKS WILDLIFE PORTABLE A	PWS A	IDT60920	-41.7080	145.2269
+99141	250093	TAS PARKS WILDLIFE PORTABLE B	PWS B	IDT60920	-43.1471	147.9934
+"""
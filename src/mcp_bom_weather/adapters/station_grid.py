@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from ..config import STATION_GRID_CELL_DEG
+
+if TYPE_CHECKING:
+    from .product_index import StationObs
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class StationGrid:
+    """Stations bucketed into fixed lat/lon cells for k-nearest queries.
+
+    A query visits rings of cells outward from the query's cell and stops once no
+    unvisited cell can hold anything closer than the k-th best so far. Longitudes do not
+    wrap at the antimeridian, which no BoM station list comes near.
+    """
+
+    def __init__(
+        self, stations: Iterable[StationObs], cell_deg: float = STATION_GRID_CELL_DEG
+    ) -> None:
+        self.cell_deg = cell_deg
+        self.cells: dict[tuple[int, int], list[StationObs]] = {}
+        self._max_abs_lat = 0.0
+        for stn in stations:
+            if math.isnan(stn.lat) or math.isnan(stn.lon):
+                continue
+            self.cells.setdefault(self._key(stn.lat, stn.lon), []).append(stn)
+            self._max_abs_lat = max(self._max_abs_lat, abs(stn.lat))
+        keys = self.cells.keys()
+        self._rows = (min(k[0] for k in keys), max(k[0] for k in keys)) if keys else (0, -1)
+        self._cols = (min(k[1] for k in keys), max(k[1] for k in keys)) if keys else (0, -1)
+
+    def __len__(self) -> int:
+        return sum(len(c) for c in self.cells.values())
+
+    def _key(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def _ring(self, row: int, col: int, r: int) -> Iterable[list[StationObs]]:
+        for i in range(row - r, row + r + 1):
+            step = 1 if i in (row - r, row + r) else 2 * r or 1
+            for j in range(col - r, col + r + 1, step):
+                cell = self.cells.get((i, j))
+                if cell:
+                    yield cell
+
+    def _min_km_beyond(self, r: int, lat: float) -> float:
+        # Anything outside rings 0..r is at least r whole cells away in latitude or in
+        # longitude; the longitude gap is shortest at the highest latitude involved
+        span = math.radians(r * self.cell_deg)
+        by_lat = EARTH_RADIUS_KM * span
+        widest = math.radians(min(90.0, max(abs(lat), self._max_abs_lat)))
+        half = math.sin(min(span, math.pi) / 2)
+        by_lon = 2 * EARTH_RADIUS_KM * math.asin(math.cos(widest) * half)
+        return min(by_lat, by_lon)
+
+    def nearest(self, lat: float, lon: float, k: int) -> list[tuple[float, StationObs]]:
+        """Up to ``k`` (distance_km, station) pairs, closest first."""
+        if not self.cells or k <= 0:
+            return []
+        row, col = self._key(lat, lon)
+        last_ring = max(
+            abs(row - self._rows[0]),
+            abs(row - self._rows[1]),
+            abs(col - self._cols[0]),
+            abs(col - self._cols[1]),
+        )
+        best: list[tuple[float, int, StationObs]] = []  # max-heap on distance via negation
+        for r in range(last_ring + 1):
+            for cell in self._ring(row, col, r):
+                for stn in cell:
+                    item = (-haversine_km(lat, lon, stn.lat, stn.lon), id(stn), stn)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+            if len(best) == k and -best[0][0] <= self._min_km_beyond(r, lat):
+                break
+        return [(-d, stn) for d, _, stn in sorted(best, reverse=True)]
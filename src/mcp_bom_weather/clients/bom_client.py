@@ -1,22 +1,67 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from http import HTTPStatus
 
-from ..config import CITY_PRODUCT_IDS, FTP_FWO_PATH, FTP_HOST
-from ..util.ftp import FtpClient
+from ..adapters.product_index import ProductIndex, ProductIndexes
+from ..config import (
+    CITY_FORECAST_PRODUCT_IDS,
+    CITY_PRODUCT_IDS,
+    FTP_FWO_PATH,
+    FTP_HOST,
+    FTP_PORT,
+    WARNINGS_LISTING_TTL_SECS,
+)
+from ..util.cache import Product, ProductCache
+from ..util.deadline import time_left
+from ..util.disk_cache import DiskCache
+from ..util.ftp import FTP_ERRORS, DeadlineExceeded, FtpClient
+from ..util.history import HistoryStore
+from ..util.metrics import stage, timed
+from ..util.shared_cache import SharedCache
+from ..util.singleflight import SingleFlight
+from .warnings_index import WarningFile, WarningsListing
+
+log = logging.getLogger(__name__)
+
+NO_WARNINGS_XML = "<warnings><none>No warnings</none></warnings>"
 
 
 @dataclass
 class BomClient:
     host: str = FTP_HOST
+    port: int = FTP_PORT
     directory: str = FTP_FWO_PATH
+    cache: ProductCache = field(default_factory=ProductCache)
+    # Set while a background refresher keeps the cache warm: stale copies are served
+    # immediately and the request path never waits on FTP for a product it has seen.
+    serve_stale: bool = False
+    # Called with every newly downloaded product version (not with revalidated copies)
+    listeners: list[Callable[[Product], None]] = field(default_factory=list)
+    # Observation history fed by those new versions (see weather_tools.enable_history)
+    history: HistoryStore | None = None
+    # Consulted before FTP when the in-memory cache misses (e.g. just after a restart)
+    disk: DiskCache | None = None
+    # Each product version parsed once; downloads are parsed while they stream in
+    indexes: ProductIndexes = field(default_factory=ProductIndexes)
+    # Products and indexes shared with the other server processes on this node: a stale
+    # product is taken from there when another process already refreshed it
+    shared: SharedCache | None = None
 
     def __post_init__(self) -> None:
-        self.ftp = FtpClient(self.host)
+        self.ftp = FtpClient(self.host, port=self.port)
+        self._warnings: WarningsListing | None = None
+        self._scans: SingleFlight[WarningsListing] = SingleFlight()
+        # Concurrent requests for one path share a single download
+        self._downloads: SingleFlight[Product] = SingleFlight()
 
     def _choose_city_file(self, city: str) -> str | None:
-        product = CITY_PRODUCT_IDS.get(city)
+        return self._product_file(CITY_PRODUCT_IDS.get(city))
+
+    def _product_file(self, product: str | None) -> str | None:
         if product:
             # If product includes a slash, treat as full path under FTP root
             if product.endswith(".xml"):
@@ -26,21 +71,235 @@ class BomClient:
         # No exact mapping configured: enforce explicit configuration to avoid scans
         return None
 
-    # Returns XML text for a given city
-    def fetch_city_xml(self, city: str) -> tuple[int, str]:
+    def city_path(self, city: str) -> str:
         path = self._choose_city_file(city)
         if not path:
             raise ValueError(
                 f"City '{city}' is not mapped to a product ID. Set CITY_PRODUCT_IDS in config.py."
             )
-        return int(HTTPStatus.OK), self.ftp.fetch_text(path)
+        return path
+
+    def product_path(self, product_id: str) -> str:
+        """FTP path of a product given its ID (e.g. ``IDN60920``)."""
+        path = self._product_file(product_id)
+        if not path:
+            raise ValueError("A product ID is required, e.g. IDN60920.")
+        return path
+
+    def forecast_path(self, city: str) -> str:
+        path = self._product_file(CITY_FORECAST_PRODUCT_IDS.get(city))
+        if not path:
+            raise ValueError(
+                f"City '{city}' is not mapped to a forecast product. "
+                "Set CITY_FORECAST_PRODUCT_IDS in config.py."
+            )
+        return path
+
+    # Downloads unconditionally unless MDTM/SIZE show the cached copy is still current
+    def refresh(self, path: str) -> Product:
+        return self._downloads.do(path, lambda: self._refresh_shared(path, self._peek(path)))
+
+    def _peek(self, path: str) -> Product | None:
+        return self.cache.peek(path) or self._from_disk(path)
+
+    def _from_disk(self, path: str) -> Product | None:
+        if self.disk is None:
+            return None
+        try:
+            with stage("disk_load"):
+                entry = self.disk.load(path)
+        except Exception:
+            log.exception("Reading %s from the disk cache failed", path)
+            return None
+        return self.cache.restore(entry) if entry is not None else None
+
+    def _persist(self, product: Product) -> Product:
+        if self.disk is not None:
+            try:
+                self.disk.store(product)
+            except Exception:
+                log.exception("Writing %s to the disk cache failed", product.path)
+        return product
+
+    def _from_shared(self, path: str, entry: Product | None) -> Product | None:
+        if self.shared is None:
+            return entry
+        loaded = self.shared.load(path)
+        if loaded is None:
+            return entry
+        product, index = loaded
+        if entry is not None and product.fetched_at <= entry.fetched_at:
+            return entry
+        self.cache.restore(product)
+        if isinstance(index, ProductIndex):
+            self.indexes.put(product, index)
+        return product
+
+    def _share(self, product: Product) -> Product:
+        if self.shared is not None:
+            try:
+                self.shared.store(product, self.indexes.peek(product))
+            except Exception:
+                log.exception("Writing %s to the shared cache failed", product.path)
+        return product
+
+    def _refresh_shared(self, path: str, entry: Product | None) -> Product:
+        if self.shared is None:
+            return self._refresh(path, entry)
+        with self.shared.lock(path, timeout=time_left()) as held:
+            # Another process may have refreshed it while this one waited for the lock
+            newer = self._from_shared(path, entry)
+            if not held:
+                # Still refreshing elsewhere when the deadline ran out: answer from the copy
+                # at hand rather than wait for it
+                if newer is None:
+                    raise DeadlineExceeded(f"Waited too long for the refresh of {path}")
+                return newer
+            if newer is not entry and newer is not None and self.cache.is_fresh(newer):
+                return newer
+            return self._refresh(path, newer)
+
+    @timed("ftp_fetch")
+    def _refresh(self, path: str, entry: Product | None) -> Product:
+        known = entry.validator if entry is not None else None
+        attempts: list[ProductIndex] = []
+
+        def stream() -> ProductIndex:
+            # A retried or hedged RETR starts again from the first byte, so with a fresh index
+            index = ProductIndex()
+            attempts.append(index)
+            return index
+
+        validator, text = self.ftp.fetch_text_if_changed(path, known, stream=stream)
+        if text is None:
+            assert entry is not None
+            return self._share(self._persist(self.cache.revalidate(entry)))
+        product = self.cache.put(path, text, validator)
+        # Only an attempt that received the whole file closes its index; with a hedge,
+        # either finished attempt carries the same text
+        index = next((i for i in attempts if i.closed), None)
+        if index is not None:
+            self.indexes.put(product, index, self.disk)
+        return self._publish(self._share(product))
+
+    def _publish(self, product: Product) -> Product:
+        self._persist(product)
+        for listener in self.listeners:
+            try:
+                listener(product)
+            except Exception:
+                log.exception("Product listener failed for %s", product.path)
+        return product
+
+    # Serves from the product cache until BoM is due to reissue the file. Once stale,
+    # an unchanged MDTM/SIZE revalidates the cached copy instead of downloading it again.
+    @timed("fetch")
+    def fetch_product(self, path: str) -> Product:
+        entry = self.cache.get(path) or self._from_disk(path)
+        if entry is not None and (self.serve_stale or self.cache.is_fresh(entry)):
+            return entry
+        entry = self._from_shared(path, entry)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry
+        try:
+            return self._downloads.do(path, lambda: self._refresh_shared(path, entry))
+        except FTP_ERRORS:
+            if entry is None:
+                raise
+            # BoM is unreachable: the last good copy beats an error
+            return entry
+
+    def fetch_parsed(self, path: str) -> tuple[Product, ProductIndex]:
+        """The product and its parsed index (built during the download when there was one)."""
+        product = self.fetch_product(path)
+        return product, self.indexes.get(product, self.disk)
+
+    def fetch_city_product(self, city: str) -> Product:
+        return self.fetch_product(self.city_path(city))
+
+    def fetch_city_parsed(self, city: str) -> tuple[Product, ProductIndex]:
+        product = self.fetch_city_product(city)
+        return product, self.indexes.get(product, self.disk)
+
+    def fetch_forecast_parsed(self, city: str) -> tuple[Product, ProductIndex]:
+        return self.fetch_parsed(self.forecast_path(city))
+
+    # Returns XML text for a given city
+    def fetch_city_xml(self, city: str) -> tuple[int, str]:
+        return int(HTTPStatus.OK), self.fetch_city_product(city).text
+
+    def _scan_warnings(self) -> WarningsListing:
+        stats = self.ftp.list_stats(self.directory)
+        self._warnings = WarningsListing(self.directory, stats, self.cache.clock())
+        return self._warnings
+
+    # Rescans the directory at most every WARNINGS_LISTING_TTL_SECS; on failure the previous
+    # listing is reused
+    def warnings_listing(self) -> WarningsListing:
+        listing = self._warnings
+        if (
+            listing is not None
+            and self.cache.clock() - listing.scanned_at < WARNINGS_LISTING_TTL_SECS
+        ):
+            return listing
+        try:
+            return self._scans.do("warnings", self._scan_warnings)
+        except FTP_ERRORS:
+            if listing is None:
+                raise
+            return listing
+
+    def _fetch_warning(self, wf: WarningFile) -> Product:
+        if wf.stat.mtime is None:
+            # NLST-only listing: fall back to MDTM/SIZE revalidation of the one file
+            return self.fetch_product(wf.path)
+        entry = self.cache.get(wf.path) or self._from_disk(wf.path)
+        if entry is not None and wf.stat.matches(entry.validator):
+            # The listing already shows the file is unchanged; no need to ask again
+            if self.cache.is_fresh(entry):
+                return entry
+            return self._persist(self.cache.revalidate(entry))
+
+        def download() -> Product:
+            return self._publish(self.cache.put(wf.path, self.ftp.fetch_text(wf.path), wf.stat))
+
+        try:
+            return self._downloads.do(wf.path, download)
+        except FTP_ERRORS:
+            if entry is None:
+                raise
+            return entry
+
+    def refresh_warnings(self) -> Product | None:
+        latest = self._scans.do("warnings", self._scan_warnings).latest
+        return self._fetch_warning(latest) if latest else None
+
+    # None means BoM currently lists no warnings product
+    def fetch_warnings_product(self) -> Product | None:
+        if self.serve_stale and self._warnings is not None:
+            latest = self._warnings.latest  # the refresher keeps the listing current
+        else:
+            latest = self.warnings_listing().latest
+        if latest is None:
+            return None
+        if self.serve_stale:
+            entry = self.cache.get(latest.path) or self._from_disk(latest.path)
+            if entry is not None:
+                return entry
+        return self._fetch_warning(latest)
 
     def fetch_warnings_xml(self) -> tuple[int, str]:
-        files = self.ftp.list_files(self.directory)
-        warn_files = [f for f in files if f.endswith(".xml") and "warn" in f.lower()]
-        warn_files.sort(reverse=True)
-        if not warn_files:
+        product = self.fetch_warnings_product()
+        if product is None:
             # Fallback: just return an empty structure
-            return int(HTTPStatus.OK), "<warnings><none>No warnings</none></warnings>"
-        path = f"{self.directory}/{warn_files[0]}"
-        return int(HTTPStatus.OK), self.ftp.fetch_text(path)
+            return int(HTTPStatus.OK), NO_WARNINGS_XML
+        return int(HTTPStatus.OK), product.text
+
+    def stale_age(self, product: Product) -> int | None:
+        return self.cache.stale_age(product)
+
+
+# One client per process so every tool call shares the same pooled FTP sessions
+@lru_cache(maxsize=1)
+def default_client() -> BomClient:
+    return BomClient()
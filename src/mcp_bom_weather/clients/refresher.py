@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+
+from ..config import (
+    CITY_FORECAST_PRODUCT_IDS,
+    CITY_PRODUCT_IDS,
+    REFRESH_GRACE_SECS,
+    REFRESH_MAX_RETRY_SECS,
+    REFRESH_RETRY_SECS,
+    SUPPORTED_CITIES,
+)
+from ..util.cache import Product
+from .bom_client import BomClient
+
+log = logging.getLogger(__name__)
+
+WARNINGS_JOB = "warnings"
+
+
+def _iso(ts: float | None) -> str | None:
+    if ts is None:
+        return None
+    return dt.datetime.fromtimestamp(ts, dt.UTC).replace(microsecond=0).isoformat()
+
+
+@dataclass
+class RefreshJob:
+    name: str
+    refresh: Callable[[], Product | None]
+    next_due: float = 0.0
+    last_refresh: float | None = None
+    last_error: str | None = None
+    failures: int = 0
+
+
+class Refresher:
+    """Keeps the city observation and forecast products and the warnings product warm.
+
+    While running, the client serves whatever copy it holds (stale-while-revalidate) and
+    tool calls never wait on FTP for a product the refresher has already fetched. Every
+    product a tool reads must therefore have a job here, or it would never be updated.
+    """
+
+    def __init__(self, client: BomClient, *, clock: Callable[[], float] = time.time) -> None:
+        self.client = client
+        self.clock = clock
+        self.jobs: dict[str, RefreshJob] = {}
+        for city in SUPPORTED_CITIES:
+            product_id = CITY_PRODUCT_IDS.get(city)
+            if product_id:
+                path = client.city_path(city)
+                self.jobs[product_id] = RefreshJob(product_id, partial(client.refresh, path))
+            product_id = CITY_FORECAST_PRODUCT_IDS.get(city)
+            if product_id:
+                path = client.forecast_path(city)
+                self.jobs[product_id] = RefreshJob(product_id, partial(client.refresh, path))
+        self.jobs[WARNINGS_JOB] = RefreshJob(WARNINGS_JOB, client.refresh_warnings)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _next_due(self, product: Product | None, now: float) -> float:
+        if product is None:
+            return now + self.client.cache.ttl
+        # expires_at already folds in next-routine-issue-time-utc (or the TTL without it);
+        # BoM usually publishes a little after the nominal time
+        return max(product.expires_at, now) + REFRESH_GRACE_SECS
+
+    def _run(self, job: RefreshJob) -> None:
+        try:
+            product = job.refresh()
+        except Exception as exc:
+            now = self.clock()
+            with self._lock:
+                job.failures += 1
+                job.last_error = f"{type(exc).__name__}: {exc}"
+                backoff = REFRESH_RETRY_SECS * 2 ** (job.failures - 1)
+                job.next_due = now + min(backoff, REFRESH_MAX_RETRY_SECS)
+            log.warning("Refreshing %s failed (%d in a row): %s", job.name, job.failures, exc)
+            return
+        now = self.clock()
+        with self._lock:
+            job.failures = 0
+            job.last_error = None
+            job.last_refresh = now
+            job.next_due = self._next_due(product, now)
+
+    def run_due(self) -> int:
+        now = self.clock()
+        due = [job for job in self.jobs.values() if job.next_due <= now]
+        for job in due:
+            self._run(job)
+        return len(due)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.run_due()
+            with self._lock:
+                next_due = min(job.next_due for job in self.jobs.values())
+            self._stop.wait(max(0.5, next_due - self.clock()))
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.client.serve_stale = True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="bom-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.client.serve_stale = False
+
+    def status(self) -> list[dict[str, object]]:
+        with self._lock:
+            return [
+                {
+                    "name": job.name,
+                    "next_due": _iso(job.next_due),
+                    "last_refresh": _iso(job.last_refresh),
+                    "last_error": job.last_error,
+                    "failures": job.failures,
+                }
+                for job in self.jobs.values()
+            ]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..util.ftp import RemoteStat
+
+
+def is_warnings_file(name: str) -> bool:
+    return name.endswith(".xml") and "warn" in name.lower()
+
+
+@dataclass(frozen=True, slots=True)
+class WarningFile:
+    path: str
+    name: str
+    stat: RemoteStat  # from the listing; a file is only downloaded again when this changes
+
+
+class WarningsListing:
+    """One scan of the warnings files in the products directory, indexed by path."""
+
+    def __init__(self, directory: str, stats: dict[str, RemoteStat], scanned_at: float) -> None:
+        self.scanned_at = scanned_at
+        self.files: dict[str, WarningFile] = {}
+        for name, stat in stats.items():
+            if is_warnings_file(name):
+                wf = WarningFile(f"{directory}/{name}", name, stat)
+                self.files[wf.path] = wf
+        # Same choice as before the listing was cached: the highest file name
+        self.latest = self.files[max(self.files)] if self.files else None
@@ -15,6 +15,7 @@ SUPPORTED_CITIES: Final[list[str]] = [
 
 # FTP settings
 FTP_HOST: Final[str] = "ftp.bom.gov.au"
+FTP_PORT: Final[int] = 21
 FTP_BASE_PATH: Final[str] = "/anon/gen"
 FTP_FWO_PATH: Final[str] = "/anon/gen/fwo"
 
@@ -30,6 +31,18 @@ CITY_PRODUCT_PREFIX: Final[dict[str, str]] = {
     "Hobart": "IDT",
 }
 
+# State for each product prefix (IDZ products are national)
+PRODUCT_PREFIX_STATE: Final[dict[str, str]] = {
+    "IDN": "NSW",
+    "IDV": "VIC",
+    "IDS": "SA",
+    "IDQ": "QLD",
+    "IDD": "NT",
+    "IDW": "WA",
+    "IDT": "TAS",
+    "IDZ": "AUS",
+}
+
 # Exact product IDs per city (without .xml). If set, the client will fetch
 # this file directly instead of scanning the directory. Leave as None to
 # indicate it must be configured per environment.
@@ -45,6 +58,132 @@ CITY_PRODUCT_IDS: Final[dict[str, str | None]] = {
     "Hobart": "IDT60920",
 }
 
-# Retry settings
+# Forecast product per city (without .xml): the state précis/city forecast whose <area>
+# entries carry <forecast-period> elements. The observation files above have none.
+# Only products checked against a copy in examples/ are set; like CITY_PRODUCT_IDS,
+# None means it must be configured per environment (forecast() then reports that).
+CITY_FORECAST_PRODUCT_IDS: Final[dict[str, str | None]] = {
+    "Sydney": "IDN11050",
+    "Melbourne": None,
+    "Adelaide": None,
+    "Brisbane": None,
+    "Darwin": None,
+    "Perth": None,
+    "Hobart": None,
+}
+
+# Forecast area (aac) per city within its forecast product. An area is looked up by aac
+# first, then by a description equal to the city name.
+CITY_FORECAST_AACS: Final[dict[str, str]] = {
+    "Sydney": "NSW_ME001",
+}
+
+# Reference observation station (WMO id) per city within its state product. These are
+# the capital-city stations BoM lists first in each IDx60920 file.
+CITY_STATION_IDS: Final[dict[str, str]] = {
+    "Sydney": "94768",  # Sydney - Observatory Hill
+    "Melbourne": "95936",  # Melbourne (Olympic Park)
+    "Adelaide": "94648",  # Adelaide (West Terrace)
+    "Brisbane": "94576",  # Brisbane
+    "Darwin": "94120",  # Darwin Airport
+    "Perth": "94608",  # Perth
+    "Hobart": "94970",  # Hobart (Ellerslie Road)
+}
+
+# current_weather_all_major_cities fetches cities in parallel, at most this many at once
+ALL_CITIES_CONCURRENCY: Final[int] = 7
+
+# Async tool handlers run blocking FTP/parse work on a bounded thread pool of this size
+ASYNC_TOOL_WORKERS: Final[int] = 16
+
+# search_stations: default and largest number of matches returned, and the least trigram
+# overlap (Dice coefficient) for a misspelt name to count as a match
+STATION_SEARCH_LIMIT: Final[int] = 10
+STATION_SEARCH_MAX_LIMIT: Final[int] = 50
+STATION_FUZZY_MIN_SCORE: Final[float] = 0.4
+
+# nearest_stations: stations are bucketed into grid cells this many degrees on a side
+STATION_GRID_CELL_DEG: Final[float] = 1.0
+NEAREST_MAX_K: Final[int] = 50
+
+# Observation history (fast_mcp_server --history DIR): numeric variables recorded per
+# station for each new product version, kept for HISTORY_RETENTION_SECS.
+HISTORY_VARIABLES: Final[tuple[str, ...]] = (
+    "air_temperature",
+    "apparent_temp",
+    "dew_point",
+    "rel-humidity",
+    "wind_spd_kmh",
+    "gust_kmh",
+    "msl_pres",
+    "rainfall",
+)
+HISTORY_RETENTION_SECS: Final[float] = 7 * 24 * 3600.0
+
+# Retry settings. Only transient errors (timeouts, resets, 4xx replies) are retried.
 FTP_TIMEOUT_SECS: Final[float] = 15.0
 MAX_RETRIES: Final[int] = 3
+
+# Each MCP tool call gets this long for all of its FTP work, retries and backoff included;
+# past it the call answers from cached data where it has some, or fails.
+TOOL_DEADLINE_SECS: Final[float] = 10.0
+
+# Hedged requests: an FTP read still running past this percentile of the recent latencies
+# of its kind (once FTP_HEDGE_MIN_SAMPLES are known) is raced by a second one on another
+# pooled session, and the first answer wins. None turns hedging off.
+FTP_HEDGE_PERCENTILE: Final[float | None] = 95.0
+FTP_HEDGE_MIN_SAMPLES: Final[int] = 20
+FTP_HEDGE_WINDOW: Final[int] = 200
+
+# Circuit breaker per FTP host: after this many transient failures in a row calls fail
+# fast (and fall back to cached data) until one trial call after the reset time succeeds.
+FTP_BREAKER_FAILURES: Final[int] = 5
+FTP_BREAKER_RESET_SECS: Final[float] = 30.0
+
+# Session pool: logged-in connections are reused across tool calls. Sessions idle for
+# longer than FTP_KEEPALIVE_SECS are probed with NOOP before reuse; sessions idle for
+# longer than FTP_IDLE_TIMEOUT_SECS are closed (BoM drops idle control channels).
+FTP_POOL_SIZE: Final[int] = 8
+FTP_KEEPALIVE_SECS: Final[float] = 30.0
+FTP_IDLE_TIMEOUT_SECS: Final[float] = 120.0
+
+# Product cache: entries stay fresh until the product's own <amoc> expiry-time or
+# next-routine-issue-time-utc. Products without either (observations) use the TTL.
+CACHE_TTL_SECS: Final[float] = 300.0
+CACHE_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+# The warnings directory listing (MLSD, with modification times) is reused for this long;
+# a warnings file is only downloaded again when its listed time or size changes.
+WARNINGS_LISTING_TTL_SECS: Final[float] = 60.0
+
+# On-disk product cache (fast_mcp_server, unless --no-disk-cache): raw products and their
+# parsed indexes survive restarts so a newly spawned server answers from still-valid data.
+DISK_CACHE_DIR: Final[str] = "~/.cache/mcp-bom-weather"
+DISK_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+
+# Encoded MCP tool results (fast_mcp_server) reused until a product they were built from
+# changes version; least recently used entries beyond this count are dropped.
+RESPONSE_CACHE_MAX_ENTRIES: Final[int] = 256
+
+# Background refresher (fast_mcp_server --refresh): products are re-fetched this long after
+# their next routine issue is due; failed refreshes back off exponentially up to the max.
+REFRESH_GRACE_SECS: Final[float] = 60.0
+REFRESH_RETRY_SECS: Final[float] = 30.0
+REFRESH_MAX_RETRY_SECS: Final[float] = 600.0
+
+# Upper bounds (seconds) of the per-stage latency histogram buckets exported as metrics
+METRICS_BUCKETS_SECS: Final[tuple[float, ...]] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    15.0,
+    60.0,
+)
@@ -1,42 +1,275 @@
 from __future__ import annotations
 
 import argparse
-from typing import Any
+import functools
+import json
+import time
+from collections.abc import Hashable, Sequence
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-from .adapters.bom_adapter import CurrentWeather, Forecast
+# Only the result types are needed to describe the tools; parsers, ElementTree, ftplib and
+# the client are imported on the first tool call so each stdio session starts quickly.
+from .adapters.models import (
+    CurrentWeather,
+    Forecast,
+    NearestStations,
+    ObservationTable,
+    StationHistory,
+    StationSearch,
+    StationTrend,
+)
 
 try:
     # Use FastMCP from the official python-sdk
     from mcp.server.fastmcp import FastMCP
+    from mcp.server.fastmcp.tools import Tool
+    from mcp.types import ContentBlock
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse
 except Exception as e:  # pragma: no cover
     raise RuntimeError(
         "The 'mcp' python-sdk is required. Install with "
         '`uv add "mcp[cli]"` or `pip install "mcp[cli]"`.'
     ) from e
 
-from .tools import weather_tools as tools
+from .config import (
+    DISK_CACHE_DIR,
+    FTP_HOST,
+    FTP_PORT,
+    STATION_SEARCH_LIMIT,
+    TOOL_DEADLINE_SECS,
+)
+from .util.deadline import deadline
+from .util.metrics import METRICS, stage
+from .util.response_cache import ResponseCache, response_key
 
-mcp = FastMCP("mcp-bom-weather")
+if TYPE_CHECKING:
+    from .clients.bom_client import BomClient
+    from .clients.refresher import Refresher
+
+ToolResult = Sequence[ContentBlock] | dict[str, Any]
+
+
+def _convert_result(tool: Tool, result: object) -> ToolResult:
+    out = tool.fn_metadata.convert_result(result)
+    # FastMCP models a TypedDict result with its NotRequired keys defaulting to None and
+    # dumps them all, which a client then rejects against the output schema
+    # ("None is not of type 'integer'"); keys the tool left out stay out.
+    if isinstance(out, tuple) and isinstance(result, dict) and not tool.fn_metadata.wrap_output:
+        content, structured = out
+        return content, {k: v for k, v in structured.items() if k in result}  # type: ignore[return-value]
+    return out
+
+
+# Fields stamped with the time of the call (not of the product) in tool results
+_CALL_TIME_KEYS = ("updated_at", "generated_at")
+
+
+def _call_stamps(value: object) -> frozenset[str]:
+    if isinstance(value, dict):
+        own = {v for k, v in value.items() if k in _CALL_TIME_KEYS and isinstance(v, str)}
+        return frozenset(own).union(*map(_call_stamps, value.values()))
+    if isinstance(value, list):
+        return frozenset().union(*map(_call_stamps, value))
+    return frozenset()
+
+
+def _stamped(value: object, now: str) -> object:
+    if isinstance(value, dict):
+        return {
+            k: now if k in _CALL_TIME_KEYS and isinstance(v, str) else _stamped(v, now)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_stamped(v, now) for v in value]
+    return value
+
+
+class InstrumentedMCP(FastMCP):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.responses = ResponseCache()
+
+    # FastMCP.call_tool runs the tool and converts its result in one step. Here the two are
+    # timed as separate stages, and converted results of product-only tools are reused
+    # until one of their products changes version. The version check and the tool share
+    # one TOOL_DEADLINE_SECS budget.
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> ToolResult:
+        tool = self._tool_manager.get_tool(name)
+        if tool is None:
+            return await super().call_tool(name, arguments)
+        with deadline(time.monotonic() + TOOL_DEADLINE_SECS):
+            return await self._call_tool(tool, name, arguments)
+
+    async def _call_tool(self, tool: Tool, name: str, arguments: dict[str, Any]) -> ToolResult:
+        versions = await _tools().response_versions(name, arguments)
+        key = response_key(name, arguments, versions) if versions is not None else None
+        if key is not None:
+            hit = self.responses.get(key)
+            if hit is not None:
+                return self._reuse(tool, name, key, hit)  # type: ignore[arg-type]
+        with stage("tool", tool=name):
+            result = await tool.run(arguments, context=self.get_context())
+        with stage("serialize", tool=name):
+            out = _convert_result(tool, result)
+        # Stored under the versions read before the tool ran: a product that changed in
+        # the meantime already has a newer version, so no later call asks for this key
+        if key is not None:
+            self.responses.put(key, (result, out, _call_stamps(result)))
+        return out
+
+    def _reuse(
+        self, tool: Tool, name: str, key: Hashable, hit: tuple[object, ToolResult, frozenset[str]]
+    ) -> ToolResult:
+        from .adapters.bom_adapter import _iso_now  # noqa: PLC0415
+
+        result, out, stamps = hit
+        now = _iso_now()
+        if not stamps or stamps == {now}:
+            return out
+        # A reused result says when it was served, not when it was first built: the result
+        # is stamped again and encoded once per second, then reused within that second
+        result = _stamped(result, now)
+        with stage("serialize", tool=name):
+            out = _convert_result(tool, result)
+        self.responses.put(key, (result, out, frozenset({now})))
+        return out
+
+
+mcp = InstrumentedMCP("mcp-bom-weather")
+refresher: Refresher | None = None
+
+# Set from the command line; applied when the shared client is first needed
+ftp_address: tuple[str, int] | None = None
+disk_cache_dir: Path | None = None
+shared_cache_dir: Path | None = None
+history_dir: str | None = None
+
+
+@functools.cache
+def _client() -> BomClient:
+    from .clients.bom_client import default_client  # noqa: PLC0415
+
+    client = default_client()
+    if ftp_address is not None:
+        from .util.ftp import FtpClient  # noqa: PLC0415
+
+        client.host, client.port = ftp_address
+        client.ftp = FtpClient(client.host, port=client.port)
+    if disk_cache_dir is not None:
+        from .util.disk_cache import DiskCache  # noqa: PLC0415
+
+        client.disk = DiskCache(disk_cache_dir)
+    if shared_cache_dir is not None:
+        from .util.shared_cache import SharedCache  # noqa: PLC0415
+
+        client.shared = SharedCache(shared_cache_dir)
+    if history_dir is not None:
+        from .tools.weather_tools import enable_history  # noqa: PLC0415
+
+        enable_history(history_dir, client=client)
+    return client
+
+
+def _tools() -> ModuleType:
+    from .tools import async_tools  # noqa: PLC0415
+
+    _client()
+    return async_tools
+
+
+def _cache_stats() -> dict[str, float]:
+    stats: dict[str, float] = dict(_client().cache.stats())
+    lookups = stats["hits"] + stats["stale"] + stats["misses"]
+    stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+METRICS.collect("bom_cache", _cache_stats)
+METRICS.collect("bom_response_cache", mcp.responses.stats)
+
+
+@mcp.tool()
+async def current_weather(city: str) -> CurrentWeather:
+    """Current conditions in a capital city, or at any BoM observation station given by
+    name, wmo-id or bom-id (see search_stations)."""
+    return await _tools().current_weather(city)
 
 
 @mcp.tool()
-def current_weather(city: str) -> CurrentWeather:
-    return tools.current_weather(city)
+async def forecast(city: str, days: int = 7) -> Forecast:
+    return await _tools().forecast(city, days=days)
 
 
 @mcp.tool()
-def forecast(city: str, days: int = 7) -> Forecast:
-    return tools.forecast(city, days=days)
+async def current_weather_all_major_cities() -> list[CurrentWeather]:
+    return await _tools().current_weather_all_major_cities()
 
 
 @mcp.tool()
-def current_weather_all_major_cities() -> list[CurrentWeather]:
-    return tools.current_weather_all_major_cities()
+async def observations(
+    locations: list[str], variables: list[str] | None = None
+) -> ObservationTable:
+    """Observation variables (e.g. air_temperature, rel-humidity, wind_spd_kmh, msl_pres) for
+    several cities or stations (wmo-id, bom-id or description), as parallel columns."""
+    return await _tools().observations(locations, variables)
 
 
 @mcp.tool()
-def current_warnings() -> dict[str, Any]:
-    return tools.current_warnings()
+async def nearest_stations(
+    lat: float, lon: float, k: int = 5, variables: list[str] | None = None
+) -> NearestStations:
+    """Current observations from the k stations nearest to a latitude/longitude."""
+    return await _tools().nearest_stations(lat, lon, k, variables)
+
+
+@mcp.tool()
+async def search_stations(query: str, limit: int = STATION_SEARCH_LIMIT) -> StationSearch:
+    """BoM observation stations whose name starts with, or resembles, the query (or with
+    that wmo-id/bom-id), best first. Use a match's wmo_id with the other station tools."""
+    return await _tools().search_stations(query, limit)
+
+
+@mcp.tool()
+async def station_history(
+    station: str, hours: float = 24, variables: list[str] | None = None
+) -> StationHistory:
+    """Recorded observations for a city (its reference station) or a station wmo-id over
+    the last N hours. Requires the server to run with --history."""
+    return await _tools().station_history(station, hours, variables)
+
+
+@mcp.tool()
+async def station_trend(
+    station: str, hours: float = 24, variables: list[str] | None = None
+) -> StationTrend:
+    """Min/max/mean and first-to-last change of recorded observations over the last N hours
+    (e.g. "has it cooled since this morning"). Requires the server to run with --history."""
+    return await _tools().station_trend(station, hours, variables)
+
+
+@mcp.tool()
+async def current_warnings() -> dict[str, Any]:
+    return await _tools().current_warnings()
+
+
+@mcp.resource("bom://status/refresher", mime_type="application/json")
+def refresher_status() -> str:
+    jobs = refresher.status() if refresher is not None else []
+    return json.dumps({"enabled": refresher is not None, "jobs": jobs})
+
+
+@mcp.resource("bom://status/metrics", mime_type="application/json")
+def metrics_status() -> str:
+    # Same data as GET /metrics on the HTTP transport, for stdio deployments
+    return json.dumps(METRICS.snapshot())
+
+
+@mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
@@ -46,8 +279,46 @@ if __name__ == "__main__":
     group.add_argument("--http", action="store_true", help="Run Streamable HTTP transport")
     parser.add_argument("--host", default="0.0.0.0", help="HTTP host")
     parser.add_argument("--port", type=int, default=4242, help="HTTP port")
+    parser.add_argument("--ftp-host", default=FTP_HOST, help="BoM FTP server (or a stand-in)")
+    parser.add_argument("--ftp-port", type=int, default=FTP_PORT, help="BoM FTP port")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Keep city and warnings products warm in the background (stale-while-revalidate)",
+    )
+    parser.add_argument(
+        "--history",
+        metavar="DIR",
+        help="Record every new observation product version under DIR for the history tools",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DISK_CACHE_DIR,
+        help="Keep downloaded products and their parsed indexes here across restarts",
+    )
+    parser.add_argument(
+        "--no-disk-cache", action="store_true", help="Start every run with an empty cache"
+    )
+    parser.add_argument(
+        "--shared-cache",
+        metavar="DIR",
+        help="Share downloaded products and their indexes with other server processes using DIR",
+    )
     args = parser.parse_args()
 
+    if (args.ftp_host, args.ftp_port) != (FTP_HOST, FTP_PORT):
+        ftp_address = (args.ftp_host, args.ftp_port)
+    if not args.no_disk_cache:
+        disk_cache_dir = Path(args.cache_dir).expanduser()
+    if args.shared_cache:
+        shared_cache_dir = Path(args.shared_cache).expanduser()
+    history_dir = args.history
+    if args.refresh:
+        from .clients.refresher import Refresher  # noqa: PLC0415
+
+        refresher = Refresher(_client())
+        refresher.start()
+
     if args.http:
         # Configure host/port then run streamable HTTP directly via FastMCP
         mcp.settings.host = args.host
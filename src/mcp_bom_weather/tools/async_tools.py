@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from ..adapters.bom_adapter import unavailable_current
+from ..adapters.models import (
+    CurrentWeather,
+    Forecast,
+    NearestStations,
+    ObservationTable,
+    StationHistory,
+    StationSearch,
+    StationTrend,
+)
+from ..clients.bom_client import BomClient
+from ..config import (
+    ALL_CITIES_CONCURRENCY,
+    ASYNC_TOOL_WORKERS,
+    STATION_SEARCH_LIMIT,
+    SUPPORTED_CITIES,
+    TOOL_DEADLINE_SECS,
+)
+from ..util.deadline import current_deadline, deadline
+from ..util.ftp import FTP_ERRORS, backoff_delays, is_transient, single_attempt
+from ..util.metrics import METRICS
+from ..util.singleflight import AsyncSingleFlight
+from . import weather_tools
+
+T = TypeVar("T")
+
+# Blocking ftplib I/O and XML parsing never run on the event loop; this pool bounds how
+# many of them run at once so one slow BoM download cannot starve other sessions.
+_EXECUTOR = ThreadPoolExecutor(max_workers=ASYNC_TOOL_WORKERS, thread_name_prefix="bom-tool")
+
+# Identical concurrent tool calls on the loop share one offloaded call (and worker thread)
+_flights: AsyncSingleFlight[Any] = AsyncSingleFlight()
+
+
+def _call_deadline() -> float:
+    # The deadline the server opened for the whole MCP tool call (version checks included),
+    # or a fresh one when a tool is called directly
+    at = current_deadline()
+    return time.monotonic() + TOOL_DEADLINE_SECS if at is None else at
+
+
+def _attempt(at: float, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+    with single_attempt(), deadline(at):
+        return fn(*args, **kwargs)
+
+
+async def _offload(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+    loop = asyncio.get_running_loop()
+    # One budget per tool call: every attempt, and the backoff between them, comes out of it
+    at = _call_deadline()
+    call = functools.partial(_attempt, at, fn, *args, **kwargs)
+    delays = backoff_delays()
+    while True:
+        try:
+            return await loop.run_in_executor(_EXECUTOR, call)
+        except FTP_ERRORS as exc:
+            METRICS.inc("bom_ftp_errors_total", error=type(exc).__name__)
+            delay = next(delays, None)
+            if delay is None or not is_transient(exc) or time.monotonic() + delay >= at:
+                raise
+            METRICS.inc("bom_ftp_retries_total")
+            await asyncio.sleep(delay)  # back off without holding a worker thread
+
+
+async def current_weather(city: str, *, client: BomClient | None = None) -> CurrentWeather:
+    return await _flights.do(
+        ("current_weather", city, id(client)),
+        lambda: _offload(weather_tools.current_weather, city, client=client),
+    )
+
+
+async def forecast(city: str, days: int = 7, *, client: BomClient | None = None) -> Forecast:
+    return await _flights.do(
+        ("forecast", city, days, id(client)),
+        lambda: _offload(weather_tools.forecast, city, days=days, client=client),
+    )
+
+
+async def current_weather_all_major_cities(
+    *, client: BomClient | None = None, concurrency: int = ALL_CITIES_CONCURRENCY
+) -> list[CurrentWeather]:
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(city: str) -> CurrentWeather:
+        async with limit:
+            try:
+                return await current_weather(city, client=client)
+            except Exception as exc:
+                return unavailable_current(city, exc)
+
+    return list(await asyncio.gather(*(one(c) for c in SUPPORTED_CITIES)))
+
+
+async def observations(
+    locations: list[str], variables: list[str] | None = None, *, client: BomClient | None = None
+) -> ObservationTable:
+    return await _flights.do(
+        ("observations", tuple(locations), tuple(variables or ()), id(client)),
+        lambda: _offload(weather_tools.observations, locations, variables, client=client),
+    )
+
+
+async def nearest_stations(
+    lat: float,
+    lon: float,
+    k: int = 5,
+    variables: list[str] | None = None,
+    *,
+    client: BomClient | None = None,
+) -> NearestStations:
+    return await _flights.do(
+        ("nearest_stations", lat, lon, k, tuple(variables or ()), id(client)),
+        lambda: _offload(weather_tools.nearest_stations, lat, lon, k, variables, client=client),
+    )
+
+
+async def search_stations(
+    query: str, limit: int = STATION_SEARCH_LIMIT, *, client: BomClient | None = None
+) -> StationSearch:
+    # Catalogue only, no FTP; the first call builds the search index off the event loop
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, functools.partial(weather_tools.search_stations, query, limit, client=client)
+    )
+
+
+async def station_history(
+    station: str,
+    hours: float = 24,
+    variables: list[str] | None = None,
+    *,
+    client: BomClient | None = None,
+) -> StationHistory:
+    # Served from the mapped history files; no FTP, so no retry/backoff wrapper
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR,
+        functools.partial(weather_tools.station_history, station, hours, variables, client=client),
+    )
+
+
+async def station_trend(
+    station: str,
+    hours: float = 24,
+    variables: list[str] | None = None,
+    *,
+    client: BomClient | None = None,
+) -> StationTrend:
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR,
+        functools.partial(weather_tools.station_trend, station, hours, variables, client=client),
+    )
+
+
+async def current_warnings(*, client: BomClient | None = None) -> dict:
+    return await _flights.do(
+        ("current_warnings", id(client)),
+        lambda: _offload(weather_tools.current_warnings, client=client),
+    )
+
+
+async def response_versions(
+    name: str, arguments: dict[str, Any], *, client: BomClient | None = None
+) -> tuple[object, ...] | None:
+    if name not in weather_tools.RESPONSE_DEPENDENCIES:
+        return None
+    # One attempt only: if BoM is unreachable the tool call itself does the retrying
+    at = _call_deadline()
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR,
+        functools.partial(
+            _attempt, at, weather_tools.response_versions, name, arguments, client=client
+        ),
+    )
+
+
+AsyncToolFn = Callable[..., Coroutine[Any, Any, object]]
+
+ASYNC_TOOLS: dict[str, AsyncToolFn] = {
+    "current_weather": current_weather,
+    "forecast": forecast,
+    "current_weather_all_major_cities": current_weather_all_major_cities,
+    "observations": observations,
+    "nearest_stations": nearest_stations,
+    "search_stations": search_stations,
+    "station_history": station_history,
+    "station_trend": station_trend,
+    "current_warnings": current_warnings,
+}
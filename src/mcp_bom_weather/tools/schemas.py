@@ -9,7 +9,7 @@ try:  # Prefer Astral 'ty' Literal if available
 except Exception:  # pragma: no cover
     _Literal = _PyLiteral
 
-from ..adapters.bom_adapter import CurrentWeather, Forecast, ForecastDay
+from ..adapters.models import CurrentWeather, Forecast, ForecastDay
 
 CityLiteral = _Literal[
     "Sydney",
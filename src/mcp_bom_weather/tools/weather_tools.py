@@ -1,53 +1,562 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import contextvars
+import datetime as dt
+import heapq
+import math
+import os
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import PurePosixPath
+from typing import Any, TypeVar
 
 from ..adapters.bom_adapter import (
-    CurrentWeather,
-    Forecast,
+    _iso_now,
     parse_current_from_xml,
     parse_forecast_from_xml,
     parse_warnings_from_xml,
+    unavailable_current,
     validate_city,
 )
-from ..clients.bom_client import BomClient
-from ..config import SUPPORTED_CITIES
+from ..adapters.models import (
+    CurrentWeather,
+    Forecast,
+    NearbyStation,
+    NearestStations,
+    ObservationTable,
+    StationHistory,
+    StationMatch,
+    StationSearch,
+    StationTrend,
+    TrendStats,
+)
+from ..adapters.product_index import ProductIndex, StationObs
+from ..adapters.station_catalogue import CatalogueStation, default_catalogue
+from ..clients.bom_client import NO_WARNINGS_XML, BomClient, default_client
+from ..config import (
+    ALL_CITIES_CONCURRENCY,
+    CITY_STATION_IDS,
+    NEAREST_MAX_K,
+    STATION_SEARCH_LIMIT,
+    STATION_SEARCH_MAX_LIMIT,
+    SUPPORTED_CITIES,
+)
+from ..util.cache import Product
+from ..util.history import HistoryStore
+
+T = TypeVar("T")
+
+# Observation element types returned by observations() when none are requested
+DEFAULT_OBSERVATION_VARIABLES: tuple[str, ...] = (
+    "air_temperature",
+    "apparent_temp",
+    "rel-humidity",
+    "wind_spd_kmh",
+    "gust_kmh",
+    "rainfall",
+    "msl_pres",
+)
 
 
 def current_weather(city: str, *, client: BomClient | None = None) -> CurrentWeather:
-    city = validate_city(city)
-    client = client or BomClient()
-    status, xml_text = client.fetch_city_xml(city)
-    return parse_current_from_xml(city, status, xml_text)
+    """Conditions for a supported city, or for any catalogued station by name or id."""
+    client = client or default_client()
+    if city not in SUPPORTED_CITIES:
+        return _station_weather(city, client)
+    product, index = client.fetch_city_parsed(city)
+    out = index.current(city)
+    if out is None:
+        out = parse_current_from_xml(city, HTTPStatus.OK, product.text)
+    age = client.stale_age(product)
+    if age is not None:
+        out["stale_age_secs"] = age
+    return out
+
+
+def _resolve_station(query: str) -> CatalogueStation:
+    catalogue = default_catalogue()
+    stn = catalogue.resolve(query)
+    if stn is not None:
+        return stn
+    hits = catalogue.search(query, STATION_SEARCH_LIMIT)
+    hint = f" Did you mean: {', '.join(h.station.description for h in hits)}?" if hits else ""
+    raise ValueError(
+        f"Unknown city or station '{query}'. Supported cities: "
+        f"{', '.join(SUPPORTED_CITIES)}; stations by name, wmo-id or bom-id.{hint}"
+    )
+
+
+def _station_weather(query: str, client: BomClient) -> CurrentWeather:
+    entry = _resolve_station(query)
+    product, index = client.fetch_parsed(client.product_path(entry.product))
+    stn = index.station(entry.key)
+    if stn is None:
+        raise LookupError(f"{entry.description} is not in the current {entry.product}")
+    out = CurrentWeather(
+        city=stn.description or entry.description,
+        temp_c=None if math.isnan(stn.air_temp) else stn.air_temp,
+        condition=stn.weather or "Unknown",
+        updated_at=_iso_now(),
+    )
+    age = client.stale_age(product)
+    if age is not None:
+        out["stale_age_secs"] = age
+    return out
 
 
 def forecast(city: str, days: int = 7, *, client: BomClient | None = None) -> Forecast:
     city = validate_city(city)
-    client = client or BomClient()
-    status, xml_text = client.fetch_city_xml(city)
-    return parse_forecast_from_xml(city, status, xml_text, days=days)
+    client = client or default_client()
+    product, index = client.fetch_forecast_parsed(city)
+    out = index.forecast(city, days)
+    if out is None and not index:
+        # Not XML at all (e.g. an HTML error page): the text heuristics are all that's left
+        out = parse_forecast_from_xml(city, HTTPStatus.OK, product.text, days=days)
+    if out is None or not out["days"]:
+        raise LookupError(f"No forecast for {city} in {PurePosixPath(product.path).stem}")
+    age = client.stale_age(product)
+    if age is not None:
+        out["stale_age_secs"] = age
+    return out
+
+
+def _map_in_context(
+    pool: ThreadPoolExecutor, fn: Callable[[str], T], items: list[str]
+) -> Iterable[T]:
+    # Each task runs in a copy of the caller's context, so the FTP deadline and retry mode
+    # set by async_tools apply in the worker threads too.
+    contexts = [contextvars.copy_context() for _ in items]
+    return pool.map(lambda ctx, item: ctx.run(fn, item), contexts, items)
+
+
+def current_weather_all_major_cities(
+    *, client: BomClient | None = None, concurrency: int = ALL_CITIES_CONCURRENCY
+) -> list[CurrentWeather]:
+    bom = client or default_client()
+
+    # A failing city yields a placeholder entry instead of failing the whole call
+    def one(city: str) -> CurrentWeather:
+        try:
+            return current_weather(city, client=bom)
+        except Exception as exc:
+            return unavailable_current(city, exc)
+
+    workers = min(concurrency, len(SUPPORTED_CITIES))
+    if workers <= 1:
+        return [one(c) for c in SUPPORTED_CITIES]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bom-cities") as pool:
+        # map() yields in submission order, so results keep SUPPORTED_CITIES order
+        return list(_map_in_context(pool, one, SUPPORTED_CITIES))
+
+
+def _fetch_all(
+    paths: list[str], fetch: Callable[[str], T], concurrency: int
+) -> dict[str, T | Exception]:
+    def one(path: str) -> T | Exception:
+        try:
+            return fetch(path)
+        except Exception as exc:
+            return exc
+
+    workers = min(concurrency, len(paths))
+    if workers <= 1:
+        return {p: one(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bom-products") as pool:
+        return dict(zip(paths, _map_in_context(pool, one, paths), strict=True))
+
+
+def _find_station(
+    location: str, paths: list[str], indexes: dict[str, ProductIndex]
+) -> tuple[str, StationObs] | None:
+    for path in paths:
+        index = indexes.get(path)
+        if index is None:
+            continue
+        if location in SUPPORTED_CITIES:
+            stn = index.station_for(location)
+        else:
+            stn = index.station(location)
+        if stn is not None:
+            return path, stn
+    return None
+
+
+def _station_source(bom: BomClient, location: str) -> tuple[str, str] | None:
+    # Product path and lookup key of a city or catalogued station, without fetching
+    if location in SUPPORTED_CITIES:
+        return bom.city_path(location), location
+    stn = default_catalogue().resolve(location)
+    return (bom.product_path(stn.product), stn.key) if stn is not None else None
+
+
+def _observation_paths(bom: BomClient, locations: Iterable[str]) -> list[str]:
+    sources = [_station_source(bom, loc) for loc in locations]
+    if all(sources):
+        return list(dict.fromkeys(src[0] for src in sources))  # type: ignore[index]
+    # A station missing from the catalogue could be in any state file: search them all
+    return _all_city_paths(bom)
+
+
+def _all_city_paths(bom: BomClient) -> list[str]:
+    return list(dict.fromkeys(bom.city_path(c) for c in SUPPORTED_CITIES))
+
+
+def observations(
+    locations: list[str],
+    variables: list[str] | None = None,
+    *,
+    client: BomClient | None = None,
+    concurrency: int = ALL_CITIES_CONCURRENCY,
+) -> ObservationTable:
+    """Selected observation variables for many cities/stations as one columnar table.
+
+    A location is a city (its reference station) or a station wmo-id, bom-id or
+    description. Requests are grouped by product so each state file is fetched and
+    indexed once, however many of its stations are asked for.
+    """
+    bom = client or default_client()
+    variables = list(variables or DEFAULT_OBSERVATION_VARIABLES)
+    paths = _observation_paths(bom, locations)
+    fetched = _fetch_all(paths, bom.fetch_parsed, concurrency)
+    indexes = {p: res[1] for p, res in fetched.items() if not isinstance(res, Exception)}
+
+    table = ObservationTable(
+        variables=variables,
+        location=[],
+        station=[],
+        wmo_id=[],
+        product=[],
+        time_utc=[],
+        values={v: [] for v in variables},
+    )
+    errors: dict[str, str] = {}
+    used: set[str] = set()
+    for loc in locations:
+        source = _station_source(bom, loc)
+        if source is not None:
+            found = _find_station(source[1], [source[0]], indexes)
+        else:
+            found = _find_station(loc, paths, indexes)
+        stn = found[1] if found else None
+        table["location"].append(loc)
+        table["station"].append(stn.description if stn else None)
+        table["wmo_id"].append(stn.wmo_id if stn else None)
+        table["product"].append(PurePosixPath(found[0]).stem if found else None)
+        table["time_utc"].append(stn.time_utc if stn else None)
+        for v in variables:
+            table["values"][v].append(stn.value(v) if stn else None)
+        if found:
+            used.add(found[0])
+            continue
+        failed = fetched.get(source[0]) if source is not None else None
+        if isinstance(failed, Exception):
+            errors[loc] = f"{type(failed).__name__}: {failed}"
+        else:
+            errors[loc] = f"No observation station matches '{loc}'"
+
+    if errors:
+        table["errors"] = errors
+    age = _stale_age(bom, (fetched[p][0] for p in used))  # type: ignore[index]
+    if age is not None:
+        table["stale_age_secs"] = age
+    return table
 
 
-def current_weather_all_major_cities(*, client: BomClient | None = None) -> list[CurrentWeather]:
-    client = client or BomClient()
-    out: list[CurrentWeather] = []
-    for c in SUPPORTED_CITIES:
-        status, xml_text = client.fetch_city_xml(c)
-        out.append(parse_current_from_xml(c, status, xml_text))
+def search_stations(
+    query: str, limit: int = STATION_SEARCH_LIMIT, *, client: BomClient | None = None
+) -> StationSearch:
+    """Catalogued stations matching a name (prefix or misspelt) or id, best first.
+
+    Answered from the station catalogue alone: no product is downloaded or parsed.
+    """
+    if not 1 <= limit <= STATION_SEARCH_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {STATION_SEARCH_MAX_LIMIT}")
+    matches = [
+        StationMatch(
+            station=h.station.description,
+            name=h.station.name,
+            wmo_id=h.station.wmo_id,
+            bom_id=h.station.bom_id,
+            state=h.station.state,
+            product=h.station.product,
+            lat=h.station.lat,
+            lon=h.station.lon,
+            score=round(h.score, 3),
+            match=h.match,
+        )
+        for h in default_catalogue().search(query, limit)
+    ]
+    return StationSearch(query=query, matches=matches)
+
+
+_MAX_LAT = 90.0
+_MAX_LON = 180.0
+
+
+def _stale_age(client: BomClient, products: Iterable[Product]) -> int | None:
+    ages = [a for a in (client.stale_age(p) for p in products) if a is not None]
+    return max(ages) if ages else None
+
+
+def nearest_stations(  # noqa: PLR0913
+    lat: float,
+    lon: float,
+    k: int = 5,
+    variables: list[str] | None = None,
+    *,
+    client: BomClient | None = None,
+    concurrency: int = ALL_CITIES_CONCURRENCY,
+) -> NearestStations:
+    """The ``k`` observation stations closest to ``lat``/``lon`` across all state files."""
+    if not (abs(lat) <= _MAX_LAT and abs(lon) <= _MAX_LON):
+        raise ValueError(f"Invalid coordinates {lat}, {lon}")
+    if not 1 <= k <= NEAREST_MAX_K:
+        raise ValueError(f"k must be between 1 and {NEAREST_MAX_K}")
+    bom = client or default_client()
+    variables = list(variables or DEFAULT_OBSERVATION_VARIABLES)
+    paths = list(dict.fromkeys(bom.city_path(c) for c in SUPPORTED_CITIES))
+    fetched = _fetch_all(paths, bom.fetch_parsed, concurrency)
+
+    errors: dict[str, str] = {}
+    candidates: list[tuple[float, str, StationObs]] = []
+    for path, res in fetched.items():
+        product_id = PurePosixPath(path).stem
+        if isinstance(res, Exception):
+            errors[product_id] = f"{type(res).__name__}: {res}"
+            continue
+        grid = res[1].grid
+        candidates.extend((d, path, stn) for d, stn in grid.nearest(lat, lon, k))
+
+    stations: list[NearbyStation] = []
+    used: set[str] = set()
+    for d, path, stn in heapq.nsmallest(k, candidates, key=lambda c: c[0]):
+        used.add(path)
+        stations.append(
+            NearbyStation(
+                station=stn.description,
+                wmo_id=stn.wmo_id,
+                bom_id=stn.bom_id,
+                product=PurePosixPath(path).stem,
+                lat=stn.lat,
+                lon=stn.lon,
+                distance_km=round(d, 2),
+                time_utc=stn.time_utc,
+                values={v: stn.value(v) for v in variables},
+            )
+        )
+    out = NearestStations(lat=lat, lon=lon, stations=stations)
+    if errors:
+        out["errors"] = errors
+    age = _stale_age(bom, (fetched[p][0] for p in used))  # type: ignore[index]
+    if age is not None:
+        out["stale_age_secs"] = age
     return out
 
 
+def _epoch(iso: str | None) -> int | None:
+    if not iso:
+        return None
+    try:
+        return int(dt.datetime.fromisoformat(iso.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return None
+
+
+def _iso_utc(ts: float) -> str:
+    return dt.datetime.fromtimestamp(ts, dt.UTC).isoformat().replace("+00:00", "Z")
+
+
+def record_history(
+    product: Product, store: HistoryStore, *, client: BomClient | None = None
+) -> int:
+    """Append every station's reading in ``product`` to ``store``; returns rows added."""
+    bom = client or default_client()
+    added = 0
+    for stn in bom.indexes.get(product, bom.disk).stations:
+        key = stn.wmo_id or stn.bom_id
+        t = _epoch(stn.time_utc)
+        if not key or t is None:
+            continue
+        row = [v if isinstance(v := stn.value(var), float) else None for var in store.variables]
+        added += store.append(key, t, row)
+    return added
+
+
+def enable_history(
+    directory: str | os.PathLike[str], *, client: BomClient | None = None
+) -> HistoryStore:
+    """Record each new observation product version the client downloads into ``directory``."""
+    bom = client or default_client()
+    store = HistoryStore(directory)
+    bom.history = store
+    observation_paths = set(_all_city_paths(bom))
+
+    def listener(product: Product) -> None:
+        # Warnings and forecast products hold no station readings: don't index them
+        if product.path in observation_paths:
+            record_history(product, store, client=bom)
+
+    bom.listeners.append(listener)
+    return store
+
+
+def _history_query(
+    bom: BomClient, station: str, hours: float, variables: list[str] | None
+) -> tuple[HistoryStore, str, list[str], list[tuple[float, ...]]]:
+    store = bom.history
+    if store is None:
+        raise RuntimeError("Observation history is not enabled (start the server with --history)")
+    if not 0 < hours <= store.retention / 3600:
+        raise ValueError(f"hours must be between 0 and {store.retention / 3600:g}")
+    variables = list(variables or store.variables)
+    unknown = [v for v in variables if v not in store.variables]
+    if unknown:
+        raise ValueError(f"Not recorded: {', '.join(unknown)}. Recorded: {store.variables}")
+    key = CITY_STATION_IDS.get(station)
+    if key is None:
+        stn = default_catalogue().resolve(station)
+        key = stn.key if stn is not None else station
+    now = bom.cache.clock()
+    return store, key, variables, store.window(key, now - hours * 3600, now)
+
+
+def station_history(
+    station: str,
+    hours: float = 24,
+    variables: list[str] | None = None,
+    *,
+    client: BomClient | None = None,
+) -> StationHistory:
+    """Recorded readings for a city's station (or a wmo-id) over the last ``hours``."""
+    bom = client or default_client()
+    store, key, variables, rows = _history_query(bom, station, hours, variables)
+    columns = [1 + store.variables.index(v) for v in variables]
+    return StationHistory(
+        station=station,
+        key=key,
+        time_utc=[_iso_utc(r[0]) for r in rows],
+        values={
+            v: [None if math.isnan(r[c]) else r[c] for r in rows]
+            for v, c in zip(variables, columns, strict=True)
+        },
+    )
+
+
+def _trend(values: list[float]) -> TrendStats:
+    if not values:
+        return TrendStats(
+            count=0, min=None, max=None, mean=None, first=None, last=None, change=None
+        )
+    return TrendStats(
+        count=len(values),
+        min=min(values),
+        max=max(values),
+        mean=round(sum(values) / len(values), 3),
+        first=values[0],
+        last=values[-1],
+        change=round(values[-1] - values[0], 3),
+    )
+
+
+def station_trend(
+    station: str,
+    hours: float = 24,
+    variables: list[str] | None = None,
+    *,
+    client: BomClient | None = None,
+) -> StationTrend:
+    """Min/max/mean and first-to-last change per variable over the last ``hours``."""
+    bom = client or default_client()
+    store, key, variables, rows = _history_query(bom, station, hours, variables)
+    stats: dict[str, TrendStats] = {}
+    for v in variables:
+        c = 1 + store.variables.index(v)
+        stats[v] = _trend([r[c] for r in rows if not math.isnan(r[c])])
+    return StationTrend(
+        station=station,
+        key=key,
+        hours=hours,
+        from_utc=_iso_utc(rows[0][0]) if rows else None,
+        to_utc=_iso_utc(rows[-1][0]) if rows else None,
+        stats=stats,
+    )
+
+
 def current_warnings(*, client: BomClient | None = None) -> dict:
-    client = client or BomClient()
-    status, xml_text = client.fetch_warnings_xml()
-    return parse_warnings_from_xml(status, xml_text)
+    client = client or default_client()
+    product = client.fetch_warnings_product()
+    if product is None:
+        return parse_warnings_from_xml(HTTPStatus.OK, NO_WARNINGS_XML)
+    out = parse_warnings_from_xml(HTTPStatus.OK, product.text)
+    age = client.stale_age(product)
+    if age is not None:
+        out["stale_age_secs"] = age
+    return out
 
 
 ToolFn = Callable[..., object]
 
+
+def _current_path(bom: BomClient, arguments: Mapping[str, Any]) -> list[str]:
+    source = _station_source(bom, arguments["city"])
+    if source is None:
+        raise ValueError(arguments["city"])
+    return [source[0]]
+
+
+def _forecast_path(bom: BomClient, arguments: Mapping[str, Any]) -> list[str]:
+    return [bom.forecast_path(validate_city(arguments["city"]))]
+
+
+# Products each tool's answer is built from, given its arguments. Only tools whose result
+# is a pure function of those products are listed: the history tools read the clock and
+# current_warnings depends on a directory listing. search_stations reads no product.
+RESPONSE_DEPENDENCIES: dict[str, Callable[[BomClient, Mapping[str, Any]], list[str]]] = {
+    "current_weather": _current_path,
+    "forecast": _forecast_path,
+    "current_weather_all_major_cities": lambda bom, args: _all_city_paths(bom),
+    "observations": lambda bom, args: _observation_paths(bom, args["locations"]),
+    "nearest_stations": lambda bom, args: _all_city_paths(bom),
+    "search_stations": lambda bom, args: [],
+}
+
+
+def response_versions(
+    name: str,
+    arguments: Mapping[str, Any],
+    *,
+    client: BomClient | None = None,
+    concurrency: int = ALL_CITIES_CONCURRENCY,
+) -> tuple[object, ...] | None:
+    """Versions of the products ``name(**arguments)`` would answer from.
+
+    None when the answer can't be reused: the tool isn't product-only, the arguments are
+    invalid, a product could not be fetched, or a product is past its reissue time (the
+    answer then carries a growing ``stale_age_secs``).
+    """
+    deps = RESPONSE_DEPENDENCIES.get(name)
+    if deps is None:
+        return None
+    bom = client or default_client()
+    try:
+        paths = deps(bom, arguments)
+    except (KeyError, TypeError, ValueError):
+        return None
+    products = list(_fetch_all(paths, bom.fetch_product, concurrency).values())
+    if not all(isinstance(p, Product) and bom.stale_age(p) is None for p in products):
+        return None
+    return tuple(p.version for p in products)  # type: ignore[union-attr]
+
+
 TOOLS: dict[str, ToolFn] = {
     "current_weather": current_weather,
     "forecast": forecast,
     "current_weather_all_major_cities": current_weather_all_major_cities,
+    "observations": observations,
+    "nearest_stations": nearest_stations,
+    "search_stations": search_stations,
+    "station_history": station_history,
+    "station_trend": station_trend,
     "current_warnings": current_warnings,
 }
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import datetime as dt
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ..config import CACHE_MAX_BYTES, CACHE_TTL_SECS
+from .ftp import RemoteStat
+
+# The <amoc> header sits at the top of every product; never scan past it
+_AMOC_SCAN_CHARS = 4096
+_AMOC_TIME_RES = tuple(
+    re.compile(rf"<{tag}>\s*([^<\s]+)\s*</{tag}>")
+    for tag in ("expiry-time", "next-routine-issue-time-utc")
+)
+
+
+def _parse_utc(value: str) -> float | None:
+    try:
+        parsed = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.UTC)
+    return parsed.timestamp()
+
+
+def amoc_expiry(text: str) -> float | None:
+    """Earliest of the product's expiry and next routine issue time (epoch secs)."""
+    head = text[:_AMOC_SCAN_CHARS]
+    times: list[float] = []
+    for regex in _AMOC_TIME_RES:
+        m = regex.search(head)
+        if m:
+            ts = _parse_utc(m.group(1))
+            if ts is not None:
+                times.append(ts)
+    return min(times) if times else None
+
+
+# A downloaded product file as served to callers; fetched_at is when BoM last confirmed it
+@dataclass(frozen=True, slots=True)
+class Product:
+    path: str
+    text: str
+    fetched_at: float
+    expires_at: float
+    validator: RemoteStat | None = None
+
+    @property
+    def version(self) -> object:
+        # MDTM/SIZE survive revalidation; without them each download is a new version
+        if self.validator is not None and self.validator.mtime is not None:
+            return self.validator
+        return self.fetched_at
+
+
+class ProductCache:
+    """In-process, size-bounded LRU of raw product files keyed by FTP path."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = CACHE_MAX_BYTES,
+        ttl: float = CACHE_TTL_SECS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Product] = OrderedDict()
+        self._sizes: dict[str, int] = {}  # UTF-8 bytes of each entry's text
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    def _expiry_for(self, text: str, now: float) -> float:
+        expires = amoc_expiry(text)
+        # A routine issue that is already overdue tells us nothing; fall back to the TTL
+        if expires is None or expires <= now:
+            return now + self.ttl
+        return expires
+
+    def is_fresh(self, entry: Product) -> bool:
+        return entry.expires_at > self.clock()
+
+    def stale_age(self, entry: Product) -> int | None:
+        """Seconds since ``entry`` was fetched if it is past its expiry, else None."""
+        now = self.clock()
+        if entry.expires_at > now:
+            return None
+        return int(now - entry.fetched_at)
+
+    def get(self, path: str) -> Product | None:
+        # Returns stale entries too (counted separately) so callers can fall back to them
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(path)
+            if entry.expires_at > self.clock():
+                self.hits += 1
+            else:
+                self.stale += 1
+            return entry
+
+    def peek(self, path: str) -> Product | None:
+        # Uncounted lookup for refreshes that happen off the request path
+        with self._lock:
+            return self._entries.get(path)
+
+    def put(self, path: str, text: str, validator: RemoteStat | None = None) -> Product:
+        now = self.clock()
+        return self._store(Product(path, text, now, self._expiry_for(text, now), validator))
+
+    def restore(self, entry: Product) -> Product:
+        # Re-admit a product kept elsewhere (the disk cache) with its original freshness
+        return self._store(entry)
+
+    def revalidate(self, entry: Product) -> Product:
+        # The server confirmed the file is unchanged: keep the text, restart its freshness
+        now = self.clock()
+        with self._lock:
+            self.revalidated += 1
+        return self._store(Product(entry.path, entry.text, now, now + self.ttl, entry.validator))
+
+    def _store(self, entry: Product) -> Product:
+        path = entry.path
+        size = len(entry.text.encode("utf-8"))
+        with self._lock:
+            if self._entries.pop(path, None) is not None:
+                self._bytes -= self._sizes.pop(path)
+            if size > self.max_bytes:
+                return entry
+            self._entries[path] = entry
+            self._sizes[path] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(evicted)
+                self.evictions += 1
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "revalidated": self.revalidated,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# time.monotonic() by which the current call's FTP work must be done (see deadline()).
+# Kept apart from util.ftp so the server can open a call's deadline without importing ftplib.
+_deadline: ContextVar[float | None] = ContextVar("ftp_deadline", default=None)
+
+
+@contextmanager
+def deadline(at: float) -> Iterator[None]:
+    """Bound all FTP work in the block (attempts, retries, backoff) by ``at`` (monotonic).
+
+    Nested deadlines keep the earlier one. Worker threads only see it when they run in a
+    copy of the caller's context (``contextvars.copy_context()``).
+    """
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(at, current))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> float | None:
+    """The current deadline (monotonic), or None without one."""
+    return _deadline.get()
+
+
+def time_left() -> float | None:
+    """Seconds until the current deadline, or None without one."""
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
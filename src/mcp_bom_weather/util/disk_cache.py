@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+
+from ..config import DISK_CACHE_MAX_BYTES
+from .cache import Product
+from .ftp import RemoteStat
+
+log = logging.getLogger(__name__)
+
+# Cached objects are unpickled, so only the user running the server may write them
+PRIVATE_DIR = 0o700
+_WRITABLE_BY_OTHERS = 0o022
+
+
+def owned_by_user(st: os.stat_result) -> bool:
+    """Whether a cache file was written by this user and can only be changed by them."""
+    if not hasattr(os, "getuid"):  # pragma: no cover - not POSIX
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & _WRITABLE_BY_OTHERS
+
+
+def digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    # Readers (possibly another server process) see the old file or the new one, never half
+    path.parent.mkdir(mode=PRIVATE_DIR, parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class DiskCache:
+    """Product files (and objects derived from them) kept on disk across restarts.
+
+    Content is stored once per SHA-256 of the text under ``objects/``, zlib-compressed.
+    ``refs/`` maps each FTP path to its latest content plus the fetch time, expiry and
+    MDTM/SIZE validator, so a new process resumes with the same freshness as the last one.
+    Least recently used objects are removed once they exceed ``max_bytes``. The directories
+    are created private to the user, and files anyone else could have written are ignored.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_bytes: int = DISK_CACHE_MAX_BYTES
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes under objects/: counted on the first store, then kept up to date
+        self._total: int | None = None
+        self.directory.mkdir(mode=PRIVATE_DIR, parents=True, exist_ok=True)
+        for sub in ("objects", "refs"):
+            (self.directory / sub).mkdir(mode=PRIVATE_DIR, exist_ok=True)
+
+    def _object(self, key: str, kind: str) -> Path:
+        return self.directory / "objects" / key[:2] / f"{key}.{kind}.z"
+
+    def _ref(self, path: str) -> Path:
+        return self.directory / "refs" / (hashlib.sha256(path.encode()).hexdigest() + ".json")
+
+    def _read(self, obj: Path) -> bytes | None:
+        try:
+            with obj.open("rb") as f:
+                if not owned_by_user(os.fstat(f.fileno())):
+                    log.warning("Ignoring cached %s: not written by this user", obj)
+                    return None
+                data = zlib.decompress(f.read())
+            os.utime(obj)  # recency for eviction
+        except (OSError, zlib.error):
+            return None
+        return data
+
+    def _write(self, obj: Path, data: bytes) -> None:
+        try:
+            replaced = obj.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        _atomic_write(obj, data)
+        with self._lock:
+            if self._total is not None:
+                self._total += len(data) - replaced
+        self._evict()
+
+    def load(self, path: str) -> Product | None:
+        try:
+            ref = json.loads(self._ref(path).read_text(encoding="utf-8"))
+            key, fetched_at, expires_at = ref["sha256"], ref["fetched_at"], ref["expires_at"]
+            validator = RemoteStat(*ref["validator"]) if ref.get("validator") else None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        raw = self._read(self._object(key, "xml"))
+        if raw is None:
+            return None  # evicted; the ref is rewritten on the next download
+        return Product(path, raw.decode("utf-8"), fetched_at, expires_at, validator)
+
+    def store(self, product: Product) -> str:
+        key = digest(product.text)
+        obj = self._object(key, "xml")
+        try:
+            os.utime(obj)  # same content again (e.g. revalidated): only the ref changes
+        except FileNotFoundError:
+            self._write(obj, zlib.compress(product.text.encode("utf-8")))
+        validator = product.validator
+        ref = {
+            "path": product.path,
+            "sha256": key,
+            "fetched_at": product.fetched_at,
+            "expires_at": product.expires_at,
+            "validator": [validator.mtime, validator.size] if validator else None,
+        }
+        _atomic_write(self._ref(product.path), json.dumps(ref).encode("utf-8"))
+        return key
+
+    def load_object(self, key: str, kind: str) -> object | None:
+        raw = self._read(self._object(key, kind))
+        if raw is None:
+            return None
+        try:
+            # Written by store_object; _read refuses files anyone else could have written
+            return pickle.loads(raw)
+        except Exception:
+            log.warning("Discarding unreadable cached %s %s", kind, key)
+            return None
+
+    def store_object(self, key: str, kind: str, value: object) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._write(self._object(key, kind), zlib.compress(data))
+
+    def _objects(self) -> list[tuple[float, int, Path]]:
+        files = []
+        for obj in (self.directory / "objects").glob("*/*.z"):
+            try:
+                st = obj.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, obj))
+        return files
+
+    def _evict(self) -> None:
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._objects())
+            if self._total <= self.max_bytes:
+                return
+            # Over the cap: list the objects again, which also counts those written by
+            # other processes sharing the directory, and drop the least recently used
+            files = self._objects()
+            total = sum(size for _, size, _ in files)
+            for _, size, obj in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                obj.unlink(missing_ok=True)
+                total -= size
+            self._total = total
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in (self.directory / "objects").glob("*/*.z"))
@@ -1,55 +1,512 @@
 from __future__ import annotations
 
-import io
+import codecs
+import contextvars
+import math
+import threading
 import time
-from collections.abc import Callable
-from ftplib import FTP
-from typing import TypeVar
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from ftplib import FTP, all_errors, error_perm, error_temp
+from typing import Protocol, TypeVar
 
-from ..config import FTP_TIMEOUT_SECS, MAX_RETRIES
+from ..config import (
+    FTP_BREAKER_FAILURES,
+    FTP_BREAKER_RESET_SECS,
+    FTP_HEDGE_MIN_SAMPLES,
+    FTP_HEDGE_PERCENTILE,
+    FTP_HEDGE_WINDOW,
+    FTP_IDLE_TIMEOUT_SECS,
+    FTP_KEEPALIVE_SECS,
+    FTP_POOL_SIZE,
+    FTP_PORT,
+    FTP_TIMEOUT_SECS,
+    MAX_RETRIES,
+)
+from .deadline import time_left
+from .metrics import METRICS, stage, timed
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """The caller's deadline passed before the FTP work finished."""
+
+
+class CircuitOpen(ConnectionError):
+    """The host failed repeatedly; calls fail fast until a trial call succeeds."""
+
+
+# Errors that mean the control channel is gone (timeouts, resets, 421 from the server)
+_CHANNEL_ERRORS: tuple[type[Exception], ...] = (EOFError, OSError, error_temp)
+
+# Failures worth another attempt. A 5xx reply (e.g. 550 no such file) would only fail
+# again, and neither a spent deadline nor an open circuit gets better by retrying.
+TRANSIENT_ERRORS = _CHANNEL_ERRORS
+
+# Any FTP failure: callers holding a cached copy fall back to it on these
+FTP_ERRORS: tuple[type[BaseException], ...] = all_errors
+
+
+def is_transient(exc: BaseException) -> bool:
+    return isinstance(exc, TRANSIENT_ERRORS) and not isinstance(exc, DeadlineExceeded | CircuitOpen)
+
+
+# Async callers back off on the event loop and run each attempt on a worker thread;
+# they switch the blocking in-thread retry loop off for the duration of the attempt.
+_inline_retries: ContextVar[bool] = ContextVar("ftp_inline_retries", default=True)
+
+
+def backoff_delays() -> Iterator[float]:
+    """Sleeps between attempts: one fewer than MAX_RETRIES, doubling up to 5s."""
+    delay = 0.5
+    for _ in range(MAX_RETRIES - 1):
+        yield delay
+        delay = min(delay * 2, 5.0)
+
+
+def _budget(cap: float = FTP_TIMEOUT_SECS) -> float:
+    # Timeout for one blocking step: the usual cap, shortened to what the deadline leaves
+    left = time_left()
+    if left is None:
+        return cap
+    if left <= 0:
+        raise DeadlineExceeded("FTP deadline exceeded")
+    return min(cap, left)
+
+
+@contextmanager
+def single_attempt() -> Iterator[None]:
+    token = _inline_retries.set(False)
+    try:
+        yield
+    finally:
+        _inline_retries.reset(token)
+
+
+class _Session:
+    __slots__ = ("ftp", "last_used")
+
+    def __init__(self, ftp: FTP, last_used: float) -> None:
+        self.ftp = ftp
+        self.last_used = last_used
+
+
+def _set_timeout(ftp: FTP, secs: float) -> None:
+    # ftplib uses .timeout for new data connections; the control socket has its own
+    ftp.timeout = secs
+    sock = getattr(ftp, "sock", None)
+    if sock is not None:
+        sock.settimeout(secs)
+
+
+def _close(ftp: FTP) -> None:
+    try:
+        ftp.close()
+    except Exception:
+        pass
+
+
+class CircuitBreaker:
+    """Fails calls to one host fast while it keeps failing.
+
+    After ``threshold`` transient failures in a row the circuit opens: calls raise
+    CircuitOpen without touching the network. Once ``reset_after`` seconds have passed a
+    single trial call goes through; its success closes the circuit, its failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        threshold: int = FTP_BREAKER_FAILURES,
+        reset_after: float = FTP_BREAKER_RESET_SECS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half_open" if self._trial else "open"
+
+    def allow(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if not self._trial and self._clock() - self._opened_at >= self.reset_after:
+                self._trial = True  # this caller is the trial; the rest keep failing fast
+                return
+        METRICS.inc("bom_ftp_short_circuits_total")
+        raise CircuitOpen(f"FTP circuit for {self.host} is open")
+
+    def success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or (self._opened_at is None and self._failures >= self.threshold):
+                if self._opened_at is None:
+                    METRICS.inc("bom_ftp_circuit_opened_total")
+                self._opened_at = self._clock()
+                self._trial = False
+
+
+class FtpPool:
+    """Bounded pool of logged-in anonymous FTP sessions for one host."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        *,
+        port: int = FTP_PORT,
+        size: int = FTP_POOL_SIZE,
+        keepalive: float = FTP_KEEPALIVE_SECS,
+        idle_timeout: float = FTP_IDLE_TIMEOUT_SECS,
+        factory: Callable[[], FTP] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.size = size
+        self.keepalive = keepalive
+        self.idle_timeout = idle_timeout
+        self._factory = factory or self._connect
+        self._clock = clock
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: deque[_Session] = deque()
+        self.breaker = CircuitBreaker(host, clock=clock)
+
+    def _connect(self) -> FTP:
+        ftp = FTP()
+        with stage("ftp_connect"):
+            ftp.connect(self.host, self.port, timeout=_budget())
+        with stage("ftp_login"):
+            ftp.login()  # anonymous
+        return ftp
+
+    def _evict_idle(self, now: float) -> None:
+        # Oldest sessions sit on the left; the right end is the most recently used
+        expired: list[_Session] = []
+        with self._lock:
+            while self._idle and now - self._idle[0].last_used > self.idle_timeout:
+                expired.append(self._idle.popleft())
+        for sess in expired:
+            _close(sess.ftp)
+
+    def _checkout(self) -> tuple[_Session, bool]:
+        while True:
+            now = self._clock()
+            self._evict_idle(now)
+            with self._lock:
+                sess = self._idle.pop() if self._idle else None
+            if sess is None:
+                return _Session(self._factory(), now), False
+            if now - sess.last_used > self.keepalive:
+                try:
+                    sess.ftp.voidcmd("NOOP")
+                except Exception:
+                    _close(sess.ftp)
+                    continue
+            return sess, True
+
+    def _checkin(self, sess: _Session) -> None:
+        sess.last_used = self._clock()
+        with self._lock:
+            self._idle.append(sess)
+
+    def _attempt(self, sess: _Session, op: Callable[[FTP], T]) -> T:
+        try:
+            timeout = _budget()
+        except DeadlineExceeded:
+            self._checkin(sess)
+            raise
+        try:
+            _set_timeout(sess.ftp, timeout)
+            result = op(sess.ftp)
+        except error_perm:
+            # e.g. 550 file not found: the session itself is still healthy
+            self._checkin(sess)
+            raise
+        except BaseException:
+            _close(sess.ftp)
+            raise
+        self._checkin(sess)
+        return result
+
+    def run(self, op: Callable[[FTP], T]) -> T:
+        if not self._slots.acquire(timeout=_budget()):
+            raise TimeoutError(f"No FTP session available for {self.host}")
+        try:
+            sess, reused = self._checkout()
+            try:
+                return self._attempt(sess, op)
+            except _CHANNEL_ERRORS as exc:
+                if not reused or not is_transient(exc):
+                    raise
+            # A pooled session died between keepalives: reconnect once, transparently
+            return self._attempt(_Session(self._factory(), self._clock()), op)
+        finally:
+            self._slots.release()
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._idle)
+            self._idle.clear()
+        for sess in sessions:
+            try:
+                sess.ftp.quit()
+            except Exception:
+                _close(sess.ftp)
+
+
+_POOLS: dict[tuple[str, int], FtpPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def shared_pool(host: str, port: int = FTP_PORT) -> FtpPool:
+    with _POOLS_LOCK:
+        pool = _POOLS.get((host, port))
+        if pool is None:
+            pool = _POOLS[host, port] = FtpPool(host, port=port)
+        return pool
+
+
+@dataclass(frozen=True, slots=True)
+class RemoteStat:
+    mtime: str | None  # MDTM reply, e.g. "20250817113324"
+    size: int | None
+
+    def matches(self, other: RemoteStat | None) -> bool:
+        # A size match alone is too weak; require the modification time as well
+        return other is not None and self.mtime is not None and self == other
+
+
+@timed("ftp_stat")
+def _stat(ftp: FTP, path: str) -> RemoteStat:
+    try:
+        mtime: str | None = ftp.sendcmd(f"MDTM {path}").split(None, 1)[1].strip()
+    except (error_perm, IndexError):
+        mtime = None
+    try:
+        ftp.voidcmd("TYPE I")  # SIZE is only defined for binary mode on most servers
+        size = ftp.size(path)
+    except error_perm:
+        size = None
+    return RemoteStat(mtime, size)
+
+
+class StreamSink(Protocol):
+    def feed(self, chunk: str) -> object: ...
+
+    def close(self) -> object: ...
+
+
+# Called at the start of each RETR attempt (a retry, or a hedge racing the first one);
+# returns the consumer for that attempt's text, which is closed once it has all of it
+StreamFactory = Callable[[], StreamSink]
+
+
+def _retr(ftp: FTP, path: str, encoding: str, stream: StreamFactory | None = None) -> str:
+    # Each block is decoded as it arrives and handed to the stream consumer (a parser), so
+    # parsing overlaps the transfer; the blocks are joined into the text exactly once.
+    # The full text is kept even when streaming: every caller stores it in the product
+    # cache (and the disk and shared caches), which serve it without downloading again.
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    sink = stream() if stream is not None else None
+    parts: list[str] = []
+    received = 0
+
+    def block(data: bytes) -> None:
+        nonlocal received
+        received += len(data)
+        text = decoder.decode(data)
+        if text:
+            parts.append(text)
+            if sink is not None:
+                sink.feed(text)
+
+    with stage("ftp_retr"):
+        ftp.retrbinary(f"RETR {path}", block)
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            parts.append(tail)
+            if sink is not None:
+                sink.feed(tail)
+    if sink is not None:
+        sink.close()
+    METRICS.inc("bom_ftp_bytes_total", received)
+    return "".join(parts)
+
+
+# Hedged attempts run here, so the caller can return as soon as either one answers
+_HEDGES = ThreadPoolExecutor(max_workers=2 * FTP_POOL_SIZE, thread_name_prefix="ftp-hedge")
 
 
 class FtpClient:
-    def __init__(self, host: str) -> None:
+    def __init__(self, host: str, pool: FtpPool | None = None, *, port: int = FTP_PORT) -> None:
         self.host = host
+        self.pool = pool or shared_pool(host, port)
+        self._lock = threading.Lock()
+        # Recent successful attempt durations per kind of call, for the hedge delay
+        self._latencies: dict[str, deque[float]] = {}
 
-    def _with_retries(self, fn: Callable[[], T]) -> T:  # type: ignore[name-defined]
-        delay = 0.5
-        last_exc: Exception | None = None
-        for attempt in range(1, MAX_RETRIES + 1):
+    def _with_retries(self, fn: Callable[[], T]) -> T:
+        if not _inline_retries.get():
+            return fn()
+        delays = backoff_delays()
+        while True:
             try:
                 return fn()
             except Exception as exc:
-                last_exc = exc
-                if attempt >= MAX_RETRIES:
-                    break
+                METRICS.inc("bom_ftp_errors_total", error=type(exc).__name__)
+                delay = next(delays, None)
+                left = time_left()
+                if delay is None or not is_transient(exc) or (left is not None and left <= delay):
+                    raise
+                METRICS.inc("bom_ftp_retries_total")
                 time.sleep(delay)
-                delay = min(delay * 2, 5.0)
-        assert last_exc is not None
-        raise last_exc
 
-    def _connect(self) -> FTP:
-        ftp = FTP()
-        ftp.connect(self.host, timeout=FTP_TIMEOUT_SECS)
-        ftp.login()  # anonymous
-        return ftp
+    def _attempt(self, kind: str, op: Callable[[FTP], T]) -> T:
+        breaker = self.pool.breaker
+        _budget()  # a spent deadline fails here, without using up the breaker's trial call
+        breaker.allow()
+        try:
+            result = self._hedged(kind, op)
+        except BaseException as exc:
+            if is_transient(exc) or isinstance(exc, DeadlineExceeded):
+                breaker.failure()
+            else:
+                breaker.success()  # e.g. 550: the host answered
+            raise
+        breaker.success()
+        return result
+
+    def hedge_delay(self, kind: str) -> float | None:
+        """Seconds after which an attempt of ``kind`` is raced by a second one, if at all."""
+        if FTP_HEDGE_PERCENTILE is None:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies.get(kind, ()))
+        if len(samples) < FTP_HEDGE_MIN_SAMPLES:
+            return None
+        return samples[max(0, math.ceil(FTP_HEDGE_PERCENTILE / 100 * len(samples)) - 1)]
+
+    def _run(self, kind: str, op: Callable[[FTP], T]) -> T:
+        start = time.monotonic()
+        result = self.pool.run(op)
+        elapsed = time.monotonic() - start
+        with self._lock:
+            self._latencies.setdefault(kind, deque(maxlen=FTP_HEDGE_WINDOW)).append(elapsed)
+        return result
+
+    def _hedged(self, kind: str, op: Callable[[FTP], T]) -> T:
+        delay = self.hedge_delay(kind)
+        if delay is None:
+            return self._run(kind, op)
+
+        def submit() -> Future[T]:
+            # A copy of this context carries the deadline into the hedge thread
+            return _HEDGES.submit(contextvars.copy_context().run, self._run, kind, op)
+
+        first = submit()
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+        METRICS.inc("bom_ftp_hedges_total")
+        pending = {first, submit()}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, timeout=time_left(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded("FTP deadline exceeded")
+            for future in done:
+                exc = future.exception()
+                if exc is None:
+                    if future is not first:
+                        METRICS.inc("bom_ftp_hedge_wins_total")
+                    return future.result()
+                error = exc
+        assert error is not None
+        raise error
 
     def list_files(self, directory: str) -> list[str]:
-        def op() -> list[str]:
-            with self._connect() as ftp:
+        @timed("ftp_list")
+        def op(ftp: FTP) -> list[str]:
+            ftp.cwd(directory)
+            return ftp.nlst()
+
+        return self._with_retries(lambda: self._attempt("list", op))
+
+    def list_stats(self, directory: str) -> dict[str, RemoteStat]:
+        """File name -> MLSD modify/size for ``directory`` in a single listing.
+
+        Servers without MLSD fall back to NLST; those entries carry no mtime or size.
+        """
+
+        @timed("ftp_list")
+        def op(ftp: FTP) -> dict[str, RemoteStat]:
+            try:
+                return {
+                    name: RemoteStat(
+                        facts.get("modify"), int(facts["size"]) if "size" in facts else None
+                    )
+                    for name, facts in ftp.mlsd(directory, facts=["type", "modify", "size"])
+                    if facts.get("type", "file") == "file"
+                }
+            except error_perm:
                 ftp.cwd(directory)
-                return ftp.nlst()
+                return dict.fromkeys(ftp.nlst(), RemoteStat(None, None))
 
-        return self._with_retries(op)
+        return self._with_retries(lambda: self._attempt("list", op))
 
-    def fetch_text(self, path: str, encoding: str = "utf-8") -> str:
-        def op() -> str:
-            with self._connect() as ftp:
-                buf = io.BytesIO()
-                ftp.retrbinary(f"RETR {path}", buf.write)
-                return buf.getvalue().decode(encoding, errors="replace")
+    def fetch_text(
+        self, path: str, encoding: str = "utf-8", *, stream: StreamFactory | None = None
+    ) -> str:
+        def op(ftp: FTP) -> str:
+            return _retr(ftp, path, encoding, stream)
 
-        return self._with_retries(op)
+        return self._with_retries(lambda: self._attempt("retr", op))
 
+    def fetch_text_if_changed(
+        self,
+        path: str,
+        known: RemoteStat | None,
+        encoding: str = "utf-8",
+        *,
+        stream: StreamFactory | None = None,
+    ) -> tuple[RemoteStat | None, str | None]:
+        """RETR ``path`` unless MDTM/SIZE match ``known``; text is None when unchanged.
 
-T = TypeVar("T")
+        With ``stream``, the text is also passed on block by block while it downloads.
+        """
+
+        def op(ftp: FTP) -> tuple[RemoteStat | None, str | None]:
+            stat = _stat(ftp, path)
+            if stat.matches(known):
+                return stat, None
+            return stat, _retr(ftp, path, encoding, stream)
+
+        return self._with_retries(lambda: self._attempt("fetch", op))
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from pathlib import Path
+
+from ..config import HISTORY_RETENTION_SECS, HISTORY_VARIABLES
+
+_SCHEMA_FILE = "schema.json"
+_SAFE_KEY = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class _Times:
+    """The timestamp column of a mapped series file, indexable for bisect."""
+
+    def __init__(self, buf: mmap.mmap | bytes, record: struct.Struct) -> None:
+        self._buf = buf
+        self._size = record.size
+        self._n = len(buf) // record.size
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> int:
+        return struct.unpack_from("<q", self._buf, i * self._size)[0]
+
+
+class HistoryStore:
+    """Append-only observation history: one file of fixed-width records per station.
+
+    Each record is the observation time (epoch seconds) followed by one float64 per
+    variable in ``variables`` (NaN when not reported). Records are appended in time order,
+    so a window is found by bisecting the memory-mapped file; nothing is parsed to answer
+    a query. Records older than ``retention`` are dropped when a file is compacted.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        variables: Sequence[str] = HISTORY_VARIABLES,
+        retention: float = HISTORY_RETENTION_SECS,
+    ) -> None:
+        self.directory = Path(directory)
+        self.variables = tuple(variables)
+        self.retention = retention
+        self.record = struct.Struct("<q" + "d" * len(self.variables))
+        self._lock = threading.Lock()
+        self._last: dict[str, int] = {}
+        self._maps: dict[str, mmap.mmap] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        schema_path = self.directory / _SCHEMA_FILE
+        schema = {"variables": list(self.variables), "record": self.record.format}
+        if schema_path.exists():
+            existing = json.loads(schema_path.read_text(encoding="utf-8"))
+            if existing != schema:
+                raise ValueError(f"{self.directory} holds history with a different layout")
+        else:
+            schema_path.write_text(json.dumps(schema), encoding="utf-8")
+
+    def _path(self, station: str) -> Path:
+        if not _SAFE_KEY.match(station):
+            raise ValueError(f"Invalid station key {station!r}")
+        return self.directory / f"{station}.bin"
+
+    def _last_time(self, station: str, path: Path) -> int | None:
+        if station in self._last:
+            return self._last[station]
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return None
+        if size % self.record.size:
+            # A write was cut short: drop the partial record so appends stay aligned
+            size -= size % self.record.size
+            os.truncate(path, size)
+        if size == 0:
+            return None
+        with path.open("rb") as f:
+            f.seek(size - self.record.size)
+            last = self.record.unpack(f.read(self.record.size))[0]
+        self._last[station] = last
+        return last
+
+    def append(self, station: str, t: int, values: Sequence[float | None]) -> bool:
+        """Add a reading; False (and nothing written) unless it is newer than the last."""
+        path = self._path(station)
+        row = [math.nan if v is None else float(v) for v in values]
+        with self._lock:
+            last = self._last_time(station, path)
+            if last is not None and t <= last:
+                return False
+            with path.open("ab") as f:
+                f.write(self.record.pack(t, *row))
+            self._last[station] = t
+            self._maybe_compact(station, path, t)
+        return True
+
+    def _maybe_compact(self, station: str, path: Path, now: int) -> None:
+        # Rewrite once the oldest record is two retention periods old, keeping one period
+        with path.open("rb") as f:
+            head = f.read(self.record.size)
+        if len(head) < self.record.size or self.record.unpack(head)[0] > now - 2 * self.retention:
+            return
+        data = path.read_bytes()
+        keep_from = bisect_left(_Times(data, self.record), now - self.retention)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data[keep_from * self.record.size :])
+        self._drop_map(station)
+        os.replace(tmp, path)
+
+    def _drop_map(self, station: str) -> None:
+        old = self._maps.pop(station, None)
+        if old is not None:
+            old.close()
+
+    def _map(self, station: str) -> mmap.mmap | None:
+        # Caller holds the lock. Re-map when the file has grown (or been compacted).
+        path = self._path(station)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return None
+        size -= size % self.record.size  # ignore a record still being written
+        current = self._maps.get(station)
+        if current is not None and len(current) == size:
+            return current
+        self._drop_map(station)
+        if size == 0:
+            return None
+        with path.open("rb") as f:
+            self._maps[station] = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        return self._maps[station]
+
+    def window(self, station: str, since: float, until: float) -> list[tuple[float, ...]]:
+        """Records with ``since <= time <= until`` as (time, value, ...) tuples."""
+        with self._lock:
+            buf = self._map(station)
+            if buf is None:
+                return []
+            times = _Times(buf, self.record)
+            lo = bisect_left(times, math.ceil(since))
+            hi = bisect_right(times, math.floor(until))
+            return [self.record.unpack_from(buf, i * self.record.size) for i in range(lo, hi)]
+
+    def stations(self) -> list[str]:
+        return sorted(p.stem for p in self.directory.glob("*.bin"))
+
+    def close(self) -> None:
+        with self._lock:
+            for station in list(self._maps):
+                self._drop_map(station)
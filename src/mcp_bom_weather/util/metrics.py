@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any, TypeVar
+
+from ..config import METRICS_BUCKETS_SECS
+
+F = TypeVar("F", bound=Callable[..., Any])
+Labels = tuple[tuple[str, str], ...]
+
+STAGE_SECONDS = "bom_stage_seconds"
+
+_HELP = {
+    STAGE_SECONDS: "Time spent in each stage of serving a tool call",
+    "bom_ftp_bytes_total": "Bytes downloaded from the BoM FTP server",
+    "bom_ftp_retries_total": "FTP operations retried after a failed attempt",
+    "bom_ftp_errors_total": "Failed FTP attempts by exception type",
+    "bom_ftp_hedges_total": "FTP attempts raced by a second one after running past the hedge delay",
+    "bom_ftp_hedge_wins_total": "Hedged FTP calls answered by the second attempt",
+    "bom_ftp_circuit_opened_total": "Times an FTP host's circuit breaker opened",
+    "bom_ftp_short_circuits_total": "FTP calls failed fast by an open circuit breaker",
+}
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size  # per bucket, not cumulative; the last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+
+def _labels(labels: Mapping[str, object]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    pairs = [*labels, extra] if extra else list(labels)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _fmt_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metrics:
+    """Process-wide latency histograms, counters and polled gauges.
+
+    ``render()`` produces the Prometheus text exposition format; ``snapshot()`` the same
+    data as plain JSON-able dicts.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = METRICS_BUCKETS_SECS) -> None:
+        self.bounds = buckets
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[Labels, _Histogram]] = {}
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._collectors: dict[str, Callable[[], Mapping[str, float]]] = {}
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        key = _labels(labels)
+        slot = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(len(self.bounds) + 1)
+            hist.buckets[slot] += 1
+            hist.count += 1
+            hist.sum += value
+
+    def inc(self, name: str, amount: float = 1, **labels: object) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, name: str, **labels: object) -> Iterator[None]:
+        # Failed calls are timed too; they are often the slow ones
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def collect(self, prefix: str, fn: Callable[[], Mapping[str, float]]) -> None:
+        """Report ``fn()``'s values as ``{prefix}_{key}`` gauges whenever metrics are read."""
+        with self._lock:
+            self._collectors[prefix] = fn
+
+    def _gauges(self) -> dict[str, float]:
+        with self._lock:
+            collectors = list(self._collectors.items())
+        out: dict[str, float] = {}
+        for prefix, fn in collectors:
+            for key, value in fn().items():
+                out[f"{prefix}_{key}"] = value
+        return out
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "count": h.count,
+                        "sum": h.sum,
+                        "buckets": {
+                            _fmt_value(b): n
+                            for b, n in zip((*self.bounds, math.inf), h.buckets, strict=True)
+                        },
+                    }
+                    for key, h in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+            counters = {
+                name: [{"labels": dict(key), "value": v} for key, v in series.items()]
+                for name, series in self._counters.items()
+            }
+        return {"histograms": histograms, "counters": counters, "gauges": self._gauges()}
+
+    def render(self) -> str:
+        lines: list[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in _HELP:
+                lines.append(f"# HELP {name} {_HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                header(name, "histogram")
+                for key, h in sorted(series.items()):
+                    running = 0
+                    for bound, n in zip((*self.bounds, math.inf), h.buckets, strict=True):
+                        running += n
+                        le = _fmt_labels(key, ("le", _fmt_value(bound)))
+                        lines.append(f"{name}_bucket{le} {running}")
+                    lines.append(f"{name}_sum{_fmt_labels(key)} {h.sum!r}")
+                    lines.append(f"{name}_count{_fmt_labels(key)} {h.count}")
+            for name, series in sorted(self._counters.items()):
+                header(name, "counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_fmt_labels(key)} {_fmt_value(value)}")
+        for name, value in sorted(self._gauges().items()):
+            header(name, "gauge")
+            lines.append(f"{name} {_fmt_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+METRICS = Metrics()
+
+
+def stage(name: str, **labels: object) -> AbstractContextManager[None]:
+    """Time a block as one stage (ftp_connect, ftp_retr, parse, tool, ...) of a request."""
+    return METRICS.timer(STAGE_SECONDS, stage=name, **labels)
+
+
+def timed(name: str, **labels: object) -> Callable[[F], F]:
+    """Decorator form of :func:`stage`."""
+
+    def wrap(fn: F) -> F:
+        @functools.wraps(fn)
+        def inner(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with stage(name, **labels):
+                return fn(*args, **kwargs)
+
+        return inner  # type: ignore[return-value]
+
+    return wrap
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+from ..config import RESPONSE_CACHE_MAX_ENTRIES
+
+
+def response_key(name: str, arguments: Mapping[str, Any], versions: tuple[object, ...]) -> Hashable:
+    # Arguments arrive as decoded JSON, so a canonical dump identifies them
+    return name, json.dumps(arguments, sort_keys=True, default=str), versions
+
+
+class ResponseCache:
+    """LRU of already-encoded tool results keyed by tool, arguments and product versions.
+
+    Nothing is ever invalidated explicitly: once a product changes, its new version gives
+    every dependent call a new key and the old entries age out.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> object | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
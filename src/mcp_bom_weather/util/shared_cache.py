@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .cache import Product
+from .disk_cache import PRIVATE_DIR, owned_by_user
+from .ftp import RemoteStat
+from .metrics import stage
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not POSIX: each process refreshes on its own
+    fcntl = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
+# How often a process waiting under a deadline retries another process's refresh lock
+_LOCK_POLL_SECS = 0.05
+
+# Identifies one written slot file: a replaced slot is a new inode
+_Token = tuple[int, int, int]
+
+
+def _token(st: os.stat_result) -> _Token:
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _encode(product: Product, index: object | None) -> bytes:
+    text = product.text.encode("utf-8")
+    blob = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL) if index is not None else b""
+    validator = product.validator
+    header = {
+        "path": product.path,
+        "fetched_at": product.fetched_at,
+        "expires_at": product.expires_at,
+        "validator": [validator.mtime, validator.size] if validator else None,
+        "text_bytes": len(text),
+        "index_bytes": len(blob),
+    }
+    return json.dumps(header).encode("utf-8") + b"\n" + text + blob
+
+
+def _flock(fd: int, timeout: float | None) -> bool:
+    # An exclusive lock on fd, waiting at most ``timeout`` seconds (None: for as long as
+    # it takes); False when the wait ran out
+    if timeout is None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return True
+    give_up = time.monotonic() + timeout
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            left = give_up - time.monotonic()
+            if left <= 0:
+                return False
+            time.sleep(min(_LOCK_POLL_SECS, left))
+
+
+def _decode(buf: mmap.mmap) -> tuple[Product, object | None]:
+    end = buf.find(b"\n")
+    header = json.loads(buf[:end])
+    start = end + 1
+    split = start + header["text_bytes"]
+    stop = split + header["index_bytes"]
+    with memoryview(buf) as view:
+        # Decoded and unpickled straight from the mapping, without an intermediate bytes copy
+        text = str(view[start:split], "utf-8")
+        index = pickle.loads(view[split:stop]) if stop > split else None
+    validator = RemoteStat(*header["validator"]) if header["validator"] else None
+    product = Product(header["path"], text, header["fetched_at"], header["expires_at"], validator)
+    return product, index
+
+
+class SharedCache:
+    """Products and their parsed indexes shared by every server process on a node.
+
+    Each FTP path has one slot file holding a JSON header, the product text and the pickled
+    index. A new version is written to a temporary file and renamed over the slot, so a
+    reader maps either the old version or the new one, never a mix. Each process remembers
+    the slot it last read (inode, mtime, size) and only maps it again once it is replaced,
+    so an unchanged product costs one ``stat``. ``lock(path)`` lets one process refresh a
+    product from FTP while the others wait (up to their deadline) and then read its result.
+    As with DiskCache, the directory is private to the user and only their files are read.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=PRIVATE_DIR, parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._loaded: dict[str, tuple[_Token, Product, object | None]] = {}
+
+    def _slot(self, path: str) -> Path:
+        return self.directory / (hashlib.sha256(path.encode()).hexdigest() + ".slot")
+
+    def load(self, path: str) -> tuple[Product, object | None] | None:
+        """The latest product stored for ``path`` and its index (None when none was stored)."""
+        slot = self._slot(path)
+        try:
+            token = _token(slot.stat())
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            seen = self._loaded.get(path)
+        if seen is not None and seen[0] == token:
+            return seen[1], seen[2]
+        try:
+            with stage("shared_load"), slot.open("rb") as f:
+                st = os.fstat(f.fileno())  # the file actually opened
+                if not owned_by_user(st):
+                    log.warning("Ignoring shared slot for %s: not written by this user", path)
+                    return None
+                token = _token(st)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    product, index = _decode(buf)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            log.warning("Discarding unreadable shared slot for %s", path, exc_info=True)
+            return None
+        with self._lock:
+            self._loaded[path] = (token, product, index)
+        return product, index
+
+    def store(self, product: Product, index: object | None = None) -> None:
+        data = _encode(product, index)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                token = _token(os.fstat(f.fileno()))  # rename keeps inode and mtime
+            os.replace(tmp, self._slot(product.path))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._loaded[product.path] = (token, product, index)
+
+    @contextmanager
+    def lock(self, path: str, timeout: float | None = None) -> Iterator[bool]:
+        """Hold the node-wide lock for refreshing ``path``; yields whether it was acquired.
+
+        Waits at most ``timeout`` seconds for another process to release it, or without
+        a timeout for as long as that process holds it.
+        """
+        if fcntl is None:  # pragma: no cover
+            yield True
+            return
+        with self._slot(path).with_suffix(".lock").open("a+b") as f:
+            if not _flock(f.fileno(), timeout):
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
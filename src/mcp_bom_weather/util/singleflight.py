@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Collapse concurrent calls with the same key into one; every caller gets its result."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[T]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            call.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+        call.set_result(result)
+        return result
+
+
+class _Flight(Generic[T]):
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[T]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight(Generic[T]):
+    """Event-loop flavour of SingleFlight.
+
+    The shared call runs as its own task. A cancelled caller stops waiting without
+    disturbing the others; the shared task is cancelled once nobody is waiting for it.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Flight[T]] = {}
+
+    def _forget(self, key: Hashable, task: object) -> None:
+        flight = self._calls.get(key)
+        if flight is not None and flight.task is task:
+            del self._calls[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        flight = self._calls.get(key)
+        if flight is None:
+
+            async def run() -> T:
+                try:
+                    return await fn()
+                finally:
+                    self._forget(key, asyncio.current_task())
+
+            flight = self._calls[key] = _Flight(asyncio.ensure_future(run()))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Last one out: new callers must start afresh rather than join a dying task
+                self._forget(key, flight.task)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
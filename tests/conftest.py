@@ -1,25 +1,44 @@
 from __future__ import annotations
 
+import math
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from ftplib import FTP
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from mcp_bom_weather.clients.bom_client import BomClient
-from mcp_bom_weather.config import CITY_PRODUCT_IDS
+from mcp_bom_weather.config import CITY_FORECAST_PRODUCT_IDS, CITY_PRODUCT_IDS
+from mcp_bom_weather.util.cache import Product
+from mcp_bom_weather.util.ftp import RemoteStat, StreamFactory
+
+# What the fake FTP sessions return for every RETR
+FTP_PAYLOAD = b"<product/>"
+# Listed for every example product unless a test publishes another issue in `listed`
+LISTED = RemoteStat("20250817113324", 1)
 
 
 class ExamplesClient(BomClient):
-    def __init__(self, examples_dir: Path) -> None:  # type: ignore[no-untyped-def]
+    def __init__(self, examples_dir: Path, fetched: Counter[str]) -> None:  # type: ignore[no-untyped-def]
+        super().__init__()
         self.examples_dir = examples_dir
+        self.fetched = fetched
+        self._fetched_lock = threading.Lock()
 
-    def fetch_city_xml(self, city: str) -> tuple[int, str]:  # type: ignore[override]
-        product = CITY_PRODUCT_IDS[city]
-        assert product, f"No product configured for {city} in CITY_PRODUCT_IDS"
-        path = self.examples_dir / f"{product}.xml"
-        text = path.read_text(encoding="utf-8")
-        return 200, text
+    # Stands in for the FTP download: products are read from examples/ by file name
+    def fetch_product(self, path: str) -> Product:
+        known = {*CITY_PRODUCT_IDS.values(), *CITY_FORECAST_PRODUCT_IDS.values()}
+        assert Path(path).stem in known, f"No example product for {path}"
+        with self._fetched_lock:
+            self.fetched[Path(path).stem] += 1
+        text = (self.examples_dir / Path(path).name).read_text(encoding="utf-8")
+        return Product(path, text, time.time(), math.inf)
 
-    def fetch_warnings_xml(self) -> tuple[int, str]:  # type: ignore[override]
+    def fetch_warnings_product(self) -> Product | None:
         # Prefer a known warnings example if provided; otherwise fall back to minimal
         # If repository includes a CAP or warnings file in examples, point here.
         # For now, return a simple single warning so parser path is exercised.
@@ -28,7 +47,88 @@ class ExamplesClient(BomClient):
           <warning>Severe Weather Warning</warning>
         </warnings>
         """
-        return 200, xml
+        return Product(f"{self.directory}/warnings.xml", xml, time.time(), math.inf)
+
+
+class Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ExamplesFtp:
+    """Stands in for FtpClient: serves examples/ by file name.
+
+    Each file is listed with its stat in `listed` (LISTED by default), so a download
+    only happens when the caller's copy is older. Streams are fed like FtpClient does.
+    """
+
+    def __init__(
+        self, examples_dir: Path, listed: dict[str, RemoteStat], calls: Counter[str]
+    ) -> None:
+        self.examples_dir = examples_dir
+        self.listed = listed
+        self.calls = calls
+        self._lock = threading.Lock()
+
+    def _count(self, op: str) -> None:
+        with self._lock:
+            self.calls[op] += 1
+
+    def fetch_text_if_changed(
+        self, path: str, known: RemoteStat | None, *, stream: StreamFactory | None = None
+    ) -> tuple[RemoteStat | None, str | None]:
+        self._count("stat")
+        stat = self.listed.get(Path(path).name, LISTED)
+        if stat.matches(known):
+            return stat, None
+        self._count("retr")
+        text = (self.examples_dir / Path(path).name).read_text(encoding="utf-8")
+        if stream is not None:
+            sink = stream()
+            sink.feed(text)
+            sink.close()
+        return stat, text
+
+    def list_stats(self, directory: str) -> dict[str, RemoteStat]:
+        self._count("list")
+        return {}
+
+
+class FakeFTP:
+    """Stands in for an ftplib.FTP session; every RETR returns FTP_PAYLOAD."""
+
+    def __init__(self, log: list[str], stalls: list[threading.Event]) -> None:
+        self.log = log
+        self.stalls = stalls
+
+    def voidcmd(self, cmd: str) -> str:
+        self.log.append(cmd)
+        return "200 OK"
+
+    def sendcmd(self, cmd: str) -> str:
+        self.log.append(cmd)
+        return "213 20250817113324"
+
+    def size(self, path: str) -> int:
+        return len(FTP_PAYLOAD)
+
+    def retrbinary(self, cmd: str, callback: Any) -> str:  # noqa: ANN401
+        self.log.append(cmd)
+        # A queued event holds this transfer until it is set (one slow RETR)
+        if self.stalls:
+            self.stalls.pop(0).wait()
+        callback(FTP_PAYLOAD)
+        return "226 Transfer complete"
+
+    def close(self) -> None:
+        self.log.append("close")
+
+    def quit(self) -> str:
+        self.log.append("QUIT")
+        return "221 Goodbye"
 
 
 @pytest.fixture(scope="session")
@@ -37,5 +137,79 @@ def examples_dir() -> Path:
 
 
 @pytest.fixture()
-def examples_client(examples_dir: Path) -> ExamplesClient:
-    return ExamplesClient(examples_dir)
+def fetched() -> Counter[str]:
+    """Products the examples client has served, by product ID."""
+    return Counter()
+
+
+@pytest.fixture()
+def examples_client(examples_dir: Path, fetched: Counter[str]) -> ExamplesClient:
+    return ExamplesClient(examples_dir, fetched)
+
+
+@pytest.fixture()
+def start_time() -> float:
+    # Modules whose products expire by wall-clock time start the clock at an issue time
+    return 1_000.0
+
+
+@pytest.fixture()
+def clock(start_time: float) -> Clock:
+    return Clock(start_time)
+
+
+@pytest.fixture()
+def advance(clock: Clock) -> Callable[[float], None]:
+    def advance(secs: float) -> None:
+        clock.now += secs
+
+    return advance
+
+
+@pytest.fixture()
+def listed() -> dict[str, RemoteStat]:
+    """Stats the examples FTP lists, by file name; set one to publish a new issue."""
+    return {}
+
+
+@pytest.fixture()
+def ftp_calls() -> Counter[str]:
+    """Operations the examples FTP served: "stat", "retr" and "list"."""
+    return Counter()
+
+
+@pytest.fixture()
+def examples_ftp(
+    examples_dir: Path, listed: dict[str, RemoteStat], ftp_calls: Counter[str]
+) -> ExamplesFtp:
+    return ExamplesFtp(examples_dir, listed, ftp_calls)
+
+
+@pytest.fixture()
+def ftp_log() -> list[str]:
+    """Commands the fake FTP sessions received, in order, across sessions."""
+    return []
+
+
+@pytest.fixture()
+def ftp_stalls() -> list[threading.Event]:
+    return []
+
+
+@pytest.fixture()
+def ftp_sessions() -> list[FTP]:
+    return []
+
+
+@pytest.fixture()
+def ftp_factory(
+    ftp_log: list[str], ftp_stalls: list[threading.Event], ftp_sessions: list[FTP]
+) -> Callable[[], FTP]:
+    """Connection factory for FtpPool that opens fake sessions."""
+
+    def factory() -> FTP:
+        conn: Any = FakeFTP(ftp_log, ftp_stalls)
+        ftp_sessions.append(conn)
+        return conn
+
+    return factory
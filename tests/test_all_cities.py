@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import threading
+
+import pytest
+
 from mcp_bom_weather.clients.bom_client import BomClient
 from mcp_bom_weather.config import SUPPORTED_CITIES
 from mcp_bom_weather.tools.weather_tools import current_weather_all_major_cities
+from mcp_bom_weather.util.cache import Product
+
+BARRIER_TIMEOUT = 5.0
 
 
 def test_all_cities_aggregated(examples_client: BomClient) -> None:
@@ -10,3 +17,31 @@ def test_all_cities_aggregated(examples_client: BomClient) -> None:
     assert len(items) == len(SUPPORTED_CITIES)
     cities = [x["city"] for x in items]
     assert cities == SUPPORTED_CITIES
+
+
+def test_all_cities_partial_result_on_failure(
+    examples_client: BomClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fetch = examples_client.fetch_city_product
+    # Only passes if every healthy city is in flight at the same time
+    barrier = threading.Barrier(len(SUPPORTED_CITIES) - 1, timeout=BARRIER_TIMEOUT)
+
+    def flaky(city: str) -> Product:
+        if city == "Darwin":
+            raise TimeoutError("timed out")
+        barrier.wait()
+        return fetch(city)
+
+    monkeypatch.setattr(examples_client, "fetch_city_product", flaky)
+    items = current_weather_all_major_cities(client=examples_client)
+    assert [x["city"] for x in items] == SUPPORTED_CITIES
+    darwin = items[SUPPORTED_CITIES.index("Darwin")]
+    assert darwin["condition"] == "Unavailable"
+    assert darwin["temp_c"] is None
+    assert "TimeoutError" in darwin["error"]
+    assert all("error" not in x for x in items if x["city"] != "Darwin")
+
+
+def test_all_cities_sequential_mode(examples_client: BomClient) -> None:
+    items = current_weather_all_major_cities(client=examples_client, concurrency=1)
+    assert [x["city"] for x in items] == SUPPORTED_CITIES
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.config import SUPPORTED_CITIES
+from mcp_bom_weather.tools import async_tools
+from mcp_bom_weather.util.cache import Product
+from mcp_bom_weather.util.ftp import FtpClient, FtpPool, single_attempt
+
+SLOW_FETCH_SECS = 0.3
+MAX_LOOP_STALL_SECS = 0.1
+
+
+@pytest.mark.asyncio
+async def test_async_current_weather(examples_client: BomClient) -> None:
+    cw = await async_tools.current_weather("Sydney", client=examples_client)
+    assert cw["city"] == "Sydney"
+
+
+@pytest.mark.asyncio
+async def test_blocking_io_does_not_stall_event_loop(
+    examples_client: BomClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def slow(city: str) -> Product:
+        time.sleep(SLOW_FETCH_SECS)  # blocking, like ftplib
+        path = examples_client.city_path(city)
+        return Product(path, "<product><observations/></product>", 0.0, math.inf)
+
+    monkeypatch.setattr(examples_client, "fetch_city_product", slow)
+    stalls: list[float] = []
+
+    async def ticker() -> None:
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    tick = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    items = await async_tools.current_weather_all_major_cities(client=examples_client)
+    elapsed = time.perf_counter() - started
+    tick.cancel()
+
+    assert [x["city"] for x in items] == SUPPORTED_CITIES
+    assert elapsed < SLOW_FETCH_SECS * len(SUPPORTED_CITIES) / 2
+    assert max(stalls) < MAX_LOOP_STALL_SECS
+
+
+@pytest.mark.asyncio
+async def test_retries_back_off_on_the_event_loop(
+    examples_client: BomClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    fetch = examples_client.fetch_city_product
+
+    def dropped_once(city: str) -> Product:
+        calls.append(city)
+        if len(calls) == 1:
+            raise EOFError("control channel closed")
+        return fetch(city)
+
+    monkeypatch.setattr(examples_client, "fetch_city_product", dropped_once)
+    cw = await async_tools.current_weather("Hobart", client=examples_client)
+    assert cw["city"] == "Hobart"
+    assert len(calls) == 1 + 1
+
+
+def test_single_attempt_disables_inline_retries() -> None:
+    calls: list[int] = []
+
+    def op() -> str:
+        calls.append(1)
+        raise EOFError
+
+    ftp = FtpClient("ftp.example", pool=FtpPool("ftp.example"))
+    with single_attempt(), pytest.raises(EOFError):
+        ftp._with_retries(op)
+    assert len(calls) == 1
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from mcp_bom_weather.tools.weather_tools import TOOLS
+from mcp_bom_weather.util.ftp import FtpClient, FtpPool
+
+EXAMPLES = Path(__file__).resolve().parents[1] / "examples"
+
+
+def _load(name: str) -> ModuleType:
+    path = Path(__file__).resolve().parents[1] / "benchmarks" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # dataclasses look their module up while being defined
+    spec.loader.exec_module(module)
+    return module
+
+
+def _bench() -> ModuleType:
+    return _load("bench")
+
+
+def test_every_tool_is_benchmarked() -> None:
+    assert set(_bench().TOOL_ARGS) == set(TOOLS)
+
+
+def test_compare_direction() -> None:
+    bench = _bench()
+    baseline = {"parse.mb_per_s": 100.0, "tool.x.secs": 1.0, "tool.x.peak_bytes": 1000.0}
+    assert bench.compare({"parse.mb_per_s": 90.0, "tool.x.secs": 1.2}, baseline, 0.25) == []
+    slower = bench.compare(
+        {"parse.mb_per_s": 50.0, "tool.x.secs": 2.0, "tool.x.peak_bytes": 900.0}, baseline, 0.25
+    )
+    assert [line.split(":")[0] for line in slower] == ["parse.mb_per_s", "tool.x.secs"]
+
+
+def test_server_startup_defers_parsers_and_client(tmp_path: Path) -> None:
+    assert _load("startup").eager_imports(str(tmp_path)) == []
+
+
+def test_every_tool_is_load_tested() -> None:
+    assert set(_load("load").LOAD_ARGS) == set(TOOLS)
+
+
+def test_percentiles_nearest_rank() -> None:
+    samples = [float(i) for i in range(1, 101)]
+    assert _load("load").percentiles(samples) == {"p50": 50.0, "p95": 95.0, "p99": 99.0}
+
+
+def test_replay_server_reissues_and_drops_transfers(monkeypatch: pytest.MonkeyPatch) -> None:
+    replay = _load("ftp_replay")
+    monkeypatch.setattr("mcp_bom_weather.util.ftp.time.sleep", lambda s: None)
+    now = [1_000.0]
+    behaviour = replay.Behaviour(fail_rate=0.5, reissue_every=60.0, seed=1)
+    with replay.ReplayServer(("127.0.0.1", 0), behaviour=behaviour, clock=lambda: now[0]) as server:
+        server.start()
+        client = FtpClient("127.0.0.1", pool=FtpPool("127.0.0.1", port=server.port))
+        path = f"{replay.MOUNT}/IDN60920.xml"
+        text = client.fetch_text(path)
+        assert text == (EXAMPLES / "IDN60920.xml").read_text(encoding="utf-8")
+        assert server.counts["failed_transfers"] >= 1  # retried transparently
+
+        stats = client.list_stats(replay.MOUNT)
+        now[0] += behaviour.reissue_every
+        reissued = client.list_stats(replay.MOUNT)["IDN60920.xml"]
+        assert reissued.mtime > stats["IDN60920.xml"].mtime
+        server.shutdown()
+
+
+def test_load_run_over_stdio() -> None:
+    load = _load("load")
+    replay = _load("ftp_replay")
+    with replay.ReplayServer(("127.0.0.1", 0)) as server:
+        server.start()
+        report = load.run(
+            "stdio",
+            1,
+            duration=60.0,
+            requests=len(load.LOAD_ARGS),
+            ftp=("127.0.0.1", server.port),
+            server_args=[],
+        )
+        server.shutdown()
+    # Every tool answered through a real MCP client, output schema checks included
+    assert report["calls"] == len(TOOLS)
+    assert report["errors"] == 0
+    assert set(report["tools"]) == set(TOOLS)
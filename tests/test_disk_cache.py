@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import stat
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.adapters.product_index import ProductIndex, ProductIndexes
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.util.cache import Product, ProductCache
+from mcp_bom_weather.util.disk_cache import DiskCache
+from mcp_bom_weather.util.ftp import FtpClient, RemoteStat
+
+TTL = 300.0
+STAT = RemoteStat("20250817113324", 123)
+PRIVATE = 0o700
+WRITABLE_BY_OTHERS = 0o022
+
+
+def _client(tmp_path: Path, clock: Callable[[], float], ftp: FtpClient) -> BomClient:
+    client = BomClient(cache=ProductCache(ttl=TTL, clock=clock), disk=DiskCache(tmp_path))
+    client.ftp = ftp
+    return client
+
+
+def test_restarted_client_answers_from_disk(
+    tmp_path: Path,
+    clock: Callable[[], float],
+    advance: Callable[[float], None],
+    examples_ftp: FtpClient,
+    ftp_calls: Counter[str],
+) -> None:
+    first = _client(tmp_path, clock, examples_ftp)
+    product = first.fetch_city_product("Perth")
+
+    # A new process: empty memory, same cache directory, still within the product's TTL
+    ftp_calls.clear()
+    restarted = _client(tmp_path, clock, examples_ftp)
+    again = restarted.fetch_city_product("Perth")
+    assert again.text == product.text
+    assert again.fetched_at == product.fetched_at
+    assert ftp_calls["stat"] == 0
+
+    # Once stale, the restored validator lets MDTM/SIZE confirm it without a RETR
+    advance(TTL)
+    fresh = _client(tmp_path, clock, examples_ftp)
+    fresh.fetch_city_product("Perth")
+    assert ftp_calls["stat"] == 1
+    assert ftp_calls["retr"] == 0
+
+
+def test_index_loaded_from_disk_without_parsing(
+    tmp_path: Path, examples_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    disk = DiskCache(tmp_path)
+    text = (examples_dir / "IDW60920.xml").read_text(encoding="utf-8")
+    product = Product("/p/IDW60920.xml", text, 1.0, 2.0, STAT)
+    built = ProductIndexes().get(product, disk)
+
+    def no_parse(self: ProductIndex, chunk: str) -> None:
+        raise AssertionError("parsed again")
+
+    monkeypatch.setattr(ProductIndex, "feed", no_parse)
+    loaded = ProductIndexes().get(product, disk)
+    assert loaded is not built
+    assert loaded.version == product.version
+    assert [s.wmo_id for s in loaded.stations] == [s.wmo_id for s in built.stations]
+
+
+def test_size_cap_and_damaged_objects(tmp_path: Path) -> None:
+    disk = DiskCache(tmp_path, max_bytes=1)
+    disk.store(Product("/p/a.xml", "a" * 100, 1.0, 2.0))
+    # Over the cap, the object is evicted and the ref no longer resolves
+    assert disk.load("/p/a.xml") is None
+
+    disk = DiskCache(tmp_path / "other")
+    disk.store(Product("/p/b.xml", "<b/>", 1.0, 2.0))
+    for obj in (tmp_path / "other" / "objects").glob("*/*.z"):
+        obj.write_bytes(b"not zlib")
+    assert disk.load("/p/b.xml") is None
+
+
+def test_objects_others_could_write_are_not_loaded(tmp_path: Path) -> None:
+    disk = DiskCache(tmp_path / "cache")
+    assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) == PRIVATE
+    assert stat.S_IMODE((tmp_path / "cache" / "objects").stat().st_mode) == PRIVATE
+    disk.store_object("k" * 64, "idx", {"stations": 1})
+    assert disk.load_object("k" * 64, "idx") == {"stations": 1}
+    for obj in (tmp_path / "cache" / "objects").glob("*/*.z"):
+        assert stat.S_IMODE(obj.stat().st_mode) & WRITABLE_BY_OTHERS == 0
+        obj.chmod(obj.stat().st_mode | WRITABLE_BY_OTHERS)
+    assert disk.load_object("k" * 64, "idx") is None
+
+
+def test_objects_listed_only_once_under_the_cap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    disk = DiskCache(tmp_path)
+    disk.store(Product("/p/a.xml", "<a/>", 1.0, 2.0))
+
+    def no_listing() -> list[tuple[float, int, Path]]:
+        raise AssertionError("objects listed again")
+
+    # The total is kept as objects are written, so stores under the cap stat nothing
+    monkeypatch.setattr(disk, "_objects", no_listing)
+    for name in "bcd":
+        disk.store(Product(f"/p/{name}.xml", f"<{name}/>", 1.0, 2.0))
+    monkeypatch.undo()
+    assert disk.size() <= disk.max_bytes
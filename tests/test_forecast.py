@@ -3,16 +3,59 @@ from __future__ import annotations
 import pytest
 
 from mcp_bom_weather.clients.bom_client import BomClient
-from mcp_bom_weather.config import SUPPORTED_CITIES
+from mcp_bom_weather.config import CITY_FORECAST_PRODUCT_IDS, SUPPORTED_CITIES
 from mcp_bom_weather.tools.weather_tools import forecast
 
 DAYS = 3
+ISSUED_PERIODS = 8  # forecast-periods for the Sydney area in examples/IDN11050.xml
+FORECAST_CITIES = [c for c in SUPPORTED_CITIES if CITY_FORECAST_PRODUCT_IDS.get(c)]
+UNCONFIGURED_CITIES = [c for c in SUPPORTED_CITIES if c not in FORECAST_CITIES]
 
 
-@pytest.mark.parametrize("city", SUPPORTED_CITIES)
+@pytest.mark.parametrize("city", FORECAST_CITIES)
 def test_forecast_days(city: str, examples_client: BomClient) -> None:
     fc = forecast(city, days=DAYS, client=examples_client)
     assert fc["city"] == city
     assert len(fc["days"]) == DAYS
     for day in fc["days"]:
         assert set(day.keys()) == {"date", "min_c", "max_c", "condition"}
+
+
+def test_sydney_forecast_from_its_area(examples_client: BomClient) -> None:
+    fc = forecast("Sydney", days=DAYS, client=examples_client)
+    assert fc["days"][0] == {
+        "date": "2025-08-17",
+        "min_c": None,
+        "max_c": None,
+        "condition": "Partly cloudy. Light winds.",
+    }
+
+
+def test_forecast_has_only_issued_days(examples_client: BomClient) -> None:
+    fc = forecast("Sydney", days=ISSUED_PERIODS + 6, client=examples_client)
+    dates = [day["date"] for day in fc["days"]]
+    assert len(dates) == ISSUED_PERIODS
+    assert dates[0] == "2025-08-17"
+    assert dates[-1] == "2025-08-24"
+
+
+@pytest.mark.parametrize("city", FORECAST_CITIES)
+def test_forecast_read_from_forecast_product(city: str, examples_client: BomClient) -> None:
+    product_id = CITY_FORECAST_PRODUCT_IDS[city]
+    assert examples_client.forecast_path(city).endswith(f"/{product_id}.xml")
+    _, index = examples_client.fetch_forecast_parsed(city)
+    area = index.forecast_area(city)
+    assert area is not None
+    assert area.days
+
+
+def test_forecast_area_by_aac(examples_client: BomClient) -> None:
+    _, index = examples_client.fetch_forecast_parsed("Sydney")
+    assert index.forecast_area("Sydney") is index.areas_by_aac["NSW_ME001"]
+    assert index.areas_by_description["central coast"].aac == "NSW_ME004"
+
+
+@pytest.mark.parametrize("city", UNCONFIGURED_CITIES)
+def test_unconfigured_forecast_product_is_reported(city: str, examples_client: BomClient) -> None:
+    with pytest.raises(ValueError, match="CITY_FORECAST_PRODUCT_IDS"):
+        forecast(city, days=DAYS, client=examples_client)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from ftplib import FTP
+
+import pytest
+
+from mcp_bom_weather.util.ftp import FtpClient, FtpPool, RemoteStat
+
+KEEPALIVE = 30.0
+IDLE_TIMEOUT = 120.0
+
+
+@pytest.fixture()
+def pool(clock: Callable[[], float], ftp_factory: Callable[[], FTP]) -> FtpPool:
+    return FtpPool(
+        "ftp.example",
+        keepalive=KEEPALIVE,
+        idle_timeout=IDLE_TIMEOUT,
+        factory=ftp_factory,
+        clock=clock,
+    )
+
+
+def test_sessions_are_reused(pool: FtpPool, ftp_sessions: list[FTP]) -> None:
+    client = FtpClient("ftp.example", pool=pool)
+    for _ in range(3):
+        assert client.fetch_text("/anon/gen/fwo/IDN60920.xml") == "<product/>"
+    assert len(ftp_sessions) == 1
+    assert pool.idle_count() == 1
+
+
+def test_keepalive_probe_and_idle_eviction(
+    pool: FtpPool,
+    advance: Callable[[float], None],
+    ftp_sessions: list[FTP],
+    ftp_log: list[str],
+) -> None:
+    client = FtpClient("ftp.example", pool=pool)
+    client.fetch_text("/a.xml")
+    advance(KEEPALIVE + 1)
+    client.fetch_text("/a.xml")
+    assert ftp_log.count("NOOP") == 1
+    advance(IDLE_TIMEOUT + 1)
+    client.fetch_text("/a.xml")
+    assert ftp_log.count("close") == 1
+    assert len(ftp_sessions) == 1 + 1
+
+
+def test_dead_control_channel_reconnects_transparently(
+    pool: FtpPool, ftp_sessions: list[FTP], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = FtpClient("ftp.example", pool=pool)
+    client.fetch_text("/a.xml")
+
+    def dropped(*args: object) -> str:
+        raise EOFError
+
+    # Dropped without the keepalive noticing
+    monkeypatch.setattr(ftp_sessions[0], "retrbinary", dropped)
+    assert client.fetch_text("/a.xml") == "<product/>"
+    assert len(ftp_sessions) == 1 + 1
+    assert pool.idle_count() == 1
+
+
+def test_unchanged_file_skips_retr(pool: FtpPool, ftp_log: list[str]) -> None:
+    client = FtpClient("ftp.example", pool=pool)
+    stat, text = client.fetch_text_if_changed("/a.xml", None)
+    assert text == "<product/>"
+    assert stat == RemoteStat("20250817113324", len(b"<product/>"))
+    assert client.fetch_text_if_changed("/a.xml", stat) == (stat, None)
+    assert [c for c in ftp_log if c.startswith("RETR")] == ["RETR /a.xml"]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from ftplib import FTP, error_perm
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.config import FTP_HEDGE_MIN_SAMPLES, TOOL_DEADLINE_SECS
+from mcp_bom_weather.tools import async_tools, weather_tools
+from mcp_bom_weather.util.cache import Product, ProductCache
+from mcp_bom_weather.util.deadline import deadline, time_left
+from mcp_bom_weather.util.ftp import (
+    CircuitBreaker,
+    CircuitOpen,
+    DeadlineExceeded,
+    FtpClient,
+    FtpPool,
+    RemoteStat,
+)
+from mcp_bom_weather.util.metrics import METRICS
+
+THRESHOLD = 3
+RESET = 30.0
+SHORT_DEADLINE = 0.2
+PATH = "/anon/gen/fwo/IDN60920.xml"
+
+
+@pytest.fixture()
+def client(ftp_factory: Callable[[], FTP]) -> FtpClient:
+    return FtpClient("ftp.example", pool=FtpPool("ftp.example", factory=ftp_factory))
+
+
+def _counter(name: str) -> float:
+    return sum(c["value"] for c in METRICS.snapshot()["counters"].get(name, []))
+
+
+def test_permanent_errors_are_not_retried(client: FtpClient) -> None:
+    calls: list[int] = []
+
+    def missing(ftp: FTP) -> str:
+        calls.append(1)
+        raise error_perm("550 No such file")
+
+    with pytest.raises(error_perm):
+        client._with_retries(lambda: client._attempt("retr", missing))
+    assert len(calls) == 1
+    assert client.pool.breaker.state == "closed"
+
+
+def test_deadline_stops_retries_and_backoff(client: FtpClient) -> None:
+    calls: list[int] = []
+
+    def dropped(ftp: FTP) -> str:
+        calls.append(1)
+        raise EOFError
+
+    start = time.monotonic()
+    with deadline(start + SHORT_DEADLINE), pytest.raises(EOFError):
+        client._with_retries(lambda: client._attempt("retr", dropped))
+    assert len(calls) == 1  # the first backoff would already overrun the budget
+    assert time.monotonic() - start < SHORT_DEADLINE
+
+    with deadline(time.monotonic() - 1), pytest.raises(DeadlineExceeded):
+        client.fetch_text(PATH)
+
+
+def test_circuit_breaker_opens_and_recovers(
+    clock: Callable[[], float], advance: Callable[[float], None]
+) -> None:
+    breaker = CircuitBreaker("ftp.example", threshold=THRESHOLD, reset_after=RESET, clock=clock)
+    for _ in range(THRESHOLD):
+        breaker.allow()
+        breaker.failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpen):
+        breaker.allow()
+
+    advance(RESET)
+    breaker.allow()  # the trial call
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpen):
+        breaker.allow()  # everyone else still fails fast
+    breaker.failure()
+    assert breaker.state == "open"
+
+    advance(RESET)
+    breaker.allow()
+    breaker.success()
+    assert breaker.state == "closed"
+    breaker.allow()
+
+
+def test_open_circuit_serves_cached_copy_without_ftp(
+    examples_dir: Path, clock: Callable[[], float], advance: Callable[[float], None]
+) -> None:
+    client = BomClient(cache=ProductCache(ttl=RESET, clock=clock))
+    connects: list[int] = []
+
+    def refuse() -> FTP:
+        connects.append(1)
+        raise ConnectionRefusedError
+
+    client.ftp = FtpClient("ftp.example", pool=FtpPool("ftp.example", factory=refuse))
+    text = (examples_dir / "IDN60920.xml").read_text(encoding="utf-8")
+    cached = client.cache.put(PATH, text, RemoteStat("20250817113324", len(text)))
+    advance(RESET)  # stale: the client has to ask BoM
+
+    breaker = client.ftp.pool.breaker
+    for _ in range(breaker.threshold):
+        breaker.failure()
+    assert client.fetch_product(PATH) is cached
+    assert connects == []
+
+
+def test_slow_attempt_is_hedged(client: FtpClient, ftp_stalls: list[threading.Event]) -> None:
+    for _ in range(FTP_HEDGE_MIN_SAMPLES):
+        client.fetch_text(PATH)
+    delay = client.hedge_delay("retr")
+    assert delay is not None
+
+    METRICS.reset()
+    release = threading.Event()
+    ftp_stalls.append(release)  # the first attempt waits; the hedge answers
+    try:
+        start = time.monotonic()
+        assert client.fetch_text(PATH) == "<product/>"
+        assert time.monotonic() - start < 1.0  # the second attempt answered
+    finally:
+        release.set()
+    assert _counter("bom_ftp_hedges_total") == 1
+    assert _counter("bom_ftp_hedge_wins_total") == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_deadline_reaches_ftp_calls(
+    examples_client: BomClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seen: list[float | None] = []
+    fetch = examples_client.fetch_product
+
+    def probe(path: str) -> Product:
+        seen.append(time_left())
+        return fetch(path)
+
+    monkeypatch.setattr(examples_client, "fetch_product", probe)
+    await async_tools.observations(["Sydney", "Perth", "Hobart"], client=examples_client)
+    # Including the calls made from the per-product worker threads
+    assert len(seen) == len({"IDN60920", "IDW60920", "IDT60920"})
+    assert all(left is not None and 0 < left <= TOOL_DEADLINE_SECS for left in seen)
+
+
+@pytest.mark.asyncio
+async def test_one_deadline_per_mcp_call(
+    examples_client: BomClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_bom_weather import fast_mcp_server  # noqa: PLC0415
+
+    monkeypatch.setattr(weather_tools, "default_client", lambda: examples_client)
+    monkeypatch.setattr(fast_mcp_server, "_client", lambda: examples_client)
+    budgets: list[float] = []
+    attempt = async_tools._attempt
+
+    def recording(
+        at: float, fn: Callable[..., object], /, *args: object, **kwargs: object
+    ) -> object:
+        budgets.append(at)
+        return attempt(at, fn, *args, **kwargs)
+
+    monkeypatch.setattr(async_tools, "_attempt", recording)
+    fast_mcp_server.mcp.responses.clear()
+    await fast_mcp_server.mcp.call_tool("current_weather", {"city": "Sydney"})
+    # The version check and the tool draw on the same budget
+    assert len(budgets) == len(("versions", "tool"))
+    assert len(set(budgets)) == 1
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.tools.weather_tools import enable_history, station_history, station_trend
+from mcp_bom_weather.util.cache import ProductCache
+from mcp_bom_weather.util.ftp import RemoteStat
+from mcp_bom_weather.util.history import HistoryStore
+
+VARS = ("air_temperature", "rel-humidity")
+HOUR = 3600
+HOURS = 10
+T0 = 1_755_000_000
+OBSERVED = dt.datetime(2025, 8, 17, 11, 30, tzinfo=dt.UTC).timestamp()
+SYDNEY_TEMP = 11.5
+COOLER = 9.0
+SYDNEY_OBS = '<element units="Celsius" type="air_temperature">11.5</element>'
+SYDNEY_TIME = 'time-utc="2025-08-17T11:30:00+00:00"'
+
+
+@pytest.fixture()
+def start_time() -> float:
+    return OBSERVED
+
+
+class VersionFtp:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def fetch_text_if_changed(
+        self, path: str, known: RemoteStat | None, *, stream: object = None
+    ) -> tuple[RemoteStat | None, str | None]:
+        return None, self.text
+
+
+def test_window_bisects_mapped_records(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path, VARS)
+    for i in range(HOURS):
+        assert store.append("94768", T0 + i * HOUR, [float(i), None])
+    assert not store.append("94768", T0, [0.0, 0.0])  # not newer than the last record
+
+    rows = store.window("94768", T0 + 2 * HOUR, T0 + 4 * HOUR)
+    assert [r[1] for r in rows] == [2.0, 3.0, 4.0]
+    assert store.window("94768", T0 - HOUR, T0 - 1) == []
+    assert store.window("unknown", T0, T0 + HOUR) == []
+
+    # A second store over the same directory reads the same files
+    again = HistoryStore(tmp_path, VARS)
+    assert len(again.window("94768", T0, T0 + HOURS * HOUR)) == HOURS
+    assert not again.append("94768", T0 + 9 * HOUR, [1.0, 1.0])
+
+
+def test_layout_mismatch_and_torn_write(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path, VARS)
+    store.append("94768", T0, [1.0, 2.0])
+    with pytest.raises(ValueError):
+        HistoryStore(tmp_path, ("air_temperature",))
+    with (tmp_path / "94768.bin").open("ab") as f:
+        f.write(b"\0\0\0")
+    reopened = HistoryStore(tmp_path, VARS)
+    assert reopened.append("94768", T0 + HOUR, [3.0, 4.0])
+    assert [r[1] for r in reopened.window("94768", T0, T0 + HOUR)] == [1.0, 3.0]
+
+
+def test_compaction_keeps_retention_window(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path, VARS, retention=2 * HOUR)
+    for i in range(HOURS):
+        store.append("94768", T0 + i * HOUR, [float(i), None])
+    rows = store.window("94768", 0, T0 + HOURS * HOUR)
+    # Nothing older than two retention periods before the newest record survives
+    assert rows[0][0] >= rows[-1][0] - 2 * store.retention
+    assert rows[0][0] > T0
+    assert rows[-1][1] == HOURS - 1
+
+
+def test_new_product_versions_feed_trend(
+    tmp_path: Path,
+    examples_dir: Path,
+    clock: Callable[[], float],
+    advance: Callable[[float], None],
+) -> None:
+    text = (examples_dir / "IDN60920.xml").read_text(encoding="utf-8")
+    advance(HOUR)
+    client = BomClient(cache=ProductCache(clock=clock))
+    ftp = VersionFtp(text)
+    client.ftp = ftp  # type: ignore[assignment]
+    enable_history(tmp_path, client=client)
+
+    path = client.city_path("Sydney")
+    client.refresh(path)
+    later = SYDNEY_TIME.replace("11:30", "12:00")
+    ftp.text = text.replace(SYDNEY_TIME, later, 1).replace(
+        SYDNEY_OBS, SYDNEY_OBS.replace("11.5", "9.0")
+    )
+    advance(HOUR)
+    client.refresh(path)
+
+    hist = station_history("Sydney", hours=3, variables=["air_temperature"], client=client)
+    assert hist["key"] == "94768"
+    assert hist["values"]["air_temperature"] == [SYDNEY_TEMP, COOLER]
+    trend = station_trend("Sydney", hours=3, client=client)["stats"]["air_temperature"]
+    assert trend["change"] == COOLER - SYDNEY_TEMP
+    assert trend["max"] == SYDNEY_TEMP
+
+
+def test_only_observation_products_recorded(
+    tmp_path: Path, examples_dir: Path, clock: Callable[[], float]
+) -> None:
+    text = (examples_dir / "IDN11050.xml").read_text(encoding="utf-8")
+    client = BomClient(cache=ProductCache(clock=clock))
+    client.ftp = VersionFtp(text)  # type: ignore[assignment]
+    enable_history(tmp_path, client=client)
+    forecast = client.refresh(client.forecast_path("Sydney"))
+    assert client.indexes.peek(forecast) is None  # not parsed for history
+
+
+def test_history_tools_need_a_store(examples_client: BomClient) -> None:
+    with pytest.raises(RuntimeError):
+        station_trend("Sydney", client=examples_client)
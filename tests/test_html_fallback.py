@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.adapters.bom_adapter import (
+    _COND_WORDS,
+    _MIN_OR_MAX_RE,
+    _extract_condition,
+    _extract_temp_c,
+    parse_forecast_from_html,
+    parse_warnings_from_html,
+)
+
+DAYS = 4
+SAMPLES = [
+    "<title>  Sydney\n forecast </title><p>Partly cloudy, then clear later</p>",
+    "Current conditions: 18.5 °C partly CLOUDY",
+    "<p>Overcast with showers</p> Min 9°C then Max 17°C Rain easing",
+    "Minimum: 3°C Maximum 12°C Min 4 C Max: 13°C Maximum 14°C",
+    "<meta name='description' content='Fog patches early'>",
+    "<h2>Severe Weather warning</h2><h3>Flood Warning for the Hawkesbury</h3>",
+    "No   warnings current",
+    "thunderstorms windy rainfall 12C",
+    "",
+]
+
+
+def _old_condition(html: str) -> str | None:
+    for word in _COND_WORDS:
+        if re.search(rf"\b{re.escape(word)}\b", html, re.I):
+            return word
+    title = re.search(r"<title>(.*?)</title>", html, re.I | re.S)
+    if title:
+        t = re.sub(r"\s+", " ", title.group(1)).strip()
+        if t:
+            return t[:64]
+    meta = re.search(
+        r"<meta[^>]+name=['\"]description['\"][^>]+content=['\"]([^'\"]+)['\"]", html, re.I
+    )
+    return meta.group(1)[:64] if meta else None
+
+
+def _old_min_max(html: str) -> tuple[list[float], list[float]]:
+    mins = [
+        float(x) for x in re.findall(r"(?:Min(?:imum)?:?)\s*(-?\d+(?:\.\d+)?)\s*°?C", html, re.I)
+    ]
+    maxs = [
+        float(x) for x in re.findall(r"(?:Max(?:imum)?:?)\s*(-?\d+(?:\.\d+)?)\s*°?C", html, re.I)
+    ]
+    return mins, maxs
+
+
+def _documents(examples_dir: Path) -> list[str]:
+    fixtures = [p.read_text(encoding="utf-8", errors="replace") for p in examples_dir.glob("*.xml")]
+    return SAMPLES + fixtures
+
+
+def test_condition_matches_word_by_word_search(examples_dir: Path) -> None:
+    for doc in _documents(examples_dir):
+        assert _extract_condition(doc) == _old_condition(doc)
+
+
+def test_min_max_labels_single_pass(examples_dir: Path) -> None:
+    for doc in _documents(examples_dir):
+        mins: list[float] = []
+        maxs: list[float] = []
+        for m in _MIN_OR_MAX_RE.finditer(doc):
+            (mins if m.group(1) else maxs).append(float(m.group(2)))
+        assert (mins, maxs) == _old_min_max(doc)
+
+
+def test_forecast_from_separate_labels() -> None:
+    fc = parse_forecast_from_html("Sydney", HTTPStatus.OK, SAMPLES[3], days=DAYS)
+    assert [(d["min_c"], d["max_c"]) for d in fc["days"][:2]] == [(3.0, 12.0), (4.0, 13.0)]
+
+
+@pytest.mark.parametrize(
+    ("html", "temp"),
+    [("Current temp 21.5°C, yesterday 30°C", 21.5), ("max 7 C", 7.0), ("none", None)],
+)
+def test_temperature(html: str, temp: float | None) -> None:
+    assert _extract_temp_c(html) == temp
+
+
+def test_warnings_headings_and_count() -> None:
+    res = parse_warnings_from_html(HTTPStatus.OK, SAMPLES[5])
+    assert [i["title"] for i in res["items"]] == [
+        "Severe Weather warning",
+        "Flood Warning for the Hawkesbury",
+    ]
+    assert parse_warnings_from_html(HTTPStatus.OK, SAMPLES[6])["count"] == 0
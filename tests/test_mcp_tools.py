@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from mcp_bom_weather import fast_mcp_server
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.tools import weather_tools
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("name", "arguments"),
+    [
+        ("current_weather", {"city": "Sydney"}),
+        ("current_weather_all_major_cities", {}),
+        ("forecast", {"city": "Sydney", "days": 3}),
+    ],
+)
+async def test_results_pass_output_validation(
+    name: str,
+    arguments: dict[str, object],
+    examples_client: BomClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(weather_tools, "default_client", lambda: examples_client)
+    monkeypatch.setattr(fast_mcp_server, "_client", lambda: examples_client, raising=False)
+    # FastMCP checks the result against the tool's output model and fails the call
+    # (ToolError) when a key it expects is missing
+    content, structured = await fast_mcp_server.mcp.call_tool(name, arguments)
+    assert content
+    assert structured
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from ftplib import FTP
+from typing import Any
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.tools import weather_tools
+from mcp_bom_weather.util.ftp import FtpClient, FtpPool
+from mcp_bom_weather.util.metrics import METRICS, STAGE_SECONDS, Metrics
+
+SLOW = 0.3
+TWICE = 2
+
+
+def _stages(snapshot: dict[str, Any]) -> dict[str, int]:
+    return {s["labels"]["stage"]: s["count"] for s in snapshot["histograms"].get(STAGE_SECONDS, [])}
+
+
+def _counter(snapshot: dict[str, Any], name: str) -> float:
+    return sum(c["value"] for c in snapshot["counters"].get(name, []))
+
+
+@pytest.fixture(autouse=True)
+def _reset() -> None:
+    METRICS.reset()
+
+
+def test_prometheus_text() -> None:
+    m = Metrics(buckets=(0.1, 1.0))
+    m.observe("lat_seconds", 0.05, stage='a"b')
+    m.observe("lat_seconds", SLOW, stage='a"b')
+    m.inc("bytes_total", 10)
+    m.collect("cache", lambda: {"hits": 3})
+    lines = m.render().splitlines()
+    assert "# TYPE lat_seconds histogram" in lines
+    assert 'lat_seconds_bucket{stage="a\\"b",le="0.1"} 1' in lines
+    assert 'lat_seconds_bucket{stage="a\\"b",le="1"} 2' in lines
+    assert 'lat_seconds_bucket{stage="a\\"b",le="+Inf"} 2' in lines
+    assert 'lat_seconds_count{stage="a\\"b"} 2' in lines
+    assert "bytes_total 10" in lines
+    assert "cache_hits 3" in lines
+
+
+def test_ftp_stages_and_bytes(ftp_factory: Callable[[], FTP]) -> None:
+    pool = FtpPool("ftp.example", factory=ftp_factory)
+    client = FtpClient("ftp.example", pool=pool)
+    client.fetch_text_if_changed("/p/IDN60920.xml", None)
+    client.fetch_text("/p/IDN60920.xml")
+    snap = METRICS.snapshot()
+    stages = _stages(snap)
+    assert stages["ftp_retr"] == TWICE
+    assert stages["ftp_stat"] == 1
+    assert _counter(snap, "bom_ftp_bytes_total") == TWICE * len(b"<product/>")
+
+
+def test_ftp_retries_are_counted(
+    ftp_factory: Callable[[], FTP], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+
+    def flaky(ftp: FTP) -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            raise EOFError
+        return "ok"
+
+    monkeypatch.setattr("mcp_bom_weather.util.ftp.time.sleep", lambda s: None)
+    pool = FtpPool("ftp.example", factory=ftp_factory)
+    assert FtpClient("ftp.example", pool=pool)._with_retries(lambda: pool.run(flaky)) == "ok"
+    snap = METRICS.snapshot()
+    assert _counter(snap, "bom_ftp_retries_total") == 1
+    assert snap["counters"]["bom_ftp_errors_total"][0]["labels"] == {"error": "EOFError"}
+
+
+@pytest.mark.asyncio
+async def test_server_splits_tool_and_serialization(
+    examples_client: BomClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_bom_weather import fast_mcp_server  # noqa: PLC0415
+
+    monkeypatch.setattr(weather_tools, "default_client", lambda: examples_client)
+    monkeypatch.setattr(fast_mcp_server, "_client", lambda: examples_client)
+    await fast_mcp_server.mcp.call_tool("current_weather", {"city": "Sydney"})
+
+    stages = _stages(METRICS.snapshot())
+    assert {"tool", "serialize", "parse"} <= set(stages)
+    contents = await fast_mcp_server.mcp.read_resource("bom://status/metrics")
+    resource = json.loads(next(iter(contents)).content)
+    assert "bom_cache_hit_ratio" in resource["gauges"]
+    response = await fast_mcp_server.metrics_endpoint(None)  # type: ignore[arg-type]
+    assert b'stage="serialize"' in response.body
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.adapters.product_index import ProductIndex, StationObs
+from mcp_bom_weather.adapters.station_grid import StationGrid, haversine_km
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.config import CITY_PRODUCT_IDS, NEAREST_MAX_K
+from mcp_bom_weather.tools.weather_tools import nearest_stations
+
+K = 5
+QUERIES = 200
+
+
+@pytest.fixture(scope="module")
+def stations(examples_dir: Path) -> list[StationObs]:
+    out: list[StationObs] = []
+    for product_id in CITY_PRODUCT_IDS.values():
+        text = (examples_dir / f"{product_id}.xml").read_text(encoding="utf-8")
+        out.extend(ProductIndex(text).stations)
+    return out
+
+
+def test_grid_matches_brute_force(stations: list[StationObs]) -> None:
+    grid = StationGrid(stations)
+    rng = random.Random(12)
+    for _ in range(QUERIES):
+        lat, lon = rng.uniform(-45.0, -9.0), rng.uniform(110.0, 155.0)
+        expected = sorted(haversine_km(lat, lon, s.lat, s.lon) for s in stations)[:K]
+        got = [d for d, _ in grid.nearest(lat, lon, K)]
+        assert got == pytest.approx(expected)
+
+
+def test_nearest_to_sydney_cbd(examples_client: BomClient) -> None:
+    out = nearest_stations(-33.87, 151.21, K, ["air_temperature"], client=examples_client)
+    assert len(out["stations"]) == K
+    first = out["stations"][0]
+    assert first["station"] == "Sydney - Observatory Hill"
+    assert first["product"] == "IDN60920"
+    assert "air_temperature" in first["values"]
+    distances = [s["distance_km"] for s in out["stations"]]
+    assert distances == sorted(distances)
+
+
+def test_grid_built_once_per_index(examples_dir: Path) -> None:
+    index = ProductIndex((examples_dir / "IDT60920.xml").read_text(encoding="utf-8"))
+    assert index.grid is index.grid
+
+
+@pytest.mark.parametrize(("lat", "lon", "k"), [(-91.0, 150.0, K), (-33.0, 181.0, K), (0, 0, 0)])
+def test_invalid_arguments(lat: float, lon: float, k: int) -> None:
+    with pytest.raises(ValueError):
+        nearest_stations(lat, lon, k)
+
+
+def test_k_is_capped() -> None:
+    with pytest.raises(ValueError):
+        nearest_stations(-33.0, 151.0, NEAREST_MAX_K + 1)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.config import SUPPORTED_CITIES
+from mcp_bom_weather.tools.weather_tools import observations
+
+VARIABLES = ["air_temperature", "rel-humidity", "wind_dir", "vis_km"]
+SYDNEY_TEMP = 11.5
+SYDNEY_HUMIDITY = 50.0
+
+
+def test_columns_for_cities_and_stations(examples_client: BomClient, fetched: Counter[str]) -> None:
+    locations = ["Sydney", "066037", "Sydney Airport", "Hobart"]
+    table = observations(locations, VARIABLES, client=examples_client)
+
+    assert table["location"] == locations
+    assert table["product"] == ["IDN60920", "IDN60920", "IDN60920", "IDT60920"]
+    assert table["station"][0] == "Sydney - Observatory Hill"
+    assert table["wmo_id"][1] == table["wmo_id"][2]  # bom-id and description of one station
+    assert table["values"]["air_temperature"][0] == SYDNEY_TEMP
+    assert table["values"]["rel-humidity"][0] == SYDNEY_HUMIDITY
+    assert table["values"]["wind_dir"][0] == "W"
+    assert all(len(col) == len(locations) for col in table["values"].values())
+    # Catalogued stations are looked up in their own product only, each fetched once
+    assert fetched == {"IDN60920": 1, "IDT60920": 1}
+    assert "errors" not in table
+
+
+def test_uncatalogued_station_searched_in_every_state(
+    examples_client: BomClient, fetched: Counter[str]
+) -> None:
+    observations(["Sydney", "Atlantis"], VARIABLES, client=examples_client)
+    assert set(fetched.values()) == {1}
+    assert len(fetched) == len(SUPPORTED_CITIES)
+
+
+def test_city_only_request_fetches_only_its_products(
+    examples_client: BomClient, fetched: Counter[str]
+) -> None:
+    table = observations(["Perth", "Perth", "Darwin"], client=examples_client)
+    assert fetched == {"IDW60920": 1, "IDD60920": 1}
+    assert "air_temperature" in table["variables"]
+
+
+def test_unknown_station_reported_in_errors(examples_client: BomClient) -> None:
+    table = observations(["Atlantis"], ["air_temperature"], client=examples_client)
+    assert table["values"]["air_temperature"] == [None]
+    assert table["station"] == [None]
+    assert "Atlantis" in table["errors"]
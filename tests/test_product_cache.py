@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.util.cache import ProductCache, amoc_expiry
+from mcp_bom_weather.util.ftp import FtpClient, RemoteStat
+
+TTL = 300.0
+ISSUED = dt.datetime(2025, 8, 17, 11, 31, tzinfo=dt.UTC).timestamp()
+
+
+@pytest.fixture()
+def start_time() -> float:
+    return ISSUED
+
+
+@pytest.fixture()
+def client(clock: Callable[[], float], examples_ftp: FtpClient) -> BomClient:
+    client = BomClient(cache=ProductCache(ttl=TTL, clock=clock))
+    client.ftp = examples_ftp
+    return client
+
+
+def test_amoc_expiry_uses_next_routine_issue(examples_dir: Path) -> None:
+    text = (examples_dir / "IDN11050.xml").read_text(encoding="utf-8")
+    expected = dt.datetime(2025, 8, 17, 18, 45, tzinfo=dt.UTC).timestamp()
+    assert amoc_expiry(text) == expected
+    # Observation products carry no expiry metadata
+    assert amoc_expiry((examples_dir / "IDN60920.xml").read_text(encoding="utf-8")) is None
+
+
+def test_client_serves_from_cache_until_due(
+    client: BomClient,
+    advance: Callable[[float], None],
+    listed: dict[str, RemoteStat],
+    ftp_calls: Counter[str],
+) -> None:
+    for _ in range(3):
+        client.fetch_city_xml("Sydney")
+    assert ftp_calls["retr"] == 1
+    advance(TTL + 1)
+    listed["IDN60920.xml"] = RemoteStat("20250817120324", 524511)  # reissued
+    client.fetch_city_xml("Sydney")
+    assert ftp_calls["retr"] == 1 + 1
+    assert client.cache.stats()["hits"] == 1 + 1
+    assert client.cache.stats()["misses"] == 1
+    assert client.cache.stats()["stale"] == 1
+
+
+def test_unchanged_file_is_revalidated_not_downloaded(
+    client: BomClient, advance: Callable[[float], None], ftp_calls: Counter[str]
+) -> None:
+    _, first = client.fetch_city_xml("Sydney")
+    advance(TTL + 1)
+    _, again = client.fetch_city_xml("Sydney")
+    assert again == first
+    assert ftp_calls["retr"] == 1
+    assert client.cache.stats()["revalidated"] == 1
+    # Revalidation restarts freshness, so the next call is a plain hit
+    client.fetch_city_xml("Sydney")
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_size_bounded_eviction() -> None:
+    cache = ProductCache(max_bytes=10)
+    cache.put("/a.xml", "123456")
+    cache.put("/b.xml", "123456")
+    assert cache.get("/a.xml") is None
+    assert cache.get("/b.xml") is not None
+    assert cache.stats()["evictions"] == 1
+    # The cap is in bytes: six characters, twelve bytes in UTF-8
+    cache.put("/c.xml", "°" * 6)
+    assert cache.get("/c.xml") is None
+    assert cache.get("/b.xml") is not None
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.adapters.bom_adapter import parse_forecast_from_xml
+from mcp_bom_weather.adapters.product_index import ProductIndex, ProductIndexes
+from mcp_bom_weather.util.cache import Product
+from mcp_bom_weather.util.ftp import RemoteStat
+
+DAYS = 5
+SYDNEY_TEMP = 11.5
+
+
+@pytest.fixture(scope="module")
+def sydney_obs(examples_dir: Path) -> str:
+    return (examples_dir / "IDN60920.xml").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def nsw_forecast(examples_dir: Path) -> str:
+    return (examples_dir / "IDN11050.xml").read_text(encoding="utf-8")
+
+
+def test_stations_indexed_by_every_key(sydney_obs: str) -> None:
+    index = ProductIndex(sydney_obs)
+    # The example is cut off mid-document; every station that closed is still indexed
+    assert not index.complete
+    assert len(index.stations) == sydney_obs.count("</station>")
+    stn = index.by_wmo["94768"]
+    assert index.by_bom["066214"] is stn
+    assert index.by_description["sydney - observatory hill"] is stn
+    assert stn in index.by_district["NSW_PW005"]
+    assert stn.air_temp == SYDNEY_TEMP
+    assert index.current("Sydney")["temp_c"] == SYDNEY_TEMP
+
+
+def test_forecast_matches_tree_parser(nsw_forecast: str) -> None:
+    index = ProductIndex(nsw_forecast)
+    assert index.complete
+    assert index.areas_by_aac["NSW_ME001"].description == "Sydney"
+    fc = index.forecast("Sydney", DAYS)
+    tree = parse_forecast_from_xml("Sydney", HTTPStatus.OK, nsw_forecast, days=DAYS)
+    assert fc is not None
+    assert fc["days"] == tree["days"]
+
+
+def test_unparseable_product_yields_empty_index() -> None:
+    index = ProductIndex("\0" * 64)
+    assert not index
+    assert index.current("Sydney") is None
+    assert index.forecast("Sydney") is None
+
+
+def test_index_reused_until_version_changes(sydney_obs: str) -> None:
+    indexes = ProductIndexes()
+    stat = RemoteStat("20250817113324", len(sydney_obs))
+    first = Product("/p/IDN60920.xml", sydney_obs, 1.0, 2.0, stat)
+    index = indexes.get(first)
+    # Revalidation keeps MDTM/SIZE, so the refreshed copy reuses the index
+    revalidated = Product(first.path, sydney_obs, 3.0, 4.0, stat)
+    assert indexes.get(revalidated) is index
+
+    changed = Product(first.path, sydney_obs, 5.0, 6.0, RemoteStat("20250817120000", None))
+    newer = indexes.get(changed)
+    assert newer is not index
+    assert indexes.get(changed) is newer
+    # Indexing an older download afterwards leaves the newer index in place
+    indexes.get(first)
+    assert indexes.get(changed) is newer
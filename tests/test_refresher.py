@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections import Counter
+from collections.abc import Callable
+from typing import NoReturn
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.clients.refresher import WARNINGS_JOB, Refresher
+from mcp_bom_weather.config import (
+    CITY_FORECAST_PRODUCT_IDS,
+    CITY_PRODUCT_IDS,
+    REFRESH_GRACE_SECS,
+    REFRESH_RETRY_SECS,
+    SUPPORTED_CITIES,
+)
+from mcp_bom_weather.tools.weather_tools import current_weather
+from mcp_bom_weather.util.cache import ProductCache
+from mcp_bom_weather.util.ftp import FtpClient
+
+TTL = 300.0
+ISSUED = dt.datetime(2025, 8, 17, 11, 31, tzinfo=dt.UTC).timestamp()
+
+
+@pytest.fixture()
+def start_time() -> float:
+    return ISSUED
+
+
+@pytest.fixture()
+def refresher(clock: Callable[[], float], examples_ftp: FtpClient) -> Refresher:
+    client = BomClient(cache=ProductCache(ttl=TTL, clock=clock))
+    client.ftp = examples_ftp
+    return Refresher(client, clock=clock)
+
+
+def test_refresher_schedules_from_product_expiry(refresher: Refresher) -> None:
+    forecasts = [p for p in CITY_FORECAST_PRODUCT_IDS.values() if p]
+    assert refresher.run_due() == len(SUPPORTED_CITIES) + len(forecasts) + 1
+    sydney = refresher.jobs[str(CITY_PRODUCT_IDS["Sydney"])]
+    # Observation products carry no next-routine-issue time, so the TTL drives the schedule
+    assert sydney.next_due == ISSUED + TTL + REFRESH_GRACE_SECS
+    assert sydney.last_refresh == ISSUED
+    # Forecasts are refreshed too (served stale otherwise), after their next routine issue
+    forecast = refresher.jobs[str(CITY_FORECAST_PRODUCT_IDS["Sydney"])]
+    next_issue = dt.datetime(2025, 8, 17, 18, 45, tzinfo=dt.UTC).timestamp()
+    assert forecast.last_refresh == ISSUED
+    assert forecast.next_due == next_issue + REFRESH_GRACE_SECS
+    assert refresher.jobs[WARNINGS_JOB].failures == 0
+    assert refresher.run_due() == 0
+
+
+def test_stale_copy_served_while_bom_is_down(
+    refresher: Refresher,
+    clock: Callable[[], float],
+    advance: Callable[[float], None],
+    ftp_calls: Counter[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    refresher.run_due()
+    refresher.client.serve_stale = True
+
+    def unreachable(*args: object, **kwargs: object) -> NoReturn:
+        raise EOFError("BoM unreachable")
+
+    for op in ("fetch_text_if_changed", "list_stats"):
+        monkeypatch.setattr(refresher.client.ftp, op, unreachable)
+    advance(TTL + REFRESH_GRACE_SECS)
+    refresher.run_due()
+    sydney = refresher.jobs[str(CITY_PRODUCT_IDS["Sydney"])]
+    assert sydney.failures == 1
+    assert sydney.next_due == clock() + REFRESH_RETRY_SECS
+    assert "EOFError" in str(sydney.last_error)
+
+    monkeypatch.undo()
+    calls = ftp_calls.total()
+    cw = current_weather("Sydney", client=refresher.client)
+    assert ftp_calls.total() == calls  # answered without touching FTP
+    assert cw["stale_age_secs"] == int(TTL + REFRESH_GRACE_SECS)
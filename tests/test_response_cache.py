@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from collections.abc import Callable
+
+import pytest
+
+from mcp_bom_weather.adapters import bom_adapter, product_index
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.tools import weather_tools
+from mcp_bom_weather.tools.weather_tools import response_versions
+from mcp_bom_weather.util.cache import ProductCache
+from mcp_bom_weather.util.ftp import FtpClient, RemoteStat
+from mcp_bom_weather.util.metrics import METRICS, STAGE_SECONDS
+
+TTL = 300.0
+ISSUES = 2
+STAMP = "2025-08-17T11:40:00Z"
+LATER = "2025-08-17T11:45:00Z"
+
+
+@pytest.fixture()
+def client(clock: Callable[[], float], examples_ftp: FtpClient) -> BomClient:
+    client = BomClient(cache=ProductCache(ttl=TTL, clock=clock))
+    client.ftp = examples_ftp
+    return client
+
+
+def _parses() -> int:
+    series = METRICS.snapshot()["histograms"].get(STAGE_SECONDS, [])
+    return sum(s["count"] for s in series if s["labels"]["stage"] == "parse")
+
+
+def test_versions_only_for_product_tools(
+    client: BomClient, advance: Callable[[float], None]
+) -> None:
+    versions = response_versions("forecast", {"city": "Sydney"}, client=client)
+    assert versions == (RemoteStat("20250817113324", 1),)
+    assert response_versions("forecast", {"city": "Gotham"}, client=client) is None
+    assert response_versions("current_warnings", {}, client=client) is None
+    assert response_versions("station_trend", {"station": "Sydney"}, client=client) is None
+    # Past its reissue time an answer carries a growing stale_age_secs
+    assert response_versions("current_weather", {"city": "Sydney"}, client=client) == versions
+    client.serve_stale = True
+    advance(TTL)
+    assert response_versions("current_weather", {"city": "Sydney"}, client=client) is None
+
+
+@pytest.mark.asyncio
+async def test_encoded_results_reused_until_new_issue(
+    client: BomClient,
+    advance: Callable[[float], None],
+    listed: dict[str, RemoteStat],
+    ftp_calls: Counter[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from mcp_bom_weather import fast_mcp_server  # noqa: PLC0415
+
+    monkeypatch.setattr(weather_tools, "default_client", lambda: client)
+    monkeypatch.setattr(fast_mcp_server, "_client", lambda: client)
+    for module in (bom_adapter, product_index):
+        monkeypatch.setattr(module, "_iso_now", lambda: STAMP)
+    mcp = fast_mcp_server.mcp
+    mcp.responses.clear()
+    METRICS.reset()
+
+    first = await mcp.call_tool("current_weather", {"city": "Sydney"})
+    parses = _parses()
+    again = await mcp.call_tool("current_weather", {"city": "Sydney"})
+    assert again is first
+    assert _parses() == parses  # neither parsed nor serialized again
+
+    # Revalidated but unchanged: same version, still reused
+    advance(TTL)
+    assert await mcp.call_tool("current_weather", {"city": "Sydney"}) is first
+
+    # A new issue is a new version, and so a fresh answer
+    listed["IDN60920.xml"] = RemoteStat("20250817120000", 1)
+    advance(TTL)
+    assert await mcp.call_tool("current_weather", {"city": "Sydney"}) is not first
+    assert ftp_calls["retr"] == ISSUES
+
+
+@pytest.mark.asyncio
+async def test_reused_results_carry_the_time_they_are_served(
+    client: BomClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from mcp_bom_weather import fast_mcp_server  # noqa: PLC0415
+
+    monkeypatch.setattr(weather_tools, "default_client", lambda: client)
+    monkeypatch.setattr(fast_mcp_server, "_client", lambda: client)
+    now = [STAMP]
+    for module in (bom_adapter, product_index):
+        monkeypatch.setattr(module, "_iso_now", lambda: now[0])
+    mcp = fast_mcp_server.mcp
+    mcp.responses.clear()
+
+    first = await mcp.call_tool("current_weather_all_major_cities", {})
+    hits = mcp.responses.stats()["hits"]
+    now[0] = LATER
+    content, structured = await mcp.call_tool("current_weather_all_major_cities", {})
+    assert mcp.responses.stats()["hits"] == hits + 1
+    assert {cw["updated_at"] for cw in structured["result"]} == {LATER}
+    # Stamped before encoding: the text is the encoded structured result, field for field
+    assert [json.loads(block.text) for block in content] == structured["result"]
+    # The cached entry itself keeps its original stamps
+    assert {cw["updated_at"] for cw in first[1]["result"]} == {STAMP}
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import stat
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.adapters.product_index import ProductIndexes
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.util.cache import ProductCache
+from mcp_bom_weather.util.deadline import deadline
+from mcp_bom_weather.util.ftp import DeadlineExceeded, FtpClient, RemoteStat
+from mcp_bom_weather.util.shared_cache import SharedCache
+
+TTL = 300.0
+WAIT = 0.2
+PRIVATE = 0o700
+WRITABLE_BY_OTHERS = 0o022
+
+
+@pytest.fixture()
+def new_worker(
+    tmp_path: Path, clock: Callable[[], float], examples_ftp: FtpClient
+) -> Callable[[], BomClient]:
+    # One server process: its own memory cache and indexes, the node's shared directory
+    def new_worker() -> BomClient:
+        client = BomClient(cache=ProductCache(ttl=TTL, clock=clock), shared=SharedCache(tmp_path))
+        client.ftp = examples_ftp
+        return client
+
+    return new_worker
+
+
+def test_workers_share_downloads_and_indexes(
+    new_worker: Callable[[], BomClient],
+    ftp_calls: Counter[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first = new_worker()
+    second = new_worker()
+    product, index = first.fetch_city_parsed("Perth")
+    ftp_calls.clear()
+
+    def no_parse(product: object) -> None:
+        raise AssertionError("parsed again in another worker")
+
+    monkeypatch.setattr(ProductIndexes, "_parse", staticmethod(no_parse))
+    shared, shared_index = second.fetch_city_parsed("Perth")
+    assert ftp_calls["stat"] == 0
+    assert shared.text == product.text
+    assert shared.version == product.version
+    assert len(shared_index.stations) == len(index.stations)
+    assert shared_index.current("Perth") == index.current("Perth")
+
+
+def test_stale_product_refreshed_by_one_worker(
+    new_worker: Callable[[], BomClient],
+    advance: Callable[[float], None],
+    listed: dict[str, RemoteStat],
+    ftp_calls: Counter[str],
+) -> None:
+    workers = [new_worker() for _ in range(3)]
+    for worker in workers:
+        worker.fetch_city_product("Darwin")
+    assert ftp_calls["retr"] == 1
+
+    # A new issue: the first worker to notice downloads it, the rest take its copy
+    advance(TTL)
+    listed["IDD60920.xml"] = reissued = RemoteStat("20250817120000", 1)
+    versions = {worker.fetch_city_product("Darwin").version for worker in workers}
+    assert versions == {reissued}
+    assert ftp_calls["stat"] == 1 + 1
+    assert ftp_calls["retr"] == 1 + 1
+
+
+def test_slot_replaced_atomically(
+    tmp_path: Path,
+    new_worker: Callable[[], BomClient],
+    advance: Callable[[float], None],
+) -> None:
+    writer = new_worker()
+    reader = SharedCache(tmp_path)
+    old = writer.fetch_city_product("Hobart")
+    path = old.path
+    loaded = reader.load(path)
+    assert loaded is not None
+    assert loaded[0] == old
+    assert reader.load(path) is not None
+    assert reader.load(path)[0] is loaded[0]  # type: ignore[index]  # unchanged: not re-read
+
+    advance(TTL)
+    new = writer.refresh(path)
+    assert new.fetched_at > old.fetched_at
+    assert reader.load(path)[0] == new  # type: ignore[index]
+    assert not list(tmp_path.glob(".tmp-*"))
+    assert reader.load("/anon/gen/fwo/IDX00000.xml") is None
+
+
+def test_stale_copy_served_while_another_worker_refreshes(
+    tmp_path: Path,
+    new_worker: Callable[[], BomClient],
+    advance: Callable[[float], None],
+    ftp_calls: Counter[str],
+) -> None:
+    worker = new_worker()
+    old = worker.fetch_city_product("Darwin")
+    advance(TTL)
+    # Another process holds the refresh lock for longer than this call may wait
+    with SharedCache(tmp_path).lock(old.path), deadline(time.monotonic() + WAIT):
+        start = time.monotonic()
+        assert worker.fetch_city_product("Darwin") is old
+        assert time.monotonic() - start < WAIT + 1.0
+    assert ftp_calls["stat"] == 1
+    # Nothing stored to fall back to: the wait running out is an error
+    perth = worker.city_path("Perth")
+    with SharedCache(tmp_path).lock(perth), deadline(time.monotonic() + WAIT):
+        with pytest.raises(DeadlineExceeded):
+            worker.fetch_product(perth)
+
+
+def test_slots_others_could_write_are_not_loaded(
+    tmp_path: Path, new_worker: Callable[[], BomClient]
+) -> None:
+    SharedCache(tmp_path / "node")
+    assert stat.S_IMODE((tmp_path / "node").stat().st_mode) == PRIVATE
+    path = new_worker().fetch_city_product("Hobart").path
+    slot = next(tmp_path.glob("*.slot"))
+    slot.chmod(slot.stat().st_mode | WRITABLE_BY_OTHERS)
+    assert SharedCache(tmp_path).load(path) is None
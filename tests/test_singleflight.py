@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.tools import async_tools
+from mcp_bom_weather.util.ftp import FtpClient
+from mcp_bom_weather.util.singleflight import AsyncSingleFlight
+
+CALLERS = 8
+SLOW_SECS = 0.2
+
+
+def _slowly(fetch: Callable[..., object]) -> Callable[..., object]:
+    def slow(*args: object, **kwargs: object) -> object:
+        time.sleep(SLOW_SECS)
+        return fetch(*args, **kwargs)
+
+    return slow
+
+
+def test_concurrent_fetches_share_one_download(
+    examples_ftp: FtpClient, ftp_calls: Counter[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = BomClient()
+    client.ftp = examples_ftp
+    monkeypatch.setattr(
+        examples_ftp, "fetch_text_if_changed", _slowly(examples_ftp.fetch_text_if_changed)
+    )
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        texts = list(pool.map(lambda _: client.fetch_city_xml("Sydney")[1], range(CALLERS)))
+    assert ftp_calls["retr"] == 1
+    assert len(set(texts)) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_calls_share_one_offload(
+    examples_client: BomClient, fetched: Counter[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        examples_client, "fetch_city_product", _slowly(examples_client.fetch_city_product)
+    )
+    results = await asyncio.gather(
+        *(async_tools.current_weather("Perth", client=examples_client) for _ in range(CALLERS))
+    )
+    assert fetched == {"IDW60920": 1}
+    assert all(r["city"] == "Perth" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call() -> None:
+    flights: AsyncSingleFlight[str] = AsyncSingleFlight()
+    started = 0
+
+    async def work() -> str:
+        nonlocal started
+        started += 1
+        await asyncio.sleep(SLOW_SECS)
+        return "done"
+
+    first = asyncio.create_task(flights.do("k", work))
+    second = asyncio.create_task(flights.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+    assert first.cancelled()
+    assert started == 1
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.adapters.product_index import ProductIndex
+from mcp_bom_weather.adapters.station_catalogue import default_catalogue
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.config import CITY_PRODUCT_IDS, STATION_SEARCH_MAX_LIMIT
+from mcp_bom_weather.tools.weather_tools import current_weather, observations, search_stations
+
+LIMIT = 5
+
+
+def test_catalogue_lists_every_product_station(examples_dir: Path) -> None:
+    catalogue = default_catalogue()
+    for product_id in CITY_PRODUCT_IDS.values():
+        text = (examples_dir / f"{product_id}.xml").read_text(encoding="utf-8")
+        for obs in ProductIndex(text).stations:
+            assert catalogue.resolve(obs.wmo_id or "") is not None, (product_id, obs.wmo_id)
+    stn = catalogue.resolve("SYDNEY (OBSERVATORY HILL)")
+    assert stn is not None
+    assert (stn.wmo_id, stn.product, stn.state) == ("94768", "IDN60920", "NSW")
+    assert catalogue.resolve("sydney - observatory hill") is stn
+    assert catalogue.resolve("066214") is stn
+
+
+def test_prefix_matches_any_word(examples_client: BomClient, fetched: Counter[str]) -> None:
+    # search_stations never touches a product
+    found = search_stations("obs", LIMIT, client=examples_client)["matches"]
+    assert found[0]["station"] == "Sydney - Observatory Hill"
+    assert found[0]["match"] == "prefix"
+    melbourne = search_stations("melb", LIMIT, client=examples_client)["matches"]
+    assert melbourne
+    assert all(m["station"].lower().startswith("melbourne") for m in melbourne)
+    assert [m["score"] for m in melbourne] == sorted((m["score"] for m in melbourne), reverse=True)
+    assert not fetched
+
+
+@pytest.mark.parametrize(
+    ("query", "station"),
+    [("Observatry Hil", "Sydney - Observatory Hill"), ("canbera", "Canberra")],
+)
+def test_misspelt_names_found_by_trigrams(query: str, station: str) -> None:
+    top = search_stations(query)["matches"][0]
+    assert (top["station"], top["match"]) == (station, "fuzzy")
+
+
+def test_ids_and_limits() -> None:
+    top = search_stations("94768")["matches"][0]
+    assert (top["station"], top["score"], top["match"]) == ("Sydney - Observatory Hill", 1.0, "id")
+    assert len(search_stations("a", LIMIT)["matches"]) == LIMIT
+    assert search_stations("xyzzy")["matches"] == []
+    with pytest.raises(ValueError, match="limit"):
+        search_stations("Sydney", STATION_SEARCH_MAX_LIMIT + 1)
+
+
+def test_current_weather_at_any_station(examples_client: BomClient, fetched: Counter[str]) -> None:
+    airport = default_catalogue().resolve("Hobart Airport")
+    assert airport is not None
+    cw = current_weather("Hobart Airport", client=examples_client)
+    by_id = current_weather(str(airport.wmo_id), client=examples_client)
+    table = observations(["Hobart Airport"], ["air_temperature"], client=examples_client)
+    assert cw["city"] == by_id["city"] == "Hobart Airport"
+    assert cw["temp_c"] == by_id["temp_c"] == table["values"]["air_temperature"][0]
+    # Resolved from the catalogue: only the station's own product is downloaded
+    assert set(fetched) == {"IDT60920"}
+
+
+def test_unknown_station_suggests_matches(examples_client: BomClient) -> None:
+    with pytest.raises(ValueError, match="Did you mean: .*Hobart Airport"):
+        current_weather("Hobrt Airport", client=examples_client)
+
+
+def test_product_path_requires_an_id(examples_client: BomClient) -> None:
+    assert examples_client.product_path("IDT60920").endswith("/IDT60920.xml")
+    with pytest.raises(ValueError, match="product ID"):
+        examples_client.product_path("")
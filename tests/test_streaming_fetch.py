@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_bom_weather.adapters.product_index import ProductIndex, ProductIndexes
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.util.ftp import FtpClient, FtpPool
+
+BLOCK = 8192
+PATH = "/anon/gen/fwo/IDN60920.xml"
+
+
+class ChunkedFTP:
+    """Delivers a file in small RETR blocks; optionally drops the first transfer part way."""
+
+    drops = 0
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def sendcmd(self, cmd: str) -> str:
+        return "213 20250817113324"
+
+    def voidcmd(self, cmd: str) -> str:
+        return "200 OK"
+
+    def size(self, path: str) -> int:
+        return len(self.data)
+
+    def retrbinary(self, cmd: str, callback: Any) -> str:  # noqa: ANN401
+        for offset in range(0, len(self.data), BLOCK):
+            if ChunkedFTP.drops and offset > len(self.data) // 2:
+                ChunkedFTP.drops -= 1
+                raise EOFError("connection dropped mid-transfer")
+            callback(self.data[offset : offset + BLOCK])
+        return "226 Transfer complete"
+
+    def close(self) -> None:
+        pass
+
+
+class Sink:
+    def __init__(self) -> None:
+        self.blocks: list[str] = []
+        self.closed = False
+
+    def feed(self, chunk: str) -> None:
+        self.blocks.append(chunk)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture()
+def text(examples_dir: Path) -> str:
+    # A multi-byte character straddling a block boundary must survive the split decode
+    raw = (examples_dir / "IDN60920.xml").read_text(encoding="utf-8")
+    return raw[: BLOCK - 1] + "°" + raw[BLOCK - 1 :]
+
+
+def _client(data: bytes) -> BomClient:
+    pool = FtpPool("ftp.example", factory=lambda: ChunkedFTP(data))  # type: ignore[arg-type,return-value]
+    client = BomClient()
+    client.ftp = FtpClient("ftp.example", pool=pool)
+    return client
+
+
+def test_blocks_are_streamed_and_decoded(text: str) -> None:
+    pool = FtpPool("ftp.example", factory=lambda: ChunkedFTP(text.encode()))  # type: ignore[arg-type,return-value]
+    sink = Sink()
+    assert FtpClient("ftp.example", pool=pool).fetch_text(PATH, stream=lambda: sink) == text
+    assert len(sink.blocks) > 1
+    assert "".join(sink.blocks) == text
+    assert sink.closed
+
+
+def test_fetch_parsed_uses_the_index_built_during_download(
+    text: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_parse(product: object) -> ProductIndex:
+        raise AssertionError("parsed again after the download")
+
+    monkeypatch.setattr(ProductIndexes, "_parse", staticmethod(no_parse))
+    product, index = _client(text.encode()).fetch_parsed(PATH)
+    assert product.text == text
+    assert index.version == product.version
+    expected = ProductIndex(text)
+    assert [s.wmo_id for s in index.stations] == [s.wmo_id for s in expected.stations]
+    assert index.complete == expected.complete
+
+
+def test_retried_download_starts_a_fresh_index(text: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("mcp_bom_weather.util.ftp.time.sleep", lambda s: None)
+    monkeypatch.setattr(ChunkedFTP, "drops", 1)
+    _, index = _client(text.encode()).fetch_parsed(PATH)
+    assert ChunkedFTP.drops == 0
+    expected = ProductIndex(text)
+    assert len(index.stations) == len(expected.stations)
+    assert len(index.by_wmo) == len(expected.by_wmo)
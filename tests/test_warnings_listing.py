@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from mcp_bom_weather.clients.bom_client import BomClient
+from mcp_bom_weather.config import FTP_FWO_PATH, WARNINGS_LISTING_TTL_SECS
+from mcp_bom_weather.tools.weather_tools import current_warnings
+from mcp_bom_weather.util.cache import ProductCache
+from mcp_bom_weather.util.ftp import RemoteStat
+
+NSW = "IDN21033_warn.xml"
+VIC = "IDV21037_warn.xml"
+VIC_OLDER = "IDV21000_warn.xml"
+RESCANNED = 2
+WARNING_XML = "<warnings><warning>{}</warning></warnings>"
+
+
+class ListingFtp:
+    def __init__(self) -> None:
+        self.files = {
+            NSW: RemoteStat("20250817100000", 100),
+            VIC: RemoteStat("20250817110000", 100),
+            VIC_OLDER: RemoteStat("20250817120000", 100),
+            "IDN60920.xml": RemoteStat("20250817113324", 500),
+        }
+        self.listings = 0
+        self.downloads: list[str] = []
+
+    def list_stats(self, directory: str) -> dict[str, RemoteStat]:
+        self.listings += 1
+        return dict(self.files)
+
+    def fetch_text(self, path: str) -> str:
+        self.downloads.append(path)
+        return WARNING_XML.format(path.rsplit("/", 1)[1])
+
+
+@pytest.fixture()
+def ftp() -> ListingFtp:
+    return ListingFtp()
+
+
+@pytest.fixture()
+def client(clock: Callable[[], float], ftp: ListingFtp) -> BomClient:
+    client = BomClient(cache=ProductCache(clock=clock))
+    client.ftp = ftp  # type: ignore[assignment]
+    return client
+
+
+def test_listing_keeps_only_warnings_files(client: BomClient) -> None:
+    listing = client.warnings_listing()
+    assert set(listing.files) == {f"{FTP_FWO_PATH}/{n}" for n in (NSW, VIC, VIC_OLDER)}
+    assert listing.files[f"{FTP_FWO_PATH}/{NSW}"].stat == RemoteStat("20250817100000", 100)
+    assert listing.latest is not None and listing.latest.name == VIC
+
+
+def test_listing_cached_and_unchanged_files_not_downloaded(
+    client: BomClient, advance: Callable[[float], None], ftp: ListingFtp
+) -> None:
+    assert current_warnings(client=client)["items"] == [{"title": VIC}]
+    current_warnings(client=client)
+    assert ftp.listings == 1
+    assert ftp.downloads == [f"{FTP_FWO_PATH}/{VIC}"]
+
+    # After the TTL the directory is listed again, but the unchanged file is not fetched
+    advance(WARNINGS_LISTING_TTL_SECS)
+    current_warnings(client=client)
+    assert ftp.listings == RESCANNED
+    assert ftp.downloads == [f"{FTP_FWO_PATH}/{VIC}"]
+
+    ftp.files[VIC] = RemoteStat("20250817130000", 120)
+    advance(WARNINGS_LISTING_TTL_SECS)
+    current_warnings(client=client)
+    assert ftp.downloads == [f"{FTP_FWO_PATH}/{VIC}"] * 2
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from mcp_bom_weather.adapters.bom_adapter import _parse_current_tree, parse_current_from_xml
+from mcp_bom_weather.config import CITY_PRODUCT_IDS, SUPPORTED_CITIES
+
+
+def _read(examples_dir: Path, city: str) -> str:
+    return (examples_dir / f"{CITY_PRODUCT_IDS[city]}.xml").read_text(encoding="utf-8")
+
+
+def _well_formed(text: str) -> str:
+    # The example products are cut off mid-station; close them after the last full one
+    end = text.rindex("</station>") + len("</station>")
+    return text[:end] + "\n  </observations>\n</product>\n"
+
+
+def _without_timestamp(cw: dict) -> dict:
+    return {k: v for k, v in cw.items() if k != "updated_at"}
+
+
+@pytest.mark.parametrize("city", SUPPORTED_CITIES)
+def test_streaming_matches_tree_parser(city: str, examples_dir: Path) -> None:
+    text = _well_formed(_read(examples_dir, city))
+    streamed = parse_current_from_xml(city, HTTPStatus.OK, text)
+    tree = _parse_current_tree(city, text)
+    assert _without_timestamp(streamed) == _without_timestamp(tree)
+    assert streamed["temp_c"] is not None
+
+
+@pytest.mark.parametrize("city", SUPPORTED_CITIES)
+def test_streaming_reads_station_before_truncation(city: str, examples_dir: Path) -> None:
+    cw = parse_current_from_xml(city, HTTPStatus.OK, _read(examples_dir, city))
+    assert cw["temp_c"] is not None
+
+
+def test_forecast_products_use_tree_parser(examples_dir: Path) -> None:
+    text = (examples_dir / "IDN11050.xml").read_text(encoding="utf-8")
+    streamed = parse_current_from_xml("Sydney", HTTPStatus.OK, text)
+    assert _without_timestamp(streamed) == _without_timestamp(_parse_current_tree("Sydney", text))